@@ -92,13 +92,85 @@ with cached_client.no_cache():
     fresh = cached_client.releases.get(352665)
     _ = fresh.title  # always hits the API
 
+# Successful writes drop the cached copies they make stale: the resource,
+# its sub-resources and every page of its parent list.
+cached_client.users.get("your_username").wantlist.create(release_id=352665)  # refreshes wantlist pages
+
 # Purge all cached responses:
 cached_client.clear_cache()
 
+# Bound memory use in long-running processes: least recently used entries
+# are evicted once either limit is reached.
+from discogs_sdk._cache import MemoryCache
+
+bounded = MemoryCache(ttl=3600, max_entries=50_000, max_bytes=256 * 1024 * 1024)
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=bounded)
+print(f"hits={bounded.hits} misses={bounded.misses} evictions={bounded.evictions}")
+
+# Discogs JSON compresses well: store bodies zlib-compressed to fit a larger
+# working set in the same budget. Subclass Codec to use zstd or lz4 instead.
+from pathlib import Path
+
+from discogs_sdk._cache import SQLiteCache, ZlibCodec
+
+compressed = SQLiteCache(ttl=86400, cache_dir=Path("~/.cache/discogs").expanduser(), codec=ZlibCodec())
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=compressed)
+
+# Keep expired entries for a day so they are revalidated with If-None-Match /
+# If-Modified-Since: an unchanged resource only restarts the TTL.
+revalidating = MemoryCache(ttl=3600, stale_ttl=86400)
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=revalidating)
+
+# Serve entries up to five minutes past expiry without waiting, refreshing
+# them in the background (a task for AsyncDiscogs, a thread for Discogs).
+swr = MemoryCache(ttl=3600, stale_ttl=86400, stale_while_revalidate=300)
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=swr)
+
+# Cache database entities for a week while keeping prices fresh. Rules are
+# URL path patterns; the first match wins and None disables caching.
+from discogs_sdk._cache import TTLPolicy
+
+policy = TTLPolicy(
+    {
+        "/marketplace/*": 300,
+        "/users/*/inventory": None,
+        "/releases/*": 7 * 86400,
+        "/masters/*": 7 * 86400,
+    },
+    default=3600,
+)
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=True, cache_ttl=policy)
+
+# Share one cache between workers and hosts through any Redis-compatible
+# server. Expiry is handled by the server; outages degrade to cache misses.
+from discogs_sdk._redis import RedisCache
+
+shared = RedisCache(ttl=86400, url="redis://cache.internal:6379/0", namespace="crawler:")
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=shared)
+
+# Serve hot entries from memory and keep the long tail on disk. Persistent
+# hits are promoted into memory; write_behind moves SQLite writes off the
+# request path.
+from discogs_sdk._cache import TieredCache
+
+tiered = TieredCache(
+    MemoryCache(ttl=3600, max_entries=10_000),
+    SQLiteCache(ttl=86400, cache_dir=Path("~/.cache/discogs").expanduser()),
+    write_behind=True,
+)
+cached_client = Discogs(token="YOUR_TOKEN_HERE", cache=tiered)
+
+# Bake a warm cache into an image: fetch the hot paths once, export them to a
+# compact snapshot, and bulk-load it when a new worker starts.
+cached_client.warm_cache([f"/releases/{release_id}" for release_id in (352665, 249504, 1362)], concurrency=4)
+tiered.export_snapshot("/tmp/discogs-cache.snap")
+tiered.import_snapshot("/tmp/discogs-cache.snap")
+
 
 # ━━ Custom cache backend ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Subclass ResponseCache to plug in any storage backend.
-# Implement get(), set(), clear(), and close().
+# Implement get(), set(), clear(), and close(); override delete() and
+# delete_prefix() to invalidate selectively instead of clearing everything.
 import threading
 
 from discogs_sdk._cache import ResponseCache
@@ -140,6 +212,14 @@ client = Discogs(token="YOUR_TOKEN_HERE", cache=DictCache())
 client = Discogs(token="YOUR_TOKEN_HERE", user_agent="MyApp/1.0 +https://myapp.example.com")
 
 
+# ━━ Connection pool ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Size the pool for the concurrency you run. Bulk fetches, prefetching and
+# cache warm-up never exceed max_connections, so they never wait on the pool.
+# With http2=True (pip install "httpx[http2]"), requests share multiplexed
+# connections instead.
+client = Discogs(token="YOUR_TOKEN_HERE", max_connections=50, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+
 # ━━ Custom httpx client ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Pass your own httpx.Client for full control over transport, proxies,
 # certificates, etc.  The SDK will NOT close a client you provide.
@@ -164,10 +244,31 @@ for export in client.exports.list():
 export = client.exports.get(12345)
 print(f"Status: {export.status}")
 
-# Download the CSV.
+# Download the CSV into memory...
 csv_bytes = client.exports.download(12345)
-with open("inventory.csv", "wb") as f:
-    f.write(csv_bytes)
+print(f"Downloaded {len(csv_bytes)} bytes")
+
+# ...or stream it straight to disk in constant memory, for large inventories.
+client.exports.download_to(12345, "inventory.csv")
+
+# Chunks can also be consumed as they arrive.
+for chunk in client.exports.iter_download(12345, chunk_size=1 << 20):
+    print(f"  received {len(chunk)} bytes")
+
+# Parse rows as they arrive into typed listings...
+for listing in client.exports.iter_listings(12345):
+    print(f"  #{listing.listing_id}: {listing.price} ({listing.condition} / {listing.sleeve_condition})")
+
+# ...or into columnar batches (field name -> list of values) for analytics.
+for batch in client.exports.iter_listing_batches(12345, batch_size=50_000):
+    print(f"  {len(batch['listing_id'])} rows, {sum(filter(None, batch['price'])):.2f} total")
+
+# Or do it all in one call: request an export, wait for it with backoff that
+# spends little of the rate limit, then stream it to disk.
+from discogs_sdk._poll import PollPolicy
+
+export = client.exports.run(to="inventory.csv", poll=PollPolicy(initial=5, maximum=60, timeout=1800))
+print(f"Export #{export.id} saved")
 
 
 # ━━ Uploads (inventory CSV import) ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -180,6 +281,19 @@ client.uploads.change(file="update_items.csv")
 # Upload a CSV to delete items.
 client.uploads.delete(file="delete_items.csv")
 
+# Files are streamed from disk, so large inventories need little memory.
+# Binary file objects work too, and progress reports (bytes_sent, total_bytes).
+with open("add_items.csv", "rb") as f:
+    client.uploads.create(file=f, progress=lambda sent, total: print(f"  {sent}/{total} bytes"))
+
+# Split a large CSV into jobs of 5,000 rows (header repeated on each), upload
+# two at a time and wait for every job to finish. A failing chunk does not
+# stop the others; send only the failed ones again.
+batch = client.uploads.change_in_chunks(file="update_items.csv", rows_per_chunk=5000, poll=PollPolicy(maximum=30))
+print(f"Uploaded {batch.rows} rows in {len(batch.uploads)} jobs")
+if batch.failed_chunks:
+    batch = client.uploads.change_in_chunks(file="update_items.csv", chunks=batch.failed_chunks)
+
 # List recent uploads.
 for upload in client.uploads.list():
     print(f"  Upload #{upload.id}: {upload.status} ({upload.filename})")
@@ -8,6 +8,7 @@ Covers:
   - Custom fields
   - Collection value
   - Wantlist CRUD
+  - Delta sync against a local index
 
 All operations require OAuth authentication and target a specific user.
 """
@@ -134,3 +135,18 @@ user.wantlist.update(352665, notes="Found one, negotiating price")
 
 # Remove from wantlist.
 user.wantlist.delete(352665)
+
+
+# ━━ Delta sync ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Keep a local SQLite index of a folder and a wantlist and fetch only what
+# changed since the last run: newest pages first, stopping at the first known
+# item, with a full walk only when the item count shows removals.
+from discogs_sdk._index import LocalIndex
+
+index = LocalIndex("discogs-index.db")
+for event in user.collection.folders.get(0).releases.sync(index):
+    print(f"  {event.kind}: instance {event.item_id}")
+for event in user.wantlist.sync(index):
+    print(f"  {event.kind}: release {event.item_id}")
+index.close()
@@ -37,7 +37,15 @@ NAME_MAP: dict[str, str] = {
     "__aexit__": "__exit__",
     "__aiter__": "__iter__",
     "__anext__": "__next__",
+    "aclear": "clear",
     "aclose": "close",
+    "adelete_prefix": "delete_prefix",
+    "adelete": "delete",
+    "aget_stale": "get_stale",
+    "aiter_bytes": "iter_bytes",
+    "aread": "read",
+    "arefresh": "refresh",
+    "aset": "set",
     "AsyncAPIResource": "SyncAPIResource",
     "AsyncCacheClient": "SyncCacheClient",
     "AsyncSqliteStorage": "SyncSqliteStorage",
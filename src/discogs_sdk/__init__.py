@@ -29,6 +29,7 @@ from discogs_sdk.models import (
     Condition,
     CurrencyCode,
     Export,
+    ExportedListing,
     Fee,
     Format,
     Identifier,
@@ -61,6 +62,7 @@ from discogs_sdk.models import (
     SubLabel,
     Track,
     Upload,
+    UploadBatch,
     User,
     UserReleaseRating,
     UserSummary,
@@ -102,6 +104,7 @@ __all__ = [
     "Condition",
     "CurrencyCode",
     "Export",
+    "ExportedListing",
     "Fee",
     "Format",
     "Identifier",
@@ -134,6 +137,7 @@ __all__ = [
     "SubLabel",
     "Track",
     "Upload",
+    "UploadBatch",
     "User",
     "UserReleaseRating",
     "UserSummary",
@@ -0,0 +1,107 @@
+"""Delta sync of collection folders and wantlists against a ``LocalIndex``."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from discogs_sdk._async._paginator import AsyncPage
+from discogs_sdk._index import DeltaEvent, IndexEntry, LocalIndex
+
+if True:  # ASYNC
+    import asyncio
+
+if TYPE_CHECKING:
+    from discogs_sdk._async._client import AsyncDiscogs
+
+logger = logging.getLogger("discogs_sdk")
+
+# The API's largest page size: fewest requests per walk.
+_PER_PAGE = 100
+
+
+def _entry(item: Any) -> IndexEntry:
+    notes = getattr(item, "notes", None)
+    return IndexEntry(
+        date_added=getattr(item, "date_added", None),
+        rating=item.rating,
+        notes=None if notes is None else json.dumps(notes, sort_keys=True),
+    )
+
+
+def _newest_first(walked: list[IndexEntry], known: dict[int, IndexEntry]) -> bool:
+    """Whether an incremental walk really went newest-first, so stopping at a known item is safe.
+
+    The items walked must be in descending ``date_added`` order, ending on the
+    newest item in the index. A server ignoring ``sort=added`` fails this.
+    """
+    dates = [entry.date_added for entry in walked if entry.date_added is not None]
+    if len(dates) < len(walked) or any(newer < older for newer, older in zip(dates, dates[1:])):
+        return False
+    newest_known = max((entry.date_added for entry in known.values() if entry.date_added is not None), default=None)
+    return newest_known is None or dates[-1] >= newest_known
+
+
+async def sync_items(
+    client: AsyncDiscogs,
+    index: LocalIndex,
+    scope: str,
+    *,
+    path: str,
+    model_cls: type[Any],
+    items_key: str,
+    item_id: Callable[[Any], int],
+) -> list[DeltaEvent]:
+    """Bring *index* up to date with the list at *path* and return what changed since the last sync.
+
+    See ``LocalIndex`` for the walk. Pages bypass the response cache.
+    """
+    if True:  # ASYNC
+        known = await asyncio.to_thread(index.load, scope)
+    else:
+        known = index.load(scope)
+
+    def pages() -> AsyncPage[Any]:
+        params = {"sort": "added", "sort_order": "desc", "per_page": _PER_PAGE}
+        return AsyncPage(client, path, model_cls, items_key, params=params, cache=False)
+
+    async def walk(page: AsyncPage[Any], *, incremental: bool) -> tuple[dict[int, tuple[Any, IndexEntry]], bool]:
+        """Return the items walked by ID, and whether the walk stopped at a known item."""
+        walked: dict[int, tuple[Any, IndexEntry]] = {}
+        async for item in page:
+            key = item_id(item)
+            walked[key] = (item, _entry(item))
+            if incremental and key in known:
+                return walked, True
+        return walked, False
+
+    page = pages()
+    walked, stopped = await walk(page, incremental=True)
+    added = sum(key not in known for key in walked)
+    if stopped and not _newest_first([entry for _, entry in walked.values()], known):
+        logger.debug("Delta sync of %s: list not sorted newest first, walking the full list", scope)
+        walked, stopped = await walk(pages(), incremental=False)
+    elif stopped and page.total_items != len(known) + added:
+        logger.debug("Delta sync of %s: item count changed, walking the full list", scope)
+        walked, stopped = await walk(pages(), incremental=False)
+
+    events: list[DeltaEvent] = []
+    upserts: dict[int, IndexEntry] = {}
+    for key, (item, entry) in walked.items():
+        if key not in known:
+            events.append(DeltaEvent("added", key, item))
+        elif known[key] != entry:
+            events.append(DeltaEvent("changed", key, item))
+        else:
+            continue
+        upserts[key] = entry
+    # A walk that did not stop covered the whole list: whatever it missed is gone.
+    removed = [] if stopped else [key for key in known if key not in walked]
+    events.extend(DeltaEvent("removed", key) for key in removed)
+    if True:  # ASYNC
+        await asyncio.to_thread(index.apply, scope, upserts, removed)
+    else:
+        index.apply(scope, upserts, removed)
+    return events
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from pathlib import Path
+if True:  # ASYNC
+    import asyncio
+import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 from pydantic import BaseModel
 
+from discogs_sdk._async._concurrency import map_unordered
+from discogs_sdk._exceptions import DiscogsError
+from discogs_sdk._files import FileSource, ProgressCallback, ProgressReader, open_source, upload_name
+
 if TYPE_CHECKING:
     from discogs_sdk._async._client import AsyncDiscogs
 
 _M = TypeVar("_M", bound=BaseModel)
+_T = TypeVar("_T")
 
 
 class AsyncAPIResource:
@@ -24,9 +33,7 @@ class AsyncAPIResource:
 
     def _parse_response(self, response: httpx.Response, model_cls: type[_M]) -> _M:
         """Parse JSON, raise on error, return validated model."""
-        data = response.json()
-        self._client._maybe_raise(response.status_code, data, retry_after=response.headers.get("Retry-After"))
-        return model_cls.model_validate(data)
+        return self._client._parse_model(response, model_cls)
 
     def _raise_for_error(self, response: httpx.Response) -> None:
         """Raise on error for void methods (delete, update returning None)."""
@@ -34,20 +41,56 @@ class AsyncAPIResource:
             body = response.json() if response.content else {}
             self._client._maybe_raise(response.status_code, body, retry_after=response.headers.get("Retry-After"))
 
+    async def _blocking(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Call *func*, on a worker thread in the async client so blocking file I/O stays off the event loop."""
+        if True:  # ASYNC
+            return await asyncio.to_thread(func, *args)
+        else:
+            return func(*args)
+
     async def _delete(self, path: str) -> httpx.Response:
         return await self._request("DELETE", path)
 
-    async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> httpx.Response:
-        return await self._request("GET", path, params=params)
+    async def _get(self, path: str, *, params: dict[str, Any] | None = None, cache: bool = True) -> httpx.Response:
+        return await self._request("GET", path, params=params, cache=cache)
+
+    async def _get_many(
+        self,
+        ids: Iterable[int],
+        path: Callable[[int], str],
+        model_cls: type[_M],
+        *,
+        concurrency: int,
+    ) -> AsyncIterator[tuple[int, _M | DiscogsError]]:
+        """Fetch one resource per ID concurrently, yielding ``(id, model_or_error)`` as each completes."""
+
+        async def fetch(resource_id: int) -> _M | DiscogsError:
+            try:
+                response = await self._get(path(resource_id))
+                return self._parse_response(response, model_cls)
+            except DiscogsError as exc:
+                return exc
+
+        concurrency = self._client._bounded_concurrency(concurrency)
+        async for resource_id, result in map_unordered(fetch, ids, concurrency=concurrency):
+            yield resource_id, result
 
     async def _get_binary(self, path: str) -> bytes:
-        response = await self._client._send("GET", self._client._build_url(path))
-        self._client._maybe_raise(
-            response.status_code,
-            response.text,
-            retry_after=response.headers.get("Retry-After"),
-        )
-        return response.content
+        async with self._stream_binary(path) as response:
+            return await response.aread()
+
+    @asynccontextmanager
+    async def _stream_binary(self, path: str) -> AsyncIterator[httpx.Response]:
+        """GET *path* as a streamed response, bypassing the response cache; raise on error."""
+        async with self._client._stream("GET", self._client._build_url(path)) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._client._maybe_raise(
+                    response.status_code,
+                    response.text,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+            yield response
 
     async def _post(
         self,
@@ -58,13 +101,25 @@ class AsyncAPIResource:
     ) -> httpx.Response:
         return await self._request("POST", path, json=json, params=params)
 
-    async def _post_file(self, path: str, *, file_path: str) -> httpx.Response:
-        p = Path(file_path)
-        data = p.read_bytes()
+    async def _post_file(
+        self,
+        path: str,
+        *,
+        file: FileSource,
+        progress: ProgressCallback | None = None,
+    ) -> httpx.Response:
+        """POST *file* as the ``upload`` multipart field, streamed in chunks rather than read up front."""
+        if isinstance(file, (str, os.PathLike)):
+            stream = await self._blocking(open_source, file)
+            try:
+                return await self._post_file(path, file=stream, progress=progress)
+            finally:
+                await self._blocking(stream.close)
+        body = file if progress is None else ProgressReader(file, progress)
         return await self._client._send(
             "POST",
             self._client._build_url(path),
-            files={"upload": (p.name, data, "text/csv")},
+            files={"upload": (upload_name(file), body, "text/csv")},
         )
 
     async def _put(
@@ -83,10 +138,12 @@ class AsyncAPIResource:
         *,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        cache: bool = True,
     ) -> httpx.Response:
         return await self._client._send(
             method,
             self._client._build_url(path),
             json=json,
             params=params,
+            cache=cache,
         )
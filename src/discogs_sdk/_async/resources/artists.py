@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
+
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.artist import Artist, ArtistRelease
 
 
@@ -41,3 +44,19 @@ class Artists(AsyncAPIResource):
                 "releases": lambda: ArtistReleases(self._client, artist_id),
             },
         )
+
+    def get_many(
+        self,
+        artist_ids: Iterable[int],
+        *,
+        concurrency: int = 5,
+    ) -> AsyncIterator[tuple[int, Artist | DiscogsError]]:
+        """Fetch many artists concurrently.
+
+        Yields ``(artist_id, result)`` pairs in completion order, where *result* is
+        the ``Artist`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(artist_ids, lambda artist_id: f"/artists/{artist_id}", Artist, concurrency=concurrency)
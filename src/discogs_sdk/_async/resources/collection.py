@@ -4,9 +4,11 @@ import builtins
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+from discogs_sdk._async._delta import sync_items
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._index import DeltaEvent, LocalIndex
 from discogs_sdk.models.collection import (
     CollectionField,
     CollectionFolder,
@@ -130,6 +132,23 @@ class FolderReleases(AsyncAPIResource):
         response = await self._post(f"{self._base_path()}/{release_id}")
         self._raise_for_error(response)
 
+    async def sync(self, index: LocalIndex) -> builtins.list[DeltaEvent]:
+        """Update *index* with this folder's items and return those added, changed or removed since the last sync.
+
+        Items are keyed by ``instance_id``. Only the newest pages are fetched
+        unless the folder's item count shows that something was removed; see
+        ``LocalIndex``.
+        """
+        return await sync_items(
+            self._client,
+            index,
+            f"collection:{self._username}:{self._folder_id}",
+            path=self._base_path(),
+            model_cls=CollectionItem,
+            items_key="releases",
+            item_id=lambda item: item.instance_id or item.id,
+        )
+
 
 # --- Collection Folders ---
 
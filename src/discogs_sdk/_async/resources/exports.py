@@ -1,9 +1,33 @@
 from __future__ import annotations
 
+import builtins
+import functools
+import os
+from collections.abc import AsyncIterator
+from typing import Any, BinaryIO
+
+import httpx
+
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
+from discogs_sdk._async._polling import poll_until
 from discogs_sdk._async._resource import AsyncAPIResource
-from discogs_sdk.models.export import Export
+from discogs_sdk._exceptions import DiscogsError
+from discogs_sdk._export_csv import ExportCSVParser
+from discogs_sdk._poll import PollPolicy, is_failed, is_finished
+from discogs_sdk.models.export import Export, ExportedListing
+
+
+def _export_id(response: httpx.Response) -> int | None:
+    """Export ID from the ``Location`` header of a request (``.../inventory/export/{id}``), if sent."""
+    export_id = response.headers.get("Location", "").rstrip("/").rpartition("/")[2]
+    return int(export_id) if export_id.isdigit() else None
+
+
+def _is_newer(export: Export, known: Export | None) -> bool:
+    if known is None or export.id > known.id:
+        return True
+    return export.created_at is not None and known.created_at is not None and export.created_at > known.created_at
 
 
 class Exports(AsyncAPIResource):
@@ -32,6 +56,148 @@ class Exports(AsyncAPIResource):
     async def download(self, export_id: int) -> bytes:
         return await self._get_binary(f"/inventory/export/{export_id}/download")
 
+    async def iter_download(self, export_id: int, *, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Stream an export's CSV in chunks of up to *chunk_size* bytes.
+
+        Memory use stays constant whatever the export size, and the body never
+        goes through the response cache.
+        """
+        async with self._stream_binary(f"/inventory/export/{export_id}/download") as response:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def iter_listings(self, export_id: int, *, chunk_size: int = 65536) -> AsyncIterator[ExportedListing]:
+        """Stream an export and yield its rows as typed ``ExportedListing`` models.
+
+        Rows are parsed as the download arrives, so memory use stays constant
+        whatever the export size.
+        """
+        parser = ExportCSVParser()
+        async for chunk in self.iter_download(export_id, chunk_size=chunk_size):
+            for row in parser.feed(chunk):
+                yield parser.listing(row)
+        for row in parser.close():
+            yield parser.listing(row)
+
+    async def iter_listing_batches(
+        self,
+        export_id: int,
+        *,
+        batch_size: int = 10_000,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[dict[str, builtins.list[Any]]]:
+        """Stream an export and yield its rows in columnar batches of up to *batch_size* rows.
+
+        Each batch maps ``ExportedListing`` field names to one list of values
+        per column, ready for ``pandas.DataFrame`` or ``pyarrow.table``.
+        Numbers and booleans are converted, empty cells are ``None``, and no
+        model is built per row, which makes this the faster way through
+        large exports.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        parser = ExportCSVParser()
+        rows: builtins.list[builtins.list[str]] = []
+        async for chunk in self.iter_download(export_id, chunk_size=chunk_size):
+            rows += parser.feed(chunk)
+            while len(rows) >= batch_size:
+                yield parser.columns(rows[:batch_size])
+                del rows[:batch_size]
+        rows += parser.close()
+        for start in range(0, len(rows), batch_size):
+            yield parser.columns(rows[start : start + batch_size])
+
+    async def download_to(
+        self,
+        export_id: int,
+        dest: str | os.PathLike[str] | BinaryIO,
+        *,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Stream an export's CSV to a file path or binary file object and return the bytes written.
+
+        A file at *dest* is only created once the download has started, so
+        errors such as ``NotFoundError`` leave no partial file behind.
+        """
+        written = 0
+        async with self._stream_binary(f"/inventory/export/{export_id}/download") as response:
+            if isinstance(dest, (str, os.PathLike)):
+                file = await self._blocking(open, os.fspath(dest), "wb")
+                try:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        written += await self._blocking(file.write, chunk)
+                finally:
+                    await self._blocking(file.close)
+            else:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    written += dest.write(chunk)
+        return written
+
     async def request(self) -> None:
         response = await self._post("/inventory/export")
         self._raise_for_error(response)
+
+    async def run(
+        self,
+        to: str | os.PathLike[str] | BinaryIO,
+        *,
+        poll: PollPolicy | None = None,
+        chunk_size: int = 65536,
+    ) -> Export:
+        """Request a new export, wait for it to finish and stream its CSV to *to*.
+
+        The job is checked as *poll* says (``PollPolicy()`` by default): often
+        at first, then less and less, so a long export costs few requests of
+        the rate limit. The new export is identified by the ``Location`` header
+        of the request or, failing that, as the oldest listed export newer than
+        any that existed before, paging through the list as far as needed. Returns the finished export. Raises
+        ``TimeoutError`` if it does not finish in time and ``DiscogsError`` if
+        it fails.
+        """
+        policy = poll or PollPolicy()
+        known = await self._latest()
+        response = await self._post("/inventory/export")
+        self._raise_for_error(response)
+        export_id = _export_id(response)
+        if export_id is None:
+            fetch = functools.partial(self._find_newer, known)
+        else:
+            fetch = functools.partial(self._fetch_export, export_id)
+        export = await poll_until(fetch, lambda found: found is not None and is_finished(found), policy)
+        assert export is not None
+        if is_failed(export):
+            raise DiscogsError(f"Export {export.id} finished with status {export.status!r}")
+        await self.download_to(export.id, to, chunk_size=chunk_size)
+        return export
+
+    async def _pages(self) -> AsyncIterator[builtins.list[Export]]:
+        """Yield each page of the export list, in the API's order."""
+        page = 1
+        while True:
+            # Job status changes under us, so never serve it from the response cache.
+            response = await self._get("/inventory/export", params={"page": page, "per_page": 100}, cache=False)
+            exports = self._parse_list_response(response, Export, "items")
+            yield exports
+            if not exports or page >= response.json().get("pagination", {}).get("pages", 1):
+                return
+            page += 1
+
+    async def _latest(self) -> Export | None:
+        latest = None
+        async for exports in self._pages():
+            for export in exports:
+                if latest is None or export.id > latest.id:
+                    latest = export
+        return latest
+
+    async def _find_newer(self, known: Export | None) -> Export | None:
+        """The oldest export newer than *known*, reading only as many pages as it takes to find one."""
+        async for exports in self._pages():
+            newer = [export for export in exports if _is_newer(export, known)]
+            if newer:
+                return min(newer, key=lambda export: export.id)
+        return None
+
+    async def _fetch_export(self, export_id: int) -> Export | None:
+        response = await self._get(f"/inventory/export/{export_id}", cache=False)
+        return self._parse_response(response, Export)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
+
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.label import Label, LabelRelease
 
 
@@ -37,3 +40,19 @@ class Labels(AsyncAPIResource):
                 "releases": lambda: LabelReleases(self._client, label_id),
             },
         )
+
+    def get_many(
+        self,
+        label_ids: Iterable[int],
+        *,
+        concurrency: int = 5,
+    ) -> AsyncIterator[tuple[int, Label | DiscogsError]]:
+        """Fetch many labels concurrently.
+
+        Yields ``(label_id, result)`` pairs in completion order, where *result* is
+        the ``Label`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(label_ids, lambda label_id: f"/labels/{label_id}", Label, concurrency=concurrency)
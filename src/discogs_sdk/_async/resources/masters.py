@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
+
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.master import Master, MasterVersion
 
 
@@ -52,3 +55,19 @@ class Masters(AsyncAPIResource):
                 "versions": lambda: MasterVersions(self._client, master_id),
             },
         )
+
+    def get_many(
+        self,
+        master_ids: Iterable[int],
+        *,
+        concurrency: int = 5,
+    ) -> AsyncIterator[tuple[int, Master | DiscogsError]]:
+        """Fetch many masters concurrently.
+
+        Yields ``(master_id, result)`` pairs in completion order, where *result* is
+        the ``Master`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(master_ids, lambda master_id: f"/masters/{master_id}", Master, concurrency=concurrency)
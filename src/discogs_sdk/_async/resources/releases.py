@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterable
+
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.release import (
     CommunityRating,
     MarketplaceReleaseStats,
@@ -94,3 +97,21 @@ class Releases(AsyncAPIResource):
                 "stats": lambda: ReleaseStatsResource(self._client, release_id),
             },
         )
+
+    def get_many(
+        self,
+        release_ids: Iterable[int],
+        *,
+        concurrency: int = 5,
+    ) -> AsyncIterator[tuple[int, Release | DiscogsError]]:
+        """Fetch many releases concurrently.
+
+        Yields ``(release_id, result)`` pairs in completion order, where *result* is
+        the ``Release`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(
+            release_ids, lambda release_id: f"/releases/{release_id}", Release, concurrency=concurrency
+        )
@@ -1,24 +1,142 @@
 from __future__ import annotations
 
+import functools
+import logging
+import os
+from collections.abc import Collection
+import httpx
+
+from discogs_sdk._async._concurrency import map_unordered
 from discogs_sdk._async._lazy import AsyncLazyResource
 from discogs_sdk._async._paginator import AsyncPage
+from discogs_sdk._async._polling import poll_until
 from discogs_sdk._async._resource import AsyncAPIResource
-from discogs_sdk.models.upload import Upload
+from discogs_sdk._exceptions import DiscogsAPIError, DiscogsConnectionError, DiscogsError
+from discogs_sdk._files import FileSource, NamedBytesIO, ProgressCallback, open_source, split_csv, upload_name
+from discogs_sdk._poll import PollPolicy, is_finished
+from discogs_sdk.models.upload import Upload, UploadBatch
+
+if True:  # ASYNC
+    import asyncio
+else:
+    import time
+
+logger = logging.getLogger("discogs_sdk")
+
+
+def _upload_id(response: httpx.Response) -> int:
+    """Job ID from the ``Location`` header of an accepted upload (``.../inventory/upload/{id}``)."""
+    upload_id = response.headers.get("Location", "").rstrip("/").rpartition("/")[2]
+    if not upload_id.isdigit():
+        raise DiscogsError("Upload accepted without a job ID in its Location header")
+    return int(upload_id)
+
+
+def _is_transient(exc: DiscogsError) -> bool:
+    """Whether sending a chunk again may succeed: connection errors, 429 and 5xx.
+
+    Anything else, such as an accepted upload without a job ID, is final:
+    sending the chunk again could start a duplicate job.
+    """
+    if isinstance(exc, DiscogsConnectionError):
+        return True
+    return isinstance(exc, DiscogsAPIError) and (exc.status_code == 429 or exc.status_code >= 500)
 
 
 class Uploads(AsyncAPIResource):
-    async def create(self, *, file: str) -> None:
-        response = await self._post_file("/inventory/upload/add", file_path=file)
+    """Inventory CSV uploads.
+
+    *file* is a path or a binary file object. It is streamed from disk in
+    chunks, so memory use does not grow with its size. *progress* is called
+    with ``(bytes_sent, total_bytes)`` as the upload proceeds.
+    """
+
+    async def create(self, *, file: FileSource, progress: ProgressCallback | None = None) -> None:
+        response = await self._post_file("/inventory/upload/add", file=file, progress=progress)
         self._raise_for_error(response)
 
-    async def change(self, *, file: str) -> None:
-        response = await self._post_file("/inventory/upload/change", file_path=file)
+    async def change(self, *, file: FileSource, progress: ProgressCallback | None = None) -> None:
+        response = await self._post_file("/inventory/upload/change", file=file, progress=progress)
         self._raise_for_error(response)
 
-    async def delete(self, *, file: str) -> None:
-        response = await self._post_file("/inventory/upload/delete", file_path=file)
+    async def delete(self, *, file: FileSource, progress: ProgressCallback | None = None) -> None:
+        response = await self._post_file("/inventory/upload/delete", file=file, progress=progress)
         self._raise_for_error(response)
 
+    async def create_in_chunks(
+        self,
+        *,
+        file: FileSource,
+        rows_per_chunk: int = 5000,
+        concurrency: int = 2,
+        retries: int = 2,
+        poll: PollPolicy | None = None,
+        chunks: Collection[int] | None = None,
+    ) -> UploadBatch:
+        """Upload a large CSV as jobs of *rows_per_chunk* rows each and wait for them to finish.
+
+        Every chunk repeats the header row. At most *concurrency* chunks are in flight at once (capped by the
+        connection pool); every request goes through the rate limiter. A chunk
+        that fails with a network error, 429 or 5xx is sent again up to
+        *retries* times. Each accepted job is then polled as *poll* says
+        (``PollPolicy()`` by default) until it finishes. One failing chunk does
+        not stop the others: its error is recorded in the result, and only
+        ``result.failed_chunks`` need to be passed back as *chunks* to finish
+        the job. A chunk whose job was accepted but could not be polled may
+        already be applied, so check ``list()`` before sending it again.
+        """
+        return await self._upload_in_chunks(
+            "/inventory/upload/add",
+            file=file,
+            rows_per_chunk=rows_per_chunk,
+            concurrency=concurrency,
+            retries=retries,
+            poll=poll,
+            chunks=chunks,
+        )
+
+    async def change_in_chunks(
+        self,
+        *,
+        file: FileSource,
+        rows_per_chunk: int = 5000,
+        concurrency: int = 2,
+        retries: int = 2,
+        poll: PollPolicy | None = None,
+        chunks: Collection[int] | None = None,
+    ) -> UploadBatch:
+        """Chunked counterpart of ``change()``; see ``create_in_chunks()``."""
+        return await self._upload_in_chunks(
+            "/inventory/upload/change",
+            file=file,
+            rows_per_chunk=rows_per_chunk,
+            concurrency=concurrency,
+            retries=retries,
+            poll=poll,
+            chunks=chunks,
+        )
+
+    async def delete_in_chunks(
+        self,
+        *,
+        file: FileSource,
+        rows_per_chunk: int = 5000,
+        concurrency: int = 2,
+        retries: int = 2,
+        poll: PollPolicy | None = None,
+        chunks: Collection[int] | None = None,
+    ) -> UploadBatch:
+        """Chunked counterpart of ``delete()``; see ``create_in_chunks()``."""
+        return await self._upload_in_chunks(
+            "/inventory/upload/delete",
+            file=file,
+            rows_per_chunk=rows_per_chunk,
+            concurrency=concurrency,
+            retries=retries,
+            poll=poll,
+            chunks=chunks,
+        )
+
     def list(
         self,
         *,
@@ -40,3 +158,88 @@ class Uploads(AsyncAPIResource):
             model_cls=Upload,
             path=f"/inventory/upload/{upload_id}",
         )
+
+    async def _upload_in_chunks(
+        self,
+        path: str,
+        *,
+        file: FileSource,
+        rows_per_chunk: int,
+        concurrency: int,
+        retries: int,
+        poll: PollPolicy | None,
+        chunks: Collection[int] | None,
+    ) -> UploadBatch:
+        if isinstance(file, (str, os.PathLike)):
+            stream = await self._blocking(open_source, file)
+            try:
+                return await self._upload_in_chunks(
+                    path,
+                    file=stream,
+                    rows_per_chunk=rows_per_chunk,
+                    concurrency=concurrency,
+                    retries=retries,
+                    poll=poll,
+                    chunks=chunks,
+                )
+            finally:
+                await self._blocking(stream.close)
+        if retries < 0:
+            raise ValueError("retries must be >= 0")
+        policy = poll or PollPolicy()
+        stem = os.path.splitext(upload_name(file))[0]
+        selected = None if chunks is None else set(chunks)
+        numbered = (
+            (number, body, rows)
+            for number, (body, rows) in enumerate(split_csv(file, rows_per_chunk), 1)
+            if selected is None or number in selected
+        )
+
+        async def upload(chunk: tuple[int, bytes, int]) -> Upload | DiscogsError | TimeoutError:
+            number, body, _ = chunk
+            try:
+                upload_id = await self._send_chunk(path, body, f"{stem}-{number:04d}.csv", retries=retries)
+                return await poll_until(functools.partial(self._fetch_upload, upload_id), is_finished, policy)
+            except (DiscogsError, TimeoutError) as exc:
+                return exc
+
+        batch = UploadBatch()
+        concurrency = self._client._bounded_concurrency(concurrency)
+        async for (number, _, rows), result in map_unordered(upload, numbered, concurrency=concurrency):
+            if isinstance(result, Upload):
+                batch.uploads[number] = result
+                batch.rows += rows
+            else:
+                logger.warning("Chunk %d of %s failed: %s", number, path, result)
+                batch.errors[number] = str(result)
+        return batch
+
+    async def _send_chunk(self, path: str, body: bytes, name: str, *, retries: int) -> int:
+        """POST one chunk, sending it again on transient errors; return the upload job ID."""
+        for attempt in range(retries + 1):
+            try:
+                response = await self._post_file(path, file=NamedBytesIO(body, name))
+                self._raise_for_error(response)
+                return _upload_id(response)
+            except DiscogsError as exc:
+                if attempt == retries or not _is_transient(exc):
+                    raise
+                delay = self._client._retry_delay(attempt)
+                logger.info(
+                    "Retrying chunk %s (attempt %d/%d) after %s, waiting %.1fs",
+                    name,
+                    attempt + 2,
+                    retries + 1,
+                    exc,
+                    delay,
+                )
+                if True:  # ASYNC
+                    await asyncio.sleep(delay)
+                else:
+                    time.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _fetch_upload(self, upload_id: int) -> Upload:
+        # Job status changes under us, so never serve it from the response cache.
+        response = await self._get(f"/inventory/upload/{upload_id}", cache=False)
+        return self._parse_response(response, Upload)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import builtins
 from typing import Any
 
+from discogs_sdk._async._delta import sync_items
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._async._resource import AsyncAPIResource
+from discogs_sdk._index import DeltaEvent, LocalIndex
 from discogs_sdk.models.wantlist import Want
 
 
@@ -36,6 +39,23 @@ class Wantlist(AsyncAPIResource):
         response = await self._delete(f"/users/{self._username}/wants/{release_id}")
         self._raise_for_error(response)
 
+    async def sync(self, index: LocalIndex) -> builtins.list[DeltaEvent]:
+        """Update *index* with this wantlist and return the wants added, changed or removed since the last sync.
+
+        Wants are keyed by release ID. Only the newest pages are fetched
+        unless the wantlist's item count shows that something was removed;
+        see ``LocalIndex``.
+        """
+        return await sync_items(
+            self._client,
+            index,
+            f"wantlist:{self._username}",
+            path=f"/users/{self._username}/wants",
+            model_cls=Want,
+            items_key="wants",
+            item_id=lambda want: want.id,
+        )
+
     async def update(self, release_id: int, **kwargs: Any) -> Want:
         response = await self._post(f"/users/{self._username}/wants/{release_id}", json=kwargs)
         return self._parse_response(response, Want)
@@ -22,6 +22,10 @@ logger = logging.getLogger("discogs_sdk")
 DEFAULT_BASE_URL = "https://api.discogs.com"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CACHE_TTL = 3600.0
+# Same as httpx's defaults.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 _RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
 
 try:
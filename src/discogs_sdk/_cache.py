@@ -2,25 +2,209 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import functools
+import gzip
+import hashlib
+import itertools
 import json
+import re
 import sqlite3
+import struct
 import threading
 import time
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Protocol, TypeVar
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel
 
 # Type alias for cached response tuples: (status_code, headers, body)
 CacheEntry = tuple[int, dict[str, str], bytes]
 
+# httpx.Response.extensions key set on responses that come from or went into the cache.
+CACHE_KEY_EXTENSION = "discogs_sdk.cache_key"
+
+_M = TypeVar("_M", bound=BaseModel)
+_T = TypeVar("_T")
+
+# Response headers carrying validators, and the request headers that send them back.
+_VALIDATORS = (("etag", "If-None-Match"), ("last-modified", "If-Modified-Since"))
+
+# Bumped whenever the SQLite table layout changes.
+_SQLITE_SCHEMA_VERSION = 3
+
+# Snapshot files are a gzip stream of this header followed by one record per
+# entry: expiry (epoch seconds), status, key/headers/body lengths, then the
+# key, the JSON headers and the uncompressed body.
+_SNAPSHOT_MAGIC = b"DISCOGS-SDK-CACHE\x01"
+_SNAPSHOT_RECORD = struct.Struct(">dHIII")
+
+# Snapshot entry: (key, expires_at as epoch seconds, entry with a decoded body).
+_SnapshotEntry = tuple[str, float, CacheEntry]
+
+
+def conditional_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Build ``If-None-Match`` / ``If-Modified-Since`` from a cached entry's headers."""
+    lowered = {k.lower(): v for k, v in headers.items()}
+    return {request: lowered[response] for response, request in _VALIDATORS if response in lowered}
+
+
+class _ByteReader(Protocol):
+    """A binary stream to read a snapshot from (a ``GzipFile`` is not an ``IO[bytes]``)."""
+
+    def read(self, size: int, /) -> bytes: ...
+
+
+def _read_snapshot(stream: _ByteReader) -> Iterator[_SnapshotEntry]:
+    while header := stream.read(_SNAPSHOT_RECORD.size):
+        if len(header) < _SNAPSHOT_RECORD.size:
+            raise ValueError("Truncated cache snapshot")
+        expires_at, status, key_len, headers_len, body_len = _SNAPSHOT_RECORD.unpack(header)
+        key, headers, body = stream.read(key_len), stream.read(headers_len), stream.read(body_len)
+        if len(body) < body_len:
+            raise ValueError("Truncated cache snapshot")
+        yield key.decode(), expires_at, (status, json.loads(headers), body)
+
+
+class TTLPolicy:
+    """Per-endpoint cache lifetimes, chosen from the request path.
+
+    *rules* maps ``fnmatch``-style patterns to a TTL in seconds, or ``None``
+    to never cache matching responses. Patterns are matched against the URL
+    path in order and the first match wins (``*`` also matches ``/``); paths
+    matching no rule use *default*::
+
+        TTLPolicy(
+            {
+                "/marketplace/*": 300,
+                "/users/*/inventory": None,
+                "/releases/*": 7 * 86400,
+                "/masters/*": 7 * 86400,
+            },
+            default=3600,
+        )
+    """
+
+    def __init__(self, rules: Mapping[str, float | None], *, default: float | None) -> None:
+        self._rules = [(re.compile(fnmatch.translate(pattern)), ttl) for pattern, ttl in rules.items()]
+        self._default = default
+
+    def ttl_for(self, key: str) -> float | None:
+        """Return the TTL for a ``METHOD:url`` cache key, or ``None`` if it must not be cached."""
+        path = urlsplit(key.partition(":")[2]).path
+        for pattern, ttl in self._rules:
+            if pattern.match(path):
+                return ttl
+        return self._default
+
+
+class Codec(ABC):
+    """Compression applied to cached response bodies.
+
+    Subclass to plug in another algorithm, e.g. with ``zstandard``::
+
+        class ZstdCodec(Codec):
+            name = "zstd"
+
+            def encode(self, data: bytes) -> bytes:
+                return zstandard.compress(data)
+
+            def decode(self, data: bytes) -> bytes:
+                return zstandard.decompress(data)
+
+    *name* is stored alongside persistent entries, so it must be stable.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, data: bytes) -> bytes:
+        """Compress a response body."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> bytes:
+        """Decompress a body produced by ``encode()``."""
+
+
+class ZlibCodec(Codec):
+    """Built-in codec using the standard library's ``zlib``."""
+
+    name = "zlib"
+
+    def __init__(self, level: int = 6) -> None:
+        self._level = level
+
+    def encode(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decode(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
 
 class ResponseCache(ABC):
     """Abstract base for response caches.
 
     Subclasses implement storage; the base class owns the TTL contract.
+    *ttl* is either a number of seconds or a ``TTLPolicy``; backends look up
+    the lifetime of each key with ``_ttl_for()`` and skip keys it maps to
+    ``None``.
+    When a *codec* is given, bodies are stored compressed: backends pass them
+    through ``_encode()`` on write and ``_decode()`` on read.
+
+    Expired entries are kept for another *stale_ttl* seconds so the client can
+    revalidate them with a conditional request instead of downloading the body
+    again. Within the first *stale_while_revalidate* seconds past expiry, the
+    client serves them right away and revalidates in the background. Backends
+    opt in by overriding ``get_stale()`` and ``refresh()``.
+
+    ``export_snapshot()`` writes the entries to a compact file that
+    ``import_snapshot()`` bulk-loads into a cache of any backend, e.g. to ship
+    warm caches with new workers. Backends opt in by implementing ``_dump()``
+    and ``_load()``.
+
+    ``AsyncDiscogs`` goes through the ``a``-prefixed coroutines (``aget()``,
+    ``aset()``, ...). They call the sync methods inline, which suits in-memory
+    backends; backends doing blocking I/O set ``_io_workers`` so the calls
+    run on a dedicated thread pool of that size instead of the event loop.
     """
 
-    def __init__(self, ttl: float) -> None:
+    _io_workers: int = 0
+
+    def __init__(
+        self,
+        ttl: float | TTLPolicy,
+        *,
+        codec: Codec | None = None,
+        stale_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
         self._ttl = ttl
+        self._codec = codec
+        self._stale_ttl = max(stale_ttl, stale_while_revalidate)
+        self._stale_while_revalidate = stale_while_revalidate
+        self._io_lock = threading.Lock()
+        self._io_executor: ThreadPoolExecutor | None = None
+
+    @property
+    def stale_while_revalidate(self) -> float:
+        """Seconds past expiry during which stale entries are served while being revalidated."""
+        return self._stale_while_revalidate
+
+    def _ttl_for(self, key: str) -> float | None:
+        return self._ttl.ttl_for(key) if isinstance(self._ttl, TTLPolicy) else self._ttl
+
+    def _encode(self, body: bytes) -> bytes:
+        return self._codec.encode(body) if self._codec is not None else body
+
+    def _decode(self, body: bytes) -> bytes:
+        return self._codec.decode(body) if self._codec is not None else body
 
     @abstractmethod
     def get(self, key: str) -> CacheEntry | None:
@@ -30,6 +214,34 @@ class ResponseCache(ABC):
     def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
         """Store a response."""
 
+    def get_many(self, keys: Sequence[str]) -> list[CacheEntry | None]:
+        """Look up several keys at once. Backends with a batch lookup override this."""
+        return [self.get(key) for key in keys]
+
+    def get_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        """Return the entry and the seconds since it expired (negative while fresh).
+
+        Unlike ``get()``, expired entries still within *stale_ttl* are returned.
+        The default implementation only knows about fresh entries.
+        """
+        entry = self.get(key)
+        return None if entry is None else (entry, float("-inf"))
+
+    def get_stale_many(self, keys: Sequence[str]) -> list[tuple[CacheEntry, float] | None]:
+        """``get_stale()`` for several keys at once. Backends with a batch lookup override this."""
+        return [self.get_stale(key) for key in keys]
+
+    def refresh(self, key: str) -> None:
+        """Restart the TTL of an entry after it was revalidated. No-op by default."""
+
+    def delete(self, key: str) -> None:
+        """Drop one entry. Backends without targeted deletion clear everything."""
+        self.clear()
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with *prefix*. Clears everything by default."""
+        self.clear()
+
     @abstractmethod
     def clear(self) -> None:
         """Drop all entries."""
@@ -38,90 +250,877 @@ class ResponseCache(ABC):
     def close(self) -> None:
         """Release resources. No-op if not applicable."""
 
+    def _dump(self) -> Iterator[_SnapshotEntry]:
+        """Yield every entry that is fresh or within *stale_ttl*, with its body decoded."""
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+
+    def _load(self, entries: Iterable[_SnapshotEntry]) -> int:
+        """Store *entries* (bodies not yet encoded) in bulk and return how many were stored."""
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+
+    def export_snapshot(self, path: str | Path) -> int:
+        """Write all fresh and revalidatable entries to *path* and return how many were written."""
+        # Start the dump before creating *path*: backends without snapshot
+        # support must not leave an empty, valid-looking snapshot behind.
+        dump = self._dump()
+        first = next(dump, None)
+        count = 0
+        with gzip.open(path, "wb") as stream:
+            stream.write(_SNAPSHOT_MAGIC)
+            for key, expires_at, (status, headers, body) in itertools.chain([] if first is None else [first], dump):
+                key_bytes = key.encode()
+                headers_bytes = json.dumps(headers).encode()
+                stream.write(_SNAPSHOT_RECORD.pack(expires_at, status, len(key_bytes), len(headers_bytes), len(body)))
+                stream.write(key_bytes)
+                stream.write(headers_bytes)
+                stream.write(body)
+                count += 1
+        return count
+
+    def import_snapshot(self, path: str | Path) -> int:
+        """Load a file written by ``export_snapshot()`` and return how many entries were stored.
+
+        Entries keep the expiry they had when exported and replace existing
+        entries with the same key. Those already past *stale_ttl*, or whose
+        key the TTL policy maps to ``None``, are skipped.
+        """
+        now = time.time()
+        with gzip.open(path, "rb") as stream:
+            if stream.read(len(_SNAPSHOT_MAGIC)) != _SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a cache snapshot: {path}")
+            return self._load(
+                (key, expires_at, entry)
+                for key, expires_at, entry in _read_snapshot(stream)
+                if now < expires_at + self._stale_ttl and self._ttl_for(key) is not None
+            )
+
+    async def _run_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        if not self._io_workers:
+            return func(*args)
+        with self._io_lock:
+            if self._io_executor is None:
+                self._io_executor = ThreadPoolExecutor(
+                    max_workers=self._io_workers,
+                    thread_name_prefix="discogs-sdk-cache-io",
+                )
+            executor = self._io_executor
+        return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args))
+
+    def _shutdown_io(self) -> None:
+        """Wait for offloaded calls to finish. Backends call this first in ``close()``."""
+        with self._io_lock:
+            executor, self._io_executor = self._io_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def aget(self, key: str) -> CacheEntry | None:
+        """Async ``get()``."""
+        return await self._run_io(self.get, key)
+
+    async def aget_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        """Async ``get_stale()``."""
+        return await self._run_io(self.get_stale, key)
+
+    async def aset(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+        """Async ``set()``."""
+        await self._run_io(self.set, key, status_code, headers, body)
+
+    async def arefresh(self, key: str) -> None:
+        """Async ``refresh()``."""
+        await self._run_io(self.refresh, key)
+
+    async def adelete(self, key: str) -> None:
+        """Async ``delete()``."""
+        await self._run_io(self.delete, key)
+
+    async def adelete_prefix(self, prefix: str) -> None:
+        """Async ``delete_prefix()``."""
+        await self._run_io(self.delete_prefix, prefix)
+
+    async def aclear(self) -> None:
+        """Async ``clear()``."""
+        await self._run_io(self.clear)
+
 
 class MemoryCache(ResponseCache):
-    """In-memory cache using ``time.monotonic()`` (immune to clock adjustments)."""
+    """In-memory LRU cache using ``time.monotonic()`` (immune to clock adjustments).
+
+    Unbounded by default. Set *max_entries* and/or *max_bytes* to cap memory
+    use; the least recently used entries are evicted first. Expired entries
+    are swept every *sweep_interval* seconds, on the next write. With a
+    *codec*, *max_bytes* counts compressed bodies.
 
-    def __init__(self, ttl: float) -> None:
-        super().__init__(ttl)
+    Hits and misses count fresh lookups; a stale entry counts as a miss.
+    """
+
+    def __init__(
+        self,
+        ttl: float | TTLPolicy,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        sweep_interval: float = 60.0,
+        codec: Codec | None = None,
+        stale_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
+        super().__init__(ttl, codec=codec, stale_ttl=stale_ttl, stale_while_revalidate=stale_while_revalidate)
         self._lock = threading.Lock()
-        self._store: dict[str, tuple[float, int, dict[str, str], bytes]] = {}
+        self._store: OrderedDict[str, tuple[float, int, dict[str, str], bytes]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
-    def get(self, key: str) -> CacheEntry | None:
+    @property
+    def hits(self) -> int:
+        """Number of ``get`` calls answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of ``get`` calls that found no fresh entry."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries dropped to stay within *max_entries* / *max_bytes*."""
+        return self._evictions
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached keys, headers and bodies."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @staticmethod
+    def _entry_size(key: str, headers: dict[str, str], body: bytes) -> int:
+        return len(key) + len(body) + sum(len(k) + len(v) for k, v in headers.items())
+
+    def _remove(self, key: str) -> None:
+        _, _, headers, body = self._store.pop(key)
+        self._size -= self._entry_size(key, headers, body)
+
+    def _sweep(self, now: float) -> None:
+        for key in [k for k, (expires_at, *_) in self._store.items() if now >= expires_at + self._stale_ttl]:
+            self._remove(key)
+        self._next_sweep = now + self._sweep_interval
+
+    def _evict(self) -> None:
+        while self._store and (
+            (self._max_entries is not None and len(self._store) > self._max_entries)
+            or (self._max_bytes is not None and self._size > self._max_bytes)
+        ):
+            self._remove(next(iter(self._store)))
+            self._evictions += 1
+
+    def _lookup(self, key: str) -> tuple[float, int, dict[str, str], bytes, float] | None:
+        """Find an entry that is fresh or within *stale_ttl*; returns it with its seconds past expiry."""
         with self._lock:
             entry = self._store.get(key)
             if entry is None:
+                self._misses += 1
                 return None
             expires_at, status, headers, body = entry
-            if time.monotonic() >= expires_at:
-                del self._store[key]
+            now = time.monotonic()
+            if now >= expires_at + self._stale_ttl:
+                self._remove(key)
+                self._misses += 1
                 return None
-            return status, headers, body
+            self._store.move_to_end(key)
+            if now >= expires_at:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return expires_at, status, headers, body, now - expires_at
 
-    def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+    def get(self, key: str) -> CacheEntry | None:
+        found = self._lookup(key)
+        if found is None or found[4] >= 0:
+            return None
+        _, status, headers, body, _ = found
+        return status, headers, self._decode(body)
+
+    def get_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        found = self._lookup(key)
+        if found is None:
+            return None
+        _, status, headers, body, expired_for = found
+        return (status, headers, self._decode(body)), expired_for
+
+    def refresh(self, key: str) -> None:
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            return
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None:
+                self._store[key] = (time.monotonic() + ttl, *entry[1:])
+                self._store.move_to_end(key)
+
+    def set(
+        self,
+        key: str,
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        *,
+        ttl: float | None = None,
+    ) -> None:
+        """Store a response, for *ttl* seconds instead of the configured TTL when given."""
+        if ttl is None:
+            ttl = self._ttl_for(key)
+            if ttl is None:
+                return
+        body = self._encode(body)
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            if key in self._store:
+                self._remove(key)
+            size = self._entry_size(key, headers, body)
+            if self._max_bytes is not None and size > self._max_bytes:
+                # Would evict everything else and still not fit.
+                return
+            self._store[key] = (now + ttl, status_code, headers, body)
+            self._size += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._store:
+                self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> None:
         with self._lock:
-            self._store[key] = (time.monotonic() + self._ttl, status_code, headers, body)
+            for key in [k for k in self._store if k.startswith(prefix)]:
+                self._remove(key)
 
     def clear(self) -> None:
         with self._lock:
             self._store.clear()
+            self._size = 0
+
+    def _dump(self) -> Iterator[_SnapshotEntry]:
+        with self._lock:
+            items = list(self._store.items())
+        now = time.monotonic()
+        # Translate monotonic expiry times to wall-clock ones.
+        offset = time.time() - now
+        for key, (expires_at, status, headers, body) in items:
+            if now < expires_at + self._stale_ttl:
+                yield key, expires_at + offset, (status, headers, self._decode(body))
+
+    def _load(self, entries: Iterable[_SnapshotEntry]) -> int:
+        offset = time.monotonic() - time.time()
+        count = 0
+        with self._lock:
+            for key, expires_at, (status, headers, body) in entries:
+                body = self._encode(body)
+                if key in self._store:
+                    self._remove(key)
+                self._store[key] = (expires_at + offset, status, headers, body)
+                self._size += self._entry_size(key, headers, body)
+                count += 1
+            self._evict()
+        return count
 
     def close(self) -> None:
         pass
 
 
 class SQLiteCache(ResponseCache):
-    """SQLite-backed cache using ``time.time()`` (survives process restarts)."""
+    """SQLite-backed cache using ``time.time()`` (survives process restarts).
 
-    def __init__(self, ttl: float, cache_dir: Path) -> None:
-        super().__init__(ttl)
+    The database runs in WAL mode. Writes are buffered and committed in one
+    transaction once *batch_size* writes are buffered or *flush_interval*
+    seconds after the first buffered write, whichever comes first, so a burst
+    followed by reads still reaches disk on time; buffered entries are served
+    from memory until then and flushed on ``close()``. The timed flush runs on
+    a short-lived background thread. Reads use a separate connection, so they never
+    wait for a commit in progress. ``AsyncDiscogs`` runs cache calls on two
+    worker threads, so lookups and commits stay off the event loop and a
+    lookup never queues behind a commit.
+
+    Expired rows are removed by ``purge_expired()``, which also runs every
+    *sweep_interval* seconds on a background thread when set. With
+    *max_bytes*, the oldest entries are evicted after each flush to keep the
+    stored keys, headers and bodies within budget.
+
+    With a *codec*, bodies are compressed before they are buffered. Rows
+    written with a different codec (or none) are treated as misses. Rows past
+    their TTL are kept for *stale_ttl* more seconds for revalidation.
+    """
+
+    _io_workers = 2
+
+    def __init__(
+        self,
+        ttl: float | TTLPolicy,
+        cache_dir: Path,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        sweep_interval: float | None = None,
+        codec: Codec | None = None,
+        stale_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
+        super().__init__(ttl, codec=codec, stale_ttl=stale_ttl, stale_while_revalidate=stale_while_revalidate)
+        self._codec_name = codec.name if codec is not None else ""
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        # _lock guards the write buffers, _write_lock the writer connection,
+        # _read_lock the reader connection.
         self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._pending: dict[str, tuple[float, int, dict[str, str], bytes]] = {}
+        self._flushing: dict[str, tuple[float, int, dict[str, str], bytes]] = {}
+        self._last_flush = time.monotonic()
+        self._flush_timer: threading.Thread | None = None
+        self._closing = threading.Event()
+
         cache_dir.mkdir(parents=True, exist_ok=True)
-        self._db: sqlite3.Connection | None = sqlite3.connect(cache_dir / "cache.db", check_same_thread=False)
+        db_path = cache_dir / "cache.db"
+        self._db: sqlite3.Connection | None = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != _SQLITE_SCHEMA_VERSION:
+            # Cached responses are disposable: rebuild the table instead of migrating it.
+            self._db.execute("DROP TABLE IF EXISTS cache_entries")
         self._db.execute(
             "CREATE TABLE IF NOT EXISTS cache_entries ("
             "  key TEXT PRIMARY KEY,"
             "  expires_at REAL NOT NULL,"
+            "  stored_at REAL NOT NULL,"
+            "  size INTEGER NOT NULL,"
             "  status INTEGER NOT NULL,"
             "  headers TEXT NOT NULL,"
+            "  codec TEXT NOT NULL,"
             "  body BLOB NOT NULL"
             ")"
         )
+        self._db.execute("CREATE INDEX IF NOT EXISTS cache_entries_expires_at ON cache_entries (expires_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS cache_entries_stored_at ON cache_entries (stored_at)")
+        self._db.execute(f"PRAGMA user_version = {_SQLITE_SCHEMA_VERSION}")
         self._db.commit()
+        # Upper bound of the stored size; only recomputed exactly when it exceeds max_bytes.
+        self._bytes: int = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        self._reader: sqlite3.Connection | None = sqlite3.connect(db_path, check_same_thread=False)
 
-    def get(self, key: str) -> CacheEntry | None:
+        self._sweeper: threading.Thread | None = None
+        self._stop_sweeper = threading.Event()
+        if sweep_interval is not None:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="discogs-sdk-cache-sweep",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+    def _sweep_loop(self, interval: float) -> None:
+        while not self._stop_sweeper.wait(interval):
+            self.purge_expired()
+
+    def _buffered(self, key: str) -> tuple[float, int, dict[str, str], bytes] | None:
         with self._lock:
+            return self._pending.get(key) or self._flushing.get(key)
+
+    def _delete_row(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+        with self._write_lock:
             assert self._db is not None
-            row = self._db.execute(
-                "SELECT expires_at, status, headers, body FROM cache_entries WHERE key = ?",
-                (key,),
-            ).fetchone()
+            self._db.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _lookup(self, key: str) -> tuple[float, int, dict[str, str], bytes] | None:
+        """Find an entry that is fresh or within *stale_ttl*, deleting it once past that."""
+        entry = self._buffered(key)
+        if entry is None:
+            with self._read_lock:
+                assert self._reader is not None
+                row = self._reader.execute(
+                    "SELECT expires_at, status, headers, codec, body FROM cache_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
             if row is None:
                 return None
-            expires_at, status, headers_json, body = row
-            if time.time() >= expires_at:
-                self._db.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
-                self._db.commit()
+            expires_at, status, headers_json, codec_name, body = row
+            if codec_name != self._codec_name:
                 return None
-            return status, json.loads(headers_json), bytes(body)
+            entry = (expires_at, status, json.loads(headers_json), bytes(body))
+        if time.time() >= entry[0] + self._stale_ttl:
+            self._delete_row(key)
+            return None
+        return entry
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        expires_at, status, headers, body = entry
+        if time.time() >= expires_at:
+            return None
+        return status, headers, self._decode(body)
+
+    def get_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        expires_at, status, headers, body = entry
+        return (status, headers, self._decode(body)), time.time() - expires_at
+
+    def refresh(self, key: str) -> None:
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is not None:
+                self._pending[key] = (expires_at, *entry[1:])
+                return
+        with self._write_lock:
+            if self._db is None:
+                return
+            self._db.execute("UPDATE cache_entries SET expires_at = ? WHERE key = ?", (expires_at, key))
+            self._db.commit()
 
     def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            return
+        body = self._encode(body)
         with self._lock:
+            self._pending[key] = (time.time() + ttl, status_code, headers, body)
+            due = len(self._pending) >= self._batch_size or time.monotonic() - self._last_flush >= self._flush_interval
+            if not due and self._flush_timer is None:
+                self._flush_timer = threading.Thread(
+                    target=self._flush_later, name="discogs-sdk-cache-flush", daemon=True
+                )
+                self._flush_timer.start()
+        if due:
+            self.flush()
+
+    def _flush_later(self) -> None:
+        """Commit *flush_interval* seconds after the first buffered write (or on ``close()``)."""
+        self._closing.wait(self._flush_interval)
+        with self._lock:
+            self._flush_timer = None
+        if self._db is not None:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes to disk."""
+        with self._write_lock:
+            with self._lock:
+                # Keep the batch visible to readers until it is committed.
+                self._flushing, self._pending = self._pending, {}
+                batch = self._flushing
+                self._last_flush = time.monotonic()
+            if batch and self._db is not None:
+                self._insert((key, *entry) for key, entry in batch.items())
+            with self._lock:
+                self._flushing = {}
+
+    def _insert(self, entries: Iterable[tuple[str, float, int, dict[str, str], bytes]]) -> int:
+        """Write encoded entries in one transaction and return how many. Caller holds ``_write_lock``."""
+        assert self._db is not None
+        stored_at = time.time()
+        count = 0
+
+        def rows() -> Iterator[tuple[str, float, float, int, int, str, str, bytes]]:
+            nonlocal count
+            for key, expires_at, status, headers, body in entries:
+                headers_json = json.dumps(headers)
+                size = len(key) + len(headers_json) + len(body)
+                self._bytes += size
+                count += 1
+                yield key, expires_at, stored_at, size, status, headers_json, self._codec_name, body
+
+        self._db.executemany(
+            "INSERT OR REPLACE INTO cache_entries"
+            " (key, expires_at, stored_at, size, status, headers, codec, body)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows(),
+        )
+        self._db.commit()
+        if self._max_bytes is not None and self._bytes > self._max_bytes:
+            self._evict()
+        return count
+
+    def _evict(self) -> None:
+        """Delete the oldest rows until the stored size fits in *max_bytes*. Caller holds ``_write_lock``."""
+        assert self._db is not None and self._max_bytes is not None
+        self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        excess = self._bytes - self._max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM cache_entries ORDER BY stored_at"):
+            victims.append((key,))
+            excess -= size
+            self._bytes -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+        self._db.commit()
+
+    def purge_expired(self) -> int:
+        """Delete entries past their TTL and *stale_ttl*, and return how many rows were removed."""
+        now = time.time()
+        with self._lock:
+            for key in [k for k, (expires_at, *_) in self._pending.items() if now >= expires_at + self._stale_ttl]:
+                del self._pending[key]
+        with self._write_lock:
+            if self._db is None:
+                return 0
+            deleted = self._db.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (now - self._stale_ttl,)
+            ).rowcount
+            self._db.commit()
+            self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+            return deleted
+
+    def delete(self, key: str) -> None:
+        self._delete_row(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        if not prefix:
+            self.clear()
+            return
+        # Range scan on the primary key: every key starting with prefix sorts in [prefix, upper).
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        with self._lock:
+            for key in [k for k in self._pending if k.startswith(prefix)]:
+                del self._pending[key]
+        with self._write_lock:
             assert self._db is not None
-            self._db.execute(
-                "INSERT OR REPLACE INTO cache_entries (key, expires_at, status, headers, body) VALUES (?, ?, ?, ?, ?)",
-                (key, time.time() + self._ttl, status_code, json.dumps(headers), body),
-            )
+            self._db.execute("DELETE FROM cache_entries WHERE key >= ? AND key < ?", (prefix, upper))
             self._db.commit()
 
     def clear(self) -> None:
-        with self._lock:
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
             assert self._db is not None
             self._db.execute("DELETE FROM cache_entries")
             self._db.commit()
+            self._bytes = 0
+
+    def _dump(self) -> Iterator[_SnapshotEntry]:
+        self.flush()
+        with self._read_lock:
+            assert self._reader is not None
+            rows = self._reader.execute(
+                "SELECT key, expires_at, status, headers, body FROM cache_entries WHERE codec = ? AND expires_at > ?",
+                (self._codec_name, time.time() - self._stale_ttl),
+            )
+            for key, expires_at, status, headers_json, body in rows:
+                yield key, expires_at, (status, json.loads(headers_json), self._decode(bytes(body)))
+
+    def _load(self, entries: Iterable[_SnapshotEntry]) -> int:
+        """Insert all *entries* in a single transaction, bypassing the write buffer."""
+
+        def encoded() -> Iterator[tuple[str, float, int, dict[str, str], bytes]]:
+            for key, expires_at, (status, headers, body) in entries:
+                with self._lock:
+                    self._pending.pop(key, None)
+                yield key, expires_at, status, headers, self._encode(body)
+
+        with self._write_lock:
+            return self._insert(encoded())
 
     def close(self) -> None:
-        with self._lock:
+        self._shutdown_io()
+        self._closing.set()
+        timer = self._flush_timer
+        if timer is not None:
+            timer.join()
+        if self._sweeper is not None:
+            self._stop_sweeper.set()
+            self._sweeper.join()
+            self._sweeper = None
+        self.flush()
+        with self._write_lock, self._read_lock:
             if self._db is not None:
                 self._db.close()
                 self._db = None
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+
+class TieredCache(ResponseCache):
+    """Two-level cache: a bounded *memory* cache in front of a *persistent* one.
+
+    Lookups try *memory* first and fall back to *persistent*; fresh entries
+    found there are promoted into memory for the rest of their lifetime, so
+    hot keys are served at dict speed while the cold tail survives restarts.
+    TTLs, revalidation windows and compression are those of each layer.
+
+    Writes go to both layers. With *write_behind*, the *persistent* write is
+    deferred to a background thread and ``flush()`` waits for it; pending
+    writes are flushed on ``close()``. The async interface serves memory hits
+    inline and only awaits the persistent layer's coroutines on a miss.
+    Deletions run on a worker thread, so that, as in the sync interface, they
+    wait for a write-behind flush in progress instead of racing it.
+    """
+
+    def __init__(self, memory: MemoryCache, persistent: ResponseCache, *, write_behind: bool = False) -> None:
+        super().__init__(
+            persistent._ttl,
+            stale_ttl=persistent._stale_ttl,
+            stale_while_revalidate=persistent.stale_while_revalidate,
+        )
+        self._memory = memory
+        self._persistent = persistent
+        self._write_behind = write_behind
+        # _lock guards the write-behind buffer, _write_lock serializes writes to the persistent layer.
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: dict[str, tuple[int, dict[str, str], bytes]] = {}
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer: threading.Thread | None = None
+        if write_behind:
+            self._writer = threading.Thread(target=self._write_loop, name="discogs-sdk-cache-writer", daemon=True)
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.flush()
+            if self._closed:
+                return
+
+    def flush(self) -> None:
+        """Write deferred entries to the persistent layer."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            for key, (status_code, headers, body) in batch.items():
+                self._persistent.set(key, status_code, headers, body)
+
+    def _promote(self, key: str, entry: CacheEntry, remaining: float) -> None:
+        ttl = self._memory._ttl_for(key)
+        if ttl is not None:
+            self._memory.set(key, *entry, ttl=min(ttl, remaining))
+
+    def _local(self, key: str) -> CacheEntry | None:
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            return self._pending.get(key)
+
+    def _found(self, key: str, found: tuple[CacheEntry, float] | None) -> tuple[CacheEntry, float] | None:
+        if found is not None and found[1] < 0:
+            self._promote(key, found[0], -found[1])
+        return found
+
+    def get(self, key: str) -> CacheEntry | None:
+        found = self.get_stale(key)
+        return found[0] if found is not None and found[1] < 0 else None
+
+    def get_many(self, keys: Sequence[str]) -> list[CacheEntry | None]:
+        results = [self._memory.get(key) for key in keys]
+        with self._lock:
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = self._pending.get(key)
+        misses = [i for i, entry in enumerate(results) if entry is None]
+        if misses:
+            for i, found in zip(misses, self._persistent.get_stale_many([keys[i] for i in misses])):
+                found = self._found(keys[i], found)
+                if found is not None and found[1] < 0:
+                    results[i] = found[0]
+        return results
+
+    def get_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        entry = self._local(key)
+        if entry is not None:
+            return entry, float("-inf")
+        # Only the persistent layer is consulted for stale entries, so both layers agree on their age.
+        return self._found(key, self._persistent.get_stale(key))
+
+    async def aget_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        entry = self._local(key)
+        if entry is not None:
+            return entry, float("-inf")
+        return self._found(key, await self._persistent.aget_stale(key))
+
+    async def aget(self, key: str) -> CacheEntry | None:
+        found = await self.aget_stale(key)
+        return found[0] if found is not None and found[1] < 0 else None
+
+    def _set_local(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> bool:
+        """Write to memory and, with *write_behind*, queue the persistent write. Return whether it was queued."""
+        self._memory.set(key, status_code, headers, body)
+        if not self._write_behind:
+            return False
+        with self._lock:
+            self._pending[key] = (status_code, headers, body)
+        self._wakeup.set()
+        return True
+
+    def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+        if not self._set_local(key, status_code, headers, body):
+            with self._write_lock:
+                self._persistent.set(key, status_code, headers, body)
+
+    async def aset(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+        if not self._set_local(key, status_code, headers, body):
+            await self._persistent.aset(key, status_code, headers, body)
+
+    def _refresh_local(self, key: str) -> bool:
+        """Refresh the memory layer. Return whether the persistent layer needs refreshing too."""
+        self._memory.refresh(key)
+        with self._lock:
+            # A queued write restarts the persistent TTL when it lands.
+            return key not in self._pending
+
+    def refresh(self, key: str) -> None:
+        if self._refresh_local(key):
+            self._persistent.refresh(key)
+
+    async def arefresh(self, key: str) -> None:
+        if self._refresh_local(key):
+            await self._persistent.arefresh(key)
+
+    def _delete_local(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+        self._memory.delete(key)
+
+    def _delete_prefix_local(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._pending if k.startswith(prefix)]:
+                del self._pending[key]
+        self._memory.delete_prefix(prefix)
+
+    def delete(self, key: str) -> None:
+        with self._write_lock:
+            self._delete_local(key)
+            self._persistent.delete(key)
+
+    async def adelete(self, key: str) -> None:
+        await asyncio.to_thread(self.delete, key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._write_lock:
+            self._delete_prefix_local(prefix)
+            self._persistent.delete_prefix(prefix)
+
+    async def adelete_prefix(self, prefix: str) -> None:
+        await asyncio.to_thread(self.delete_prefix, prefix)
+
+    async def aclear(self) -> None:
+        await asyncio.to_thread(self.clear)
+
+    def clear(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._pending.clear()
+            self._memory.clear()
+            self._persistent.clear()
+
+    def _dump(self) -> Iterator[_SnapshotEntry]:
+        self.flush()
+        return self._persistent._dump()
+
+    def _load(self, entries: Iterable[_SnapshotEntry]) -> int:
+        """Load into the persistent layer; entries reach memory as they are looked up."""
+
+        def replacing() -> Iterator[_SnapshotEntry]:
+            for entry in entries:
+                self._delete_local(entry[0])
+                yield entry
+
+        with self._write_lock:
+            return self._persistent._load(replacing())
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._closed = True
+            self._wakeup.set()
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        self._memory.close()
+        self._persistent.close()
+
+
+class ModelCache:
+    """In-process LRU of validated models, layered over a ``ResponseCache``.
+
+    Entries are keyed by cache key and model class and remember a digest of
+    the body they were parsed from, so a hit requires the response cache to
+    hand back that same body: replaced entries are parsed again.
+
+    Hits return a shallow copy (``model_copy()``), skipping JSON parsing and
+    validation. Nested objects are shared between callers and must be treated
+    as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._lock = threading.Lock()
+        self._store: OrderedDict[tuple[str, type[BaseModel]], tuple[bytes, BaseModel]] = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of ``get`` calls answered with a cached model."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of ``get`` calls that had to fall back to parsing."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @staticmethod
+    def _digest(body: bytes) -> bytes:
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: str, model_cls: type[_M], body: bytes) -> _M | None:
+        """Return a copy of the model parsed from *body*, or ``None``."""
+        digest = self._digest(body)
+        with self._lock:
+            entry = self._store.get((key, model_cls))
+            if entry is None or entry[0] != digest:
+                self._misses += 1
+                return None
+            self._store.move_to_end((key, model_cls))
+            self._hits += 1
+        return entry[1].model_copy()  # type: ignore[return-value]
+
+    def set(self, key: str, model_cls: type[_M], body: bytes, model: _M) -> None:
+        """Remember *model* as the result of validating *body* with *model_cls*."""
+        digest = self._digest(body)
+        with self._lock:
+            self._store[(key, model_cls)] = (digest, model.model_copy())
+            self._store.move_to_end((key, model_cls))
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
@@ -0,0 +1,96 @@
+"""Incremental parsing of inventory export CSVs into typed rows."""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+from collections.abc import Callable
+from typing import Any
+
+from discogs_sdk.models.export import ExportedListing
+
+
+def _bool(value: str) -> bool:
+    return value.strip().lower() in {"y", "yes", "true", "1"}
+
+
+# How the columnar output converts each known column; others stay strings.
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "accept_offer": _bool,
+    "flat_shipping": float,
+    "format_quantity": int,
+    "listing_id": int,
+    "price": float,
+    "release_id": int,
+    "weight": float,
+}
+
+# CSV column -> ExportedListing field, where they differ (``catno`` -> ``catalog_number``).
+_FIELD_NAMES = {
+    field.validation_alias: name
+    for name, field in ExportedListing.model_fields.items()
+    if isinstance(field.validation_alias, str)
+}
+
+
+class ExportCSVParser:
+    """Push parser for an export CSV arriving in arbitrary byte chunks.
+
+    ``feed()`` each chunk as it arrives and ``close()`` at the end; both
+    return the rows completed so far as lists of cells. The first row is
+    taken as the header. Only the current partial record is buffered, so
+    memory use does not depend on the file size. Complete records are
+    handed to the ``csv`` module in bulk; a chunk is cut at its last line
+    end outside quotes, so multi-line quoted fields and multi-byte
+    characters survive chunk boundaries.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._pending = ""  # text after the last complete record
+        self.header: list[str] | None = None
+
+    def feed(self, chunk: bytes) -> list[list[str]]:
+        return self._parse(self._decoder.decode(chunk), final=False)
+
+    def close(self) -> list[list[str]]:
+        return self._parse(self._decoder.decode(b"", final=True), final=True)
+
+    def listing(self, row: list[str]) -> ExportedListing:
+        """Validate *row* into an ``ExportedListing``; empty cells become ``None``."""
+        assert self.header is not None
+        return ExportedListing.model_validate({column: value for column, value in zip(self.header, row) if value})
+
+    def columns(self, rows: list[list[str]]) -> dict[str, list[Any]]:
+        """Transpose *rows* into one list per column, keyed by ``ExportedListing`` field name.
+
+        Numeric and boolean columns are converted and empty cells become
+        ``None``, without building a model per row.
+        """
+        assert self.header is not None
+        names = [_FIELD_NAMES.get(column, column) for column in self.header]
+        converters = [_CONVERTERS.get(column, str) for column in self.header]
+        lists: list[list[Any]] = [[] for _ in names]
+        for row in rows:
+            for values, convert, value in zip(lists, converters, row):
+                values.append(convert(value) if value else None)
+            for values in lists[len(row) :]:
+                values.append(None)
+        return dict(zip(names, lists))
+
+    def _parse(self, text: str, *, final: bool) -> list[list[str]]:
+        pending = self._pending + text
+        cut = len(pending) if final else pending.rfind("\n") + 1
+        # A line end closes a record only outside quotes, i.e. after an even
+        # number of quote characters (an escaped quote "" counts twice).
+        quotes = pending.count('"', 0, cut)
+        while quotes % 2 and cut and not final:
+            previous = pending.rfind("\n", 0, cut - 1) + 1
+            quotes -= pending.count('"', previous, cut)
+            cut = previous
+        self._pending = pending[cut:]
+        rows = [row for row in csv.reader(io.StringIO(pending[:cut], newline="")) if row]
+        if self.header is None and rows:
+            self.header = [column.strip() for column in rows.pop(0)]
+        return rows
@@ -0,0 +1,98 @@
+"""File sources for inventory uploads, streamed from disk in constant memory."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from collections.abc import Callable, Iterator
+from itertools import islice
+from typing import Any, BinaryIO
+
+# A path to open, or a binary file object (seekable, so retries can rewind it).
+FileSource = str | os.PathLike[str] | BinaryIO
+
+# Called with ``(bytes_sent, total_bytes)``; *total_bytes* is ``None`` when unknown.
+ProgressCallback = Callable[[int, int | None], None]
+
+
+def open_source(path: str | os.PathLike[str]) -> BinaryIO:
+    """Open a path ``FileSource`` for reading."""
+    return open(os.fspath(path), "rb")
+
+
+class NamedBytesIO(io.BytesIO):
+    """In-memory file with a ``name``, sent as the file name in multipart bodies."""
+
+    def __init__(self, data: bytes, name: str) -> None:
+        super().__init__(data)
+        self.name = name
+
+
+def upload_name(file: BinaryIO) -> str:
+    """File name sent in the multipart body: the basename of ``file.name``, if any."""
+    name = getattr(file, "name", None)
+    return os.path.basename(name) if isinstance(name, str) else "upload.csv"
+
+
+def split_csv(file: BinaryIO, rows_per_chunk: int) -> Iterator[tuple[bytes, int]]:
+    """Split a UTF-8 CSV into chunks of at most *rows_per_chunk* rows, each starting with the header row.
+
+    Yields ``(chunk, row_count)`` pairs lazily, so only one chunk is held in
+    memory at a time. Rows go through the ``csv`` module, so quoted fields
+    spanning several lines are never split. *file* is left open.
+    """
+    if rows_per_chunk < 1:
+        raise ValueError("rows_per_chunk must be >= 1")
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        while rows := list(islice(reader, rows_per_chunk)):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(header)
+            writer.writerows(rows)
+            yield buffer.getvalue().encode(), len(rows)
+    finally:
+        text.detach()
+
+
+class ProgressReader:
+    """Binary file wrapper that reports progress to *callback* as it is read.
+
+    httpx reads multipart file fields in fixed-size chunks and rewinds them
+    before each retry; rewinding restarts the count.
+    """
+
+    def __init__(self, file: BinaryIO, callback: ProgressCallback) -> None:
+        self._file = file
+        self._callback = callback
+        self._position = 0
+        self._total: int | None
+        try:
+            # httpx sends the whole file: it rewinds to the start before reading.
+            start = file.tell()
+            self._total = file.seek(0, os.SEEK_END)
+            file.seek(start)
+        except OSError:
+            self._total = None
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        if chunk:
+            self._position += len(chunk)
+            self._callback(self._position, self._total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._position = self._file.seek(offset, whence)
+        return self._position
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
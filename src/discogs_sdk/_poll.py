@@ -0,0 +1,80 @@
+"""Polling schedule for long-running Discogs jobs (inventory uploads and exports)."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from typing import Protocol, TypeVar
+
+# Statuses of jobs that have not finished yet; anything else is final.
+_PENDING_STATUSES = frozenset({"", "pending", "queued", "processing", "in progress"})
+# Final statuses of jobs that produced nothing usable.
+_FAILED_STATUSES = frozenset({"failed", "failure", "error", "cancelled", "canceled"})
+
+
+class _Job(Protocol):
+    @property
+    def finished_at(self) -> str | None: ...
+
+    @property
+    def status(self) -> str | None: ...
+
+
+# Generic, so that ``poll_until(fetch, is_finished, ...)`` keeps the job's own type.
+_J = TypeVar("_J", bound=_Job)
+
+
+def is_finished(job: _J) -> bool:
+    """Whether an ``Upload`` or ``Export`` has reached a final status."""
+    return job.finished_at is not None or (job.status or "").lower() not in _PENDING_STATUSES
+
+
+def is_failed(job: _Job) -> bool:
+    """Whether a finished job ended in failure."""
+    return (job.status or "").lower() in _FAILED_STATUSES
+
+
+class PollPolicy:
+    """How often to check on a background job until it finishes.
+
+    The first check happens right away. Later ones wait *initial* seconds,
+    then *factor* times longer each time up to *maximum*: quick jobs are
+    picked up promptly while slow ones cost few requests. Each wait is
+    randomized by up to *jitter* (a fraction of it) so jobs started together
+    do not poll in lockstep. Checks go through the client's rate limiter
+    like any other request. Polling gives up with ``TimeoutError`` once
+    *timeout* seconds have passed (``None`` waits forever).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = 2.0,
+        maximum: float = 60.0,
+        factor: float = 2.0,
+        jitter: float = 0.1,
+        timeout: float | None = 3600.0,
+    ) -> None:
+        if initial <= 0 or maximum < initial:
+            raise ValueError("need 0 < initial <= maximum")
+        if factor < 1:
+            raise ValueError("factor must be >= 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        self._initial = initial
+        self._maximum = maximum
+        self._factor = factor
+        self._jitter = jitter
+        self._timeout = timeout
+
+    @property
+    def timeout(self) -> float | None:
+        """Seconds after which polling gives up, or ``None``."""
+        return self._timeout
+
+    def delays(self) -> Iterator[float]:
+        """Yield the successive waits between checks, forever."""
+        delay = self._initial
+        while True:
+            yield delay * (1 + random.uniform(-self._jitter, self._jitter))
+            delay = min(delay * self._factor, self._maximum)
@@ -0,0 +1,99 @@
+"""Client-side rate limiter driven by the ``X-Discogs-Ratelimit*`` response headers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Mapping
+
+# Discogs counts requests over a moving 60-second window.
+DEFAULT_WINDOW = 60.0
+
+
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket that paces outgoing requests to stay under the server's limit.
+
+    The bucket is sized from ``X-Discogs-Ratelimit`` and refills continuously
+    over the window. Every response re-synchronizes it with the server's view
+    via ``X-Discogs-Ratelimit-Remaining`` (or ``-Used``), so requests made by
+    other processes sharing the same credentials are accounted for too.
+
+    Until the first rate limit headers arrive, no pacing is applied.
+
+    The limiter only computes delays; callers sleep outside the lock, which
+    makes a single instance safe to share across threads and coroutines.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self._limit: int | None = None
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+
+    @property
+    def limit(self) -> int | None:
+        """Requests allowed per window, or ``None`` until the server has reported it."""
+        return self._limit
+
+    @property
+    def remaining(self) -> float | None:
+        """Estimated requests left in the current window, or ``None`` if unknown."""
+        with self._lock:
+            if self._limit is None:
+                return None
+            self._refill(time.monotonic())
+            return max(self._tokens, 0.0)
+
+    def _refill(self, now: float) -> None:
+        assert self._limit is not None
+        elapsed = now - self._updated_at
+        self._tokens = min(float(self._limit), self._tokens + elapsed * self._limit / self._window)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Reserve a slot for one request and return how long to wait before sending it."""
+        with self._lock:
+            if not self._limit:
+                return 0.0
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self._window / self._limit
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Re-synchronize the bucket with the rate limit headers of a response."""
+        limit = _parse_int(headers.get("X-Discogs-Ratelimit"))
+        remaining = _parse_int(headers.get("X-Discogs-Ratelimit-Remaining"))
+        if remaining is None and limit is not None:
+            used = _parse_int(headers.get("X-Discogs-Ratelimit-Used"))
+            if used is not None:
+                remaining = limit - used
+        if limit is None and remaining is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if self._limit is None:
+                # First report: trust the server entirely.
+                self._limit = limit if limit is not None else remaining
+                self._tokens = float(remaining if remaining is not None else self._limit or 0)
+                self._updated_at = now
+                return
+            if limit is not None:
+                self._limit = limit
+            self._refill(now)
+            if remaining is not None:
+                # Slots reserved for in-flight requests are not reflected in the
+                # server's count yet, so never raise the local estimate.
+                self._tokens = min(self._tokens, float(remaining))
@@ -0,0 +1,290 @@
+"""Shared response cache on a Redis-protocol store."""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import re
+import socket
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import IO, Any
+from urllib.parse import unquote, urlsplit
+
+from discogs_sdk._cache import CacheEntry, Codec, ResponseCache, TTLPolicy, _SnapshotEntry
+
+logger = logging.getLogger("discogs_sdk")
+
+_Reply = Any  # bytes | int | str | list[_Reply] | None
+
+# Characters with a special meaning in Redis glob patterns (SCAN MATCH).
+_GLOB_SPECIAL = re.compile(r"([*?\[\]\\])")
+
+
+class RedisError(Exception):
+    """Error reply from the Redis server."""
+
+
+def _encode_command(args: Sequence[str | bytes | int | float]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _read_reply(stream: IO[bytes]) -> _Reply:
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by Redis server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [_read_reply(stream) for _ in range(length)]
+    raise RedisError(f"Unexpected reply from Redis server: {line!r}")
+
+
+class _Connection:
+    """One RESP2 connection. Commands are sent as a pipeline and replies read back in order."""
+
+    def __init__(self, host: str, port: int, *, password: str | None, db: int, timeout: float) -> None:
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._stream = self._sock.makefile("rb")
+        setup: list[tuple[str | bytes | int | float, ...]] = []
+        if password is not None:
+            setup.append(("AUTH", password))
+        if db:
+            setup.append(("SELECT", db))
+        if setup:
+            self.pipeline(setup)
+
+    def pipeline(self, commands: Sequence[tuple[str | bytes | int | float, ...]]) -> list[_Reply]:
+        self._sock.sendall(b"".join(_encode_command(command) for command in commands))
+        replies = [_read_reply(self._stream) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def close(self) -> None:
+        self._stream.close()
+        self._sock.close()
+
+
+class RedisCache(ResponseCache):
+    """Cache shared between processes and hosts through a Redis-protocol server.
+
+    Speaks RESP2 directly over a small connection pool, so no Redis client
+    library is needed; any compatible server (Redis, Valkey, KeyDB, ...) works.
+    Expiry is delegated to the server: entries are written with ``PX`` set to
+    their TTL plus *stale_ttl*. Keys are prefixed with *namespace*, and
+    ``clear()`` only removes keys in that namespace.
+
+    Server or network failures are logged and treated as cache misses, so an
+    unavailable cache never fails a request. After a connection failure the
+    server is not contacted again for *retry_after* seconds, so requests do
+    not each wait out *timeout* while it is down. ``AsyncDiscogs`` runs its cache
+    calls on up to *max_connections* worker threads, one per connection.
+    """
+
+    def __init__(
+        self,
+        ttl: float | TTLPolicy,
+        url: str = "redis://localhost:6379/0",
+        *,
+        namespace: str = "discogs-sdk:",
+        max_connections: int = 10,
+        timeout: float = 5.0,
+        retry_after: float = 1.0,
+        codec: Codec | None = None,
+        stale_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
+        super().__init__(ttl, codec=codec, stale_ttl=stale_ttl, stale_while_revalidate=stale_while_revalidate)
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"Unsupported Redis URL scheme: {parts.scheme!r}")
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port or 6379
+        self._password = unquote(parts.password) if parts.password else None
+        self._db = int(parts.path.lstrip("/") or 0)
+        self._timeout = timeout
+        self._retry_after = retry_after
+        # Monotonic time before which the server is assumed down.
+        self._down_until = 0.0
+        self._namespace = namespace
+        self._codec_name = codec.name if codec is not None else ""
+        self._pool: queue.LifoQueue[_Connection] = queue.LifoQueue(maxsize=max_connections)
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._io_workers = max_connections
+
+    @contextmanager
+    def _connection(self) -> Iterator[_Connection]:
+        with self._slots:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = _Connection(self._host, self._port, password=self._password, db=self._db, timeout=self._timeout)
+            try:
+                yield conn
+            except BaseException:
+                # The connection may be mid-reply: never hand it out again.
+                conn.close()
+                raise
+            self._pool.put_nowait(conn)
+
+    def _execute(self, *commands: tuple[str | bytes | int | float, ...]) -> list[_Reply]:
+        if time.monotonic() < self._down_until:
+            raise ConnectionError("Redis server recently unreachable, not retrying yet")
+        try:
+            with self._connection() as conn:
+                return conn.pipeline(commands)
+        except OSError:
+            self._down_until = time.monotonic() + self._retry_after
+            raise
+
+    def _key(self, key: str) -> str:
+        return self._namespace + key
+
+    def _pack(self, status_code: int, headers: dict[str, str], body: bytes, expires_at: float) -> bytes:
+        meta = {"s": status_code, "h": headers, "e": expires_at, "c": self._codec_name}
+        # json.dumps escapes newlines, so the first one separates metadata from the body.
+        return json.dumps(meta).encode() + b"\n" + self._encode(body)
+
+    def _unpack(self, value: bytes) -> tuple[CacheEntry, float] | None:
+        meta_json, _, body = value.partition(b"\n")
+        try:
+            meta = json.loads(meta_json)
+            if meta["c"] != self._codec_name:
+                return None
+            return (meta["s"], meta["h"], self._decode(body)), meta["e"]
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Unreadable Redis cache entry, treating it as a miss: %s", exc)
+            return None
+
+    def _lookup_many(self, keys: Sequence[str]) -> list[tuple[CacheEntry, float] | None]:
+        if not keys:
+            return []
+        try:
+            (values,) = self._execute(("MGET", *(self._key(key) for key in keys)))
+        except (OSError, RedisError) as exc:
+            logger.warning("Redis cache unavailable, treating lookup as a miss: %s", exc)
+            return [None] * len(keys)
+        return [None if value is None else self._unpack(value) for value in values]
+
+    def get(self, key: str) -> CacheEntry | None:
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> list[CacheEntry | None]:
+        """Fetch several entries with a single ``MGET`` round trip."""
+        now = time.time()
+        return [found[0] if found is not None and now < found[1] else None for found in self._lookup_many(keys)]
+
+    def get_stale(self, key: str) -> tuple[CacheEntry, float] | None:
+        return self.get_stale_many([key])[0]
+
+    def get_stale_many(self, keys: Sequence[str]) -> list[tuple[CacheEntry, float] | None]:
+        """Fetch several entries, expired ones included, with a single ``MGET`` round trip."""
+        now = time.time()
+        return [None if found is None else (found[0], now - found[1]) for found in self._lookup_many(keys)]
+
+    def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            return
+        value = self._pack(status_code, headers, body, time.time() + ttl)
+        self._store(key, value, ttl)
+
+    def _store(self, key: str, value: bytes, ttl: float) -> None:
+        px = max(1, int((ttl + self._stale_ttl) * 1000))
+        try:
+            self._execute(("SET", self._key(key), value, "PX", px))
+        except (OSError, RedisError) as exc:
+            logger.warning("Redis cache unavailable, dropping write: %s", exc)
+
+    def refresh(self, key: str) -> None:
+        ttl = self._ttl_for(key)
+        if ttl is None:
+            return
+        found = self._lookup_many([key])[0]
+        if found is not None:
+            (status, headers, body), _ = found
+            self._store(key, self._pack(status, headers, body, time.time() + ttl), ttl)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._execute(("DEL", self._key(key)))
+        except (OSError, RedisError) as exc:
+            logger.warning("Redis cache unavailable, could not delete %s: %s", key, exc)
+
+    def delete_prefix(self, prefix: str) -> None:
+        pattern = _GLOB_SPECIAL.sub(r"\\\1", self._key(prefix)) + "*"
+        try:
+            cursor = b"0"
+            while True:
+                ((cursor, keys),) = self._execute(("SCAN", cursor, "MATCH", pattern, "COUNT", 500))
+                if keys:
+                    self._execute(("DEL", *keys))
+                if cursor == b"0":
+                    break
+        except (OSError, RedisError) as exc:
+            logger.warning("Redis cache unavailable, could not delete %s*: %s", prefix, exc)
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+    def _dump(self) -> Iterator[_SnapshotEntry]:
+        pattern = _GLOB_SPECIAL.sub(r"\\\1", self._namespace) + "*"
+        now = time.time()
+        cursor = b"0"
+        while True:
+            ((cursor, keys),) = self._execute(("SCAN", cursor, "MATCH", pattern, "COUNT", 500))
+            if keys:
+                (values,) = self._execute(("MGET", *keys))
+                for key, value in zip(keys, values):
+                    found = None if value is None else self._unpack(value)
+                    if found is not None and now < found[1] + self._stale_ttl:
+                        yield key.decode()[len(self._namespace) :], found[1], found[0]
+            if cursor == b"0":
+                break
+
+    def _load(self, entries: Iterable[_SnapshotEntry]) -> int:
+        """Write *entries* with pipelined ``SET`` commands, 500 per round trip."""
+        now = time.time()
+        count = 0
+        batch: list[tuple[str | bytes | int, ...]] = []
+        for key, expires_at, (status, headers, body) in entries:
+            px = max(1, int((expires_at + self._stale_ttl - now) * 1000))
+            batch.append(("SET", self._key(key), self._pack(status, headers, body, expires_at), "PX", px))
+            count += 1
+            if len(batch) == 500:
+                self._execute(*batch)
+                batch = []
+        if batch:
+            self._execute(*batch)
+        return count
+
+    def close(self) -> None:
+        self._shutdown_io()
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -2,25 +2,45 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+import json
 import logging
+import re
+import threading
 import time
 from collections.abc import Generator
+from concurrent.futures import Future
 from contextlib import contextmanager
+from collections.abc import Iterator, Iterable
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 from typing_extensions import Self
 import httpx
+from pydantic import BaseModel
 from discogs_sdk._base_client import (
     DEFAULT_BASE_URL,
     DEFAULT_CACHE_TTL,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_TIMEOUT,
     BaseClient,
     MediaType,
     _RETRY_STATUSES,
 )
-from discogs_sdk._cache import MemoryCache, ResponseCache, SQLiteCache
+from discogs_sdk._cache import (
+    CACHE_KEY_EXTENSION,
+    CacheEntry,
+    MemoryCache,
+    ModelCache,
+    ResponseCache,
+    SQLiteCache,
+    TTLPolicy,
+    conditional_headers,
+)
 from discogs_sdk._exceptions import DiscogsConnectionError
+from discogs_sdk._rate_limit import RateLimiter
+from discogs_sdk._sync._concurrency import map_unordered
 from discogs_sdk._sync.resources.artists import Artists
 from discogs_sdk._sync.resources.exports import Exports
 from discogs_sdk._sync.resources.labels import Labels
@@ -37,6 +57,24 @@ if TYPE_CHECKING:
     from discogs_sdk.models.search import SearchResult
 logger = logging.getLogger("discogs_sdk")
 _CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+_M = TypeVar("_M", bound=BaseModel)
+# Writes that also change a collection outside their own path, with the
+# collections they change. ``{user}`` comes from the written path or, for
+# marketplace listings, from the seller of the cached listing or identity.
+_RELATED_COLLECTIONS: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = (
+    (re.compile("/marketplace/listings(?:/\\d+)?"), ("/users/{user}/inventory",)),
+    (
+        re.compile("/users/(?P<user>[^/]+)/collection/folders/\\d+/releases/\\d+(?:/instances/\\d+)?"),
+        ("/users/{user}/collection/folders/0/releases", "/users/{user}/collection/folders"),
+    ),
+)
+
+
+def _cached_response(cache_key: str, entry: CacheEntry) -> httpx.Response:
+    status, headers, body = entry
+    return httpx.Response(
+        status_code=status, headers=headers, content=body, extensions={CACHE_KEY_EXTENSION: cache_key}
+    )
 
 
 class Discogs(BaseClient):
@@ -61,8 +99,15 @@ class Discogs(BaseClient):
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 3,
         cache: bool | ResponseCache = False,
-        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_ttl: float | TTLPolicy = DEFAULT_CACHE_TTL,
         cache_dir: str | Path | None = None,
+        model_cache: bool | ModelCache = False,
+        rate_limit: bool | RateLimiter = True,
+        coalesce_requests: bool = True,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
         http_client: httpx.Client | None = None,
         user_agent: str | None = None,
         media_type: MediaType = "discogs",
@@ -80,12 +125,31 @@ class Discogs(BaseClient):
             max_retries: Max retries on 429/5xx/connection errors.
             cache: Enable response caching. Pass ``True`` for the built-in
                 backend, or a ``ResponseCache`` instance for a custom one.
-            cache_ttl: Cache time-to-live in seconds (default 1 hour).
+            cache_ttl: Cache time-to-live in seconds (default 1 hour), or a
+                ``TTLPolicy`` choosing it per endpoint.
                 Ignored when *cache* is a ``ResponseCache`` instance or ``False``.
             cache_dir: Directory for the cache database. When provided, uses
                 SQLite for persistence; otherwise caches in memory only.
                 Ignored when *cache* is a ``ResponseCache`` instance or ``False``.
+            model_cache: Keep validated models for cached responses in memory, so
+                cache hits skip JSON parsing and validation. Pass ``True`` for
+                the default size, or a ``ModelCache`` instance. Requires *cache*.
+            rate_limit: Pace requests client-side using the ``X-Discogs-Ratelimit*``
+                response headers so the server limit is never exceeded. Pass a
+                ``RateLimiter`` instance to share one budget across several clients.
+            coalesce_requests: Share one HTTP request between concurrent identical
+                GET/HEAD calls instead of sending one per caller.
+            max_connections: Maximum number of open connections (``None`` for no
+                limit). Bulk fetches, prefetching and cache warm-up never run
+                more requests at once than this, so they cannot time out
+                waiting for a free connection.
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse (``None`` for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Multiplex requests over HTTP/2 connections. Requires the
+                ``h2`` package (``pip install "httpx[http2]"``).
             http_client: Custom ``httpx.Client`` to use instead of creating one.
+                The connection options above are ignored when it is given.
             user_agent: Custom User-Agent string. Replaces the default entirely.
                 Should follow RFC 1945 product token format for best compatibility with Discogs.
             media_type: Response text format. ``"discogs"`` returns Discogs markup,
@@ -107,8 +171,19 @@ class Discogs(BaseClient):
             self._http_client = http_client
             self._owns_client = False
         else:
-            self._http_client = httpx.Client(headers=self._build_headers(), timeout=self.timeout)
+            self._http_client = httpx.Client(
+                headers=self._build_headers(),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+            )
             self._owns_client = True
+        # HTTP/2 multiplexes many requests per connection, and a custom client's pool is unknown.
+        self._max_concurrency = max_connections if http_client is None and (not http2) else None
         self._cache: ResponseCache | None = None
         if isinstance(cache, ResponseCache):
             self._cache = cache
@@ -117,6 +192,24 @@ class Discogs(BaseClient):
                 SQLiteCache(ttl=cache_ttl, cache_dir=Path(cache_dir)) if cache_dir else MemoryCache(ttl=cache_ttl)
             )
         self._cache_enabled: bool = True
+        self._model_cache: ModelCache | None = None
+        if isinstance(model_cache, ModelCache):
+            self._model_cache = model_cache
+        elif model_cache:
+            self._model_cache = ModelCache()
+        self._coalesce_requests = coalesce_requests
+        # Requests in flight by cache key, joined by identical concurrent calls.
+        self._in_flight: dict[str, Future[httpx.Response]] = {}
+        self._in_flight_lock = threading.Lock()
+        # Stale-while-revalidate refreshes running in the background, and the keys they cover.
+        self._revalidating: set[str] = set()
+        self._revalidation_lock = threading.Lock()
+        self._background: set[threading.Thread] = set()
+        self._rate_limiter: RateLimiter | None = None
+        if isinstance(rate_limit, RateLimiter):
+            self._rate_limiter = rate_limit
+        elif rate_limit:
+            self._rate_limiter = RateLimiter()
 
     def _send(
         self,
@@ -126,6 +219,7 @@ class Discogs(BaseClient):
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
+        cache: bool = True,
     ) -> httpx.Response:
         kwargs: dict[str, Any] = {}
         if json is not None:
@@ -137,19 +231,130 @@ class Discogs(BaseClient):
         if self._uses_oauth:
             kwargs.setdefault("headers", {})["Authorization"] = self._build_oauth_header_for_request()
         # Build the full URL for cache key before httpx resolves params.
-        use_cache = self._cache is not None and self._cache_enabled and (method.upper() in _CACHEABLE_METHODS)
-        cache_key = ""
-        if use_cache:
+        cacheable = method.upper() in _CACHEABLE_METHODS
+        use_cache = self._cache is not None and self._cache_enabled and cacheable and cache
+        request_key = ""
+        if use_cache or (cacheable and self._coalesce_requests):
             # httpx merges params into the URL, so we need to build the key
             # the same way to get consistent cache hits.
             req = self._http_client.build_request(method, url, **kwargs)
-            cache_key = f"{method.upper()}:{req.url}"
-            cached = self._cache.get(cache_key)  # type: ignore[union-attr]
+            request_key = f"{method.upper()}:{req.url}"
+        cache_key = request_key if use_cache else ""
+        stale: CacheEntry | None = None
+        if use_cache:
+            cached = self._cache.get_stale(cache_key)  # type: ignore[union-attr]
             if cached is not None:
-                status, headers, body = cached
-                logger.debug("Cache hit: %s %s", method, url)
-                return httpx.Response(status_code=status, headers=headers, content=body)
+                entry, expired_for = cached
+                if expired_for < 0:
+                    logger.debug("Cache hit: %s %s", method, url)
+                    return _cached_response(cache_key, entry)
+                if expired_for < self._cache.stale_while_revalidate:  # type: ignore[union-attr]
+                    logger.debug("Cache hit (stale, revalidating): %s %s", method, url)
+                    self._revalidate_in_background(method, url, kwargs, cache_key, entry)
+                    return _cached_response(cache_key, entry)
+                stale = entry
+        if request_key and self._coalesce_requests:
+            return self._fetch_once(request_key, method, url, kwargs, cache_key=cache_key, stale=stale)
+        response = self._fetch(method, url, kwargs, cache_key=cache_key, stale=stale)
+        if not cacheable and self._cache is not None and (200 <= response.status_code < 300):
+            self._invalidate(url)
+        return response
+
+    def _invalidate(self, url: str) -> None:
+        """Drop cached responses made stale by a successful write to *url*.
+
+        Covers the resource itself and its sub-resources, every page of each
+        collection above it (``/users/{u}/wants/1`` -> ``/users/{u}/wants?...``),
+        and the related collections in ``_RELATED_COLLECTIONS``.
+        """
+        assert self._cache is not None
+        resource = str(httpx.URL(url).copy_with(query=None, fragment=None)).rstrip("/")
+        collections = []
+        ancestor = resource.rpartition("/")[0]
+        while len(ancestor) > len(self.base_url) and ancestor.startswith(self.base_url):
+            collections.append(ancestor)
+            ancestor = ancestor.rpartition("/")[0]
+        path = resource.removeprefix(self.base_url)
+        for pattern, related in _RELATED_COLLECTIONS:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            user = match.groupdict().get("user") or self._cached_seller(resource)
+            if user is not None:
+                collections.extend((self._build_url(template.format(user=user)) for template in related))
+        for cached_method in _CACHEABLE_METHODS:
+            self._cache.delete(f"{cached_method}:{resource}")
+            self._cache.delete_prefix(f"{cached_method}:{resource}?")
+            self._cache.delete_prefix(f"{cached_method}:{resource}/")
+            for collection in collections:
+                self._cache.delete(f"{cached_method}:{collection}")
+                self._cache.delete_prefix(f"{cached_method}:{collection}?")
+        logger.debug("Cache invalidated: %s and %s", resource, ", ".join(collections))
+
+    def _cached_seller(self, listing_url: str) -> str | None:
+        """Username of the seller of a listing, from the cached listing or the cached identity."""
+        assert self._cache is not None
+        for key, field in ((f"GET:{listing_url}", "seller"), (f"GET:{self._build_url('/oauth/identity')}", None)):
+            cached = self._cache.get_stale(key)
+            if cached is None:
+                continue
+            try:
+                data = json.loads(cached[0][2])
+            except ValueError:
+                continue
+            if field is not None and isinstance(data, dict):
+                data = data.get(field)
+            username = data.get("username") if isinstance(data, dict) else None
+            if isinstance(username, str):
+                return username
+        return None
+
+    def _fetch_once(
+        self,
+        request_key: str,
+        method: str,
+        url: str,
+        kwargs: dict[str, Any],
+        *,
+        cache_key: str = "",
+        stale: CacheEntry | None = None,
+    ) -> httpx.Response:
+        """``_fetch()``, unless an identical request is already in flight: then wait for its response."""
+        with self._in_flight_lock:
+            pending = self._in_flight.get(request_key)
+            if pending is None:
+                future: Future[httpx.Response] = Future()
+                self._in_flight[request_key] = future
+        if pending is not None:
+            logger.debug("Joining in-flight request: %s %s", method, url)
+            return pending.result()
+        try:
+            response = self._fetch(method, url, kwargs, cache_key=cache_key, stale=stale)
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved: there may be no other caller waiting.
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[request_key]
+
+    def _fetch(
+        self, method: str, url: str, kwargs: dict[str, Any], *, cache_key: str = "", stale: CacheEntry | None = None
+    ) -> httpx.Response:
+        """Send a request with retries and store cacheable responses under *cache_key*.
+
+        *stale* is an expired entry for the same key: it is revalidated with a
+        conditional request and served again if the server confirms it is unchanged.
+        """
+        if stale is not None:
+            validators = conditional_headers(stale[1])
+            if validators:
+                kwargs = {**kwargs, "headers": {**kwargs.get("headers", {}), **validators}}
         for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit(method, url)
             logger.debug("HTTP request: %s %s", method, url)
             t0 = time.monotonic()  # Unaffected by system clock adjustments (NTP, DST)
             try:
@@ -172,10 +377,24 @@ class Discogs(BaseClient):
                 time.sleep(delay)
                 continue
             elapsed_ms = (time.monotonic() - t0) * 1000
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response.headers)
             logger.debug("HTTP response: %s %s -> %d (%.0fms)", method, url, response.status_code, elapsed_ms)
             if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
-                if use_cache and 200 <= response.status_code < 300:
-                    assert self._cache is not None  # narrowed by use_cache
+                if stale is not None and (
+                    response.status_code == 304 or (200 <= response.status_code < 300 and response.content == stale[2])
+                ):
+                    # Unchanged upstream: restart the TTL instead of rewriting the entry.
+                    assert self._cache is not None  # narrowed by stale
+                    self._cache.refresh(cache_key)
+                    logger.debug("Cache revalidated: %s %s", method, url)
+                    if response.status_code == 304:
+                        return _cached_response(cache_key, stale)
+                    response.extensions[CACHE_KEY_EXTENSION] = cache_key
+                    return response
+                if cache_key and 200 <= response.status_code < 300:
+                    assert self._cache is not None  # narrowed by cache_key
+                    response.extensions[CACHE_KEY_EXTENSION] = cache_key
                     # response.content is already decompressed by httpx, so strip
                     # transport-layer headers that describe the wire encoding.
                     cache_headers = {
@@ -198,6 +417,88 @@ class Discogs(BaseClient):
             time.sleep(delay)
         return response  # pragma: no cover — unreachable but satisfies type checker
 
+    def _wait_for_rate_limit(self, method: str, url: str) -> None:
+        if self._rate_limiter is not None:
+            wait = self._rate_limiter.acquire()
+            if wait > 0:
+                logger.debug("Rate limit: waiting %.1fs before %s %s", wait, method, url)
+                time.sleep(wait)
+
+    @contextmanager
+    def _stream(self, method: str, url: str) -> Iterator[httpx.Response]:
+        """Send a request with retries and yield the response before its body is read.
+
+        For large downloads: the body is consumed in chunks by the caller and
+        never goes through the response cache or request coalescing.
+        """
+        headers = {"Authorization": self._build_oauth_header_for_request()} if self._uses_oauth else None
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit(method, url)
+            logger.debug("HTTP request (streamed): %s %s", method, url)
+            request = self._http_client.build_request(method, url, headers=headers)
+            try:
+                response = self._http_client.send(request, stream=True)
+            except (httpx.ConnectError, httpx.TimeoutException) as exc:
+                if attempt == self.max_retries:
+                    raise DiscogsConnectionError(str(exc)) from exc
+                delay = self._retry_delay(attempt)
+                logger.info(
+                    "Retrying %s %s (attempt %d/%d) after connection error, waiting %.1fs",
+                    method,
+                    url,
+                    attempt + 2,
+                    self.max_retries + 1,
+                    delay,
+                )
+            else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update(response.headers)
+                logger.debug("HTTP response (streamed): %s %s -> %d", method, url, response.status_code)
+                if response.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                    try:
+                        yield response
+                    finally:
+                        response.close()
+                    return
+                response.close()
+                delay = self._retry_delay(attempt, retry_after=response.headers.get("Retry-After"))
+                logger.info(
+                    "Retrying %s %s (attempt %d/%d) after status %d, waiting %.1fs",
+                    method,
+                    url,
+                    attempt + 2,
+                    self.max_retries + 1,
+                    response.status_code,
+                    delay,
+                )
+            time.sleep(delay)
+
+    def _revalidate_in_background(
+        self, method: str, url: str, kwargs: dict[str, Any], cache_key: str, stale: CacheEntry
+    ) -> None:
+        with self._revalidation_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+        thread = threading.Thread(
+            target=self._revalidate,
+            args=(method, url, kwargs, cache_key, stale),
+            name="discogs-sdk-revalidate",
+            daemon=True,
+        )
+        self._background.add(thread)
+        thread.start()
+
+    def _revalidate(self, method: str, url: str, kwargs: dict[str, Any], cache_key: str, stale: CacheEntry) -> None:
+        try:
+            self._fetch(method, url, kwargs, cache_key=cache_key, stale=stale)
+        except Exception:
+            logger.warning("Background revalidation failed: %s %s", method, url, exc_info=True)
+        finally:
+            with self._revalidation_lock:
+                self._revalidating.discard(cache_key)
+            self._background.discard(threading.current_thread())
+
     # --- Cache ---
 
     @contextmanager
@@ -213,6 +514,57 @@ class Discogs(BaseClient):
         """Purge all cached responses. No-op when caching is disabled."""
         if self._cache is not None:
             self._cache.clear()
+        if self._model_cache is not None:
+            self._model_cache.clear()
+
+    def _bounded_concurrency(self, concurrency: int) -> int:
+        """Clamp *concurrency* to the connection pool size."""
+        if self._max_concurrency is not None and concurrency > self._max_concurrency:
+            logger.debug("Limiting concurrency from %d to max_connections=%d", concurrency, self._max_concurrency)
+            return self._max_concurrency
+        return concurrency
+
+    def warm_cache(self, paths: Iterable[str], *, concurrency: int = 5) -> int:
+        """Fetch API paths such as ``"/releases/1"`` into the response cache.
+
+        Up to *concurrency* requests are in flight; each goes through the
+        client's retry policy and rate limiter, and paths that are already
+        cached are not fetched again. Failed requests are logged and skipped.
+        Returns the number of paths that are now cached.
+        """
+        if self._cache is None:
+            raise ValueError("warm_cache() requires caching to be enabled")
+
+        def fetch(path: str) -> bool:
+            try:
+                response = self._send("GET", self._build_url(path))
+            except DiscogsConnectionError as exc:
+                logger.warning("Cache warm-up failed for %s: %s", path, exc)
+                return False
+            if not 200 <= response.status_code < 300:
+                logger.warning("Cache warm-up failed for %s: HTTP %d", path, response.status_code)
+                return False
+            return True
+
+        warmed = 0
+        for _, ok in map_unordered(fetch, paths, concurrency=self._bounded_concurrency(concurrency)):
+            warmed += ok
+        return warmed
+
+    def _parse_model(self, response: httpx.Response, model_cls: type[_M]) -> _M:
+        """Parse JSON, raise on error, return validated model, reusing cached models when possible."""
+        cache_key = response.extensions.get(CACHE_KEY_EXTENSION) if self._model_cache is not None else None
+        if cache_key is not None:
+            assert self._model_cache is not None  # narrowed by cache_key
+            model = self._model_cache.get(cache_key, model_cls, response.content)
+            if model is not None:
+                return model
+        data = response.json()
+        self._maybe_raise(response.status_code, data, retry_after=response.headers.get("Retry-After"))
+        model = model_cls.model_validate(data)
+        if cache_key is not None:
+            self._model_cache.set(cache_key, model_cls, response.content, model)  # type: ignore[union-attr]
+        return model
 
     # --- Database ---
 
@@ -281,7 +633,11 @@ class Discogs(BaseClient):
 
         Only closes the client if it was created by this instance,
         not if a custom ``http_client`` was passed to the constructor.
+        Background cache revalidations still running are cancelled (async)
+        or waited for (sync) first.
         """
+        for thread in list(self._background):
+            thread.join()
         if self._owns_client:
             self._http_client.close()
         if self._cache is not None:
@@ -0,0 +1,38 @@
+# This file is auto-generated from the async version.
+# Do not edit directly — edit the corresponding file in _async/ instead.
+
+from __future__ import annotations
+from collections.abc import Iterable
+from itertools import islice
+from typing import TypeVar
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+_K = TypeVar("_K")
+_R = TypeVar("_R")
+
+
+def map_unordered(func: Callable[[_K], _R], items: Iterable[_K], *, concurrency: int) -> Iterator[tuple[_K, _R]]:
+    """Run ``func`` over *items* with at most *concurrency* calls in flight.
+
+    Yields ``(item, result)`` pairs in completion order. Calls run on a
+    thread pool; *items* is consumed lazily, so arbitrarily long iterables
+    never materialize more than *concurrency* pending calls. An exception
+    raised by ``func`` propagates and cancels the calls not yet started.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    iterator = iter(items)
+    pending: dict[Future[_R], _K] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="discogs-sdk-bulk")
+    try:
+        while True:
+            for item in islice(iterator, concurrency - len(pending)):
+                pending[executor.submit(func, item)] = item
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield (pending.pop(future), future.result())
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
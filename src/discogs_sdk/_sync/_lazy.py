@@ -39,9 +39,7 @@ class LazyResource:
         path = object.__getattribute__(self, "_path")
         model_cls = object.__getattribute__(self, "_model_cls")
         response = client._send("GET", client._build_url(path))
-        body = response.json()
-        client._maybe_raise(response.status_code, body, retry_after=response.headers.get("Retry-After"))
-        resolved = model_cls.model_validate(body)
+        resolved = client._parse_model(response, model_cls)
         object.__setattr__(self, "_resolved", resolved)
         return resolved
 
@@ -2,8 +2,12 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+from concurrent.futures import Future as _PageRequest
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from typing import TYPE_CHECKING, Any, Iterator, Generic, TypeVar
 from pydantic import BaseModel
+from typing_extensions import Self
 
 if TYPE_CHECKING:
     from discogs_sdk._sync._client import Discogs
@@ -25,6 +29,16 @@ class SyncPage(Generic[T]):
 
         {"submissions": {"releases": [...]}}
         items_path=["submissions", "releases"]
+
+    Pages are fetched one at a time by default. Call ``prefetch(n)`` before
+    iterating to keep up to *n* upcoming pages in flight once the total page
+    count is known; items are still yielded in order. The async variant runs
+    them as tasks, the sync variant on background worker threads::
+
+        async for item in client.user.collection.folders.get(0).releases.list(per_page=100).prefetch(4):
+            ...
+
+    Pages bypass the response cache when *cache* is false.
     """
 
     def __init__(
@@ -36,6 +50,8 @@ class SyncPage(Generic[T]):
         *,
         params: dict[str, Any] | None = None,
         items_path: list[str] | None = None,
+        prefetch: int = 0,
+        cache: bool = True,
     ) -> None:
         self._client = client
         self._path = path
@@ -43,23 +59,40 @@ class SyncPage(Generic[T]):
         self._model_cls = model_cls
         self._items_key = items_key
         self._items_path = items_path
+        self._prefetch = prefetch
+        self._use_cache = cache
         self._items: list[T] = []
         self._index = 0
         self._next_url: str | None = None
         self._exhausted = False
         self._first_page_fetched = False
+        # Requests for the pages following the current one, in page order.
+        self._pending: deque[_PageRequest[dict[str, Any]]] = deque()
+        self._executor: ThreadPoolExecutor | None = None
         self._page_number: int | None = None
         self._per_page: int | None = None
         self._total_items: int | None = None
         self._total_pages: int | None = None
 
-    def _fetch_page(self) -> None:
-        if self._next_url:
-            response = self._client._send("GET", self._next_url)
+    def _request_page(self, page_number: int | None = None) -> dict[str, Any]:
+        if page_number is not None:
+            response = self._client._send(
+                "GET",
+                self._client._build_url(self._path),
+                params={**self._params, "page": page_number},
+                cache=self._use_cache,
+            )
+        elif self._next_url:
+            response = self._client._send("GET", self._next_url, cache=self._use_cache)
         else:
-            response = self._client._send("GET", self._client._build_url(self._path), params=self._params)
+            response = self._client._send(
+                "GET", self._client._build_url(self._path), params=self._params, cache=self._use_cache
+            )
         body = response.json()
         self._client._maybe_raise(response.status_code, body, retry_after=response.headers.get("Retry-After"))
+        return body
+
+    def _load_page(self, body: dict[str, Any]) -> None:
         pagination = body.get("pagination", {})
         self._page_number = pagination.get("page")
         self._per_page = pagination.get("per_page")
@@ -80,6 +113,56 @@ class SyncPage(Generic[T]):
         self._index = 0
         self._first_page_fetched = True
 
+    def _schedule_prefetch(self) -> None:
+        """Start requests for upcoming pages until *prefetch* pages are in flight."""
+        if self._prefetch <= 0 or self._exhausted or self._page_number is None or (self._total_pages is None):
+            return
+        first = self._page_number + len(self._pending) + 1
+        last = min(self._page_number + self._client._bounded_concurrency(self._prefetch), self._total_pages)
+        for number in range(first, last + 1):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._client._bounded_concurrency(self._prefetch),
+                    thread_name_prefix="discogs-sdk-prefetch",
+                )
+            request = self._executor.submit(self._request_page, number)
+            self._pending.append(request)
+
+    def _fetch_page(self) -> None:
+        if self._pending:
+            body = self._pending.popleft().result()
+        else:
+            body = self._request_page()
+        self._load_page(body)
+        self._schedule_prefetch()
+
+    def prefetch(self, pages: int) -> Self:
+        """Keep up to *pages* upcoming pages in flight while iterating.
+
+        Requests go through the client as usual, so they share its retry
+        policy, cache and rate limiter, and never outnumber its
+        *max_connections*. Returns ``self`` for chaining.
+        """
+        if pages < 0:
+            raise ValueError("pages must be >= 0")
+        self._prefetch = pages
+        return self
+
+    def _cancel_pending(self) -> None:
+        while self._pending:
+            self._pending.popleft().cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def close(self) -> None:
+        """Stop iterating and cancel prefetched pages that were not consumed."""
+        self._cancel_pending()
+        self._items = []
+        self._index = 0
+        self._exhausted = True
+        self._first_page_fetched = True
+
     @property
     def page(self) -> int | None:
         """Current page number, or ``None`` if no page has been fetched yet."""
@@ -101,16 +184,29 @@ class SyncPage(Generic[T]):
         return self._total_pages
 
     def __iter__(self) -> Iterator[T]:
-        return self
+        # A generator, so that leaving a loop early (``break``, an exception)
+        # cancels the prefetched pages once the loop lets go of it. The page
+        # keeps its position: iterating it again resumes where it stopped.
+        try:
+            while True:
+                try:
+                    item = self.__next__()
+                except StopIteration:
+                    return
+                yield item
+        finally:
+            self._cancel_pending()
 
     def __next__(self) -> T:
         if not self._first_page_fetched:
             self._fetch_page()
         if self._index >= len(self._items):
             if self._exhausted:
+                self._cancel_pending()
                 raise StopIteration
             self._fetch_page()
             if not self._items:
+                self._cancel_pending()
                 raise StopIteration
         item = self._items[self._index]
         self._index += 1
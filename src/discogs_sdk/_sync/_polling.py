@@ -0,0 +1,26 @@
+# This file is auto-generated from the async version.
+# Do not edit directly — edit the corresponding file in _async/ instead.
+
+from __future__ import annotations
+import time
+from typing import TypeVar
+from discogs_sdk._poll import PollPolicy
+from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+
+def poll_until(fetch: Callable[[], _T], done: Callable[[_T], bool], policy: PollPolicy) -> _T:
+    """Call ``fetch`` until ``done`` accepts its result, waiting between calls as *policy* says.
+
+    Raises ``TimeoutError`` if the next wait would run past *policy*'s timeout.
+    """
+    deadline = None if policy.timeout is None else time.monotonic() + policy.timeout
+    for delay in policy.delays():
+        result = fetch()
+        if done(result):
+            return result
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Job did not finish within {policy.timeout:g}s")
+        time.sleep(delay)
+    raise AssertionError("unreachable: PollPolicy.delays() never ends")  # pragma: no cover
@@ -2,14 +2,20 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
-from pathlib import Path
+import os
+from collections.abc import Iterator, Callable, Iterable
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, TypeVar
 import httpx
 from pydantic import BaseModel
+from discogs_sdk._sync._concurrency import map_unordered
+from discogs_sdk._exceptions import DiscogsError
+from discogs_sdk._files import FileSource, ProgressCallback, ProgressReader, open_source, upload_name
 
 if TYPE_CHECKING:
     from discogs_sdk._sync._client import Discogs
 _M = TypeVar("_M", bound=BaseModel)
+_T = TypeVar("_T")
 
 
 class SyncAPIResource:
@@ -24,9 +30,7 @@ class SyncAPIResource:
 
     def _parse_response(self, response: httpx.Response, model_cls: type[_M]) -> _M:
         """Parse JSON, raise on error, return validated model."""
-        data = response.json()
-        self._client._maybe_raise(response.status_code, data, retry_after=response.headers.get("Retry-After"))
-        return model_cls.model_validate(data)
+        return self._client._parse_model(response, model_cls)
 
     def _raise_for_error(self, response: httpx.Response) -> None:
         """Raise on error for void methods (delete, update returning None)."""
@@ -34,26 +38,64 @@ class SyncAPIResource:
             body = response.json() if response.content else {}
             self._client._maybe_raise(response.status_code, body, retry_after=response.headers.get("Retry-After"))
 
+    def _blocking(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Call *func*, on a worker thread in the async client so blocking file I/O stays off the event loop."""
+        return func(*args)
+
     def _delete(self, path: str) -> httpx.Response:
         return self._request("DELETE", path)
 
-    def _get(self, path: str, *, params: dict[str, Any] | None = None) -> httpx.Response:
-        return self._request("GET", path, params=params)
+    def _get(self, path: str, *, params: dict[str, Any] | None = None, cache: bool = True) -> httpx.Response:
+        return self._request("GET", path, params=params, cache=cache)
+
+    def _get_many(
+        self, ids: Iterable[int], path: Callable[[int], str], model_cls: type[_M], *, concurrency: int
+    ) -> Iterator[tuple[int, _M | DiscogsError]]:
+        """Fetch one resource per ID concurrently, yielding ``(id, model_or_error)`` as each completes."""
+
+        def fetch(resource_id: int) -> _M | DiscogsError:
+            try:
+                response = self._get(path(resource_id))
+                return self._parse_response(response, model_cls)
+            except DiscogsError as exc:
+                return exc
+
+        concurrency = self._client._bounded_concurrency(concurrency)
+        for resource_id, result in map_unordered(fetch, ids, concurrency=concurrency):
+            yield (resource_id, result)
 
     def _get_binary(self, path: str) -> bytes:
-        response = self._client._send("GET", self._client._build_url(path))
-        self._client._maybe_raise(response.status_code, response.text, retry_after=response.headers.get("Retry-After"))
-        return response.content
+        with self._stream_binary(path) as response:
+            return response.read()
+
+    @contextmanager
+    def _stream_binary(self, path: str) -> Iterator[httpx.Response]:
+        """GET *path* as a streamed response, bypassing the response cache; raise on error."""
+        with self._client._stream("GET", self._client._build_url(path)) as response:
+            if response.status_code >= 400:
+                response.read()
+                self._client._maybe_raise(
+                    response.status_code, response.text, retry_after=response.headers.get("Retry-After")
+                )
+            yield response
 
     def _post(
         self, path: str, *, json: dict[str, Any] | None = None, params: dict[str, Any] | None = None
     ) -> httpx.Response:
         return self._request("POST", path, json=json, params=params)
 
-    def _post_file(self, path: str, *, file_path: str) -> httpx.Response:
-        p = Path(file_path)
-        data = p.read_bytes()
-        return self._client._send("POST", self._client._build_url(path), files={"upload": (p.name, data, "text/csv")})
+    def _post_file(self, path: str, *, file: FileSource, progress: ProgressCallback | None = None) -> httpx.Response:
+        """POST *file* as the ``upload`` multipart field, streamed in chunks rather than read up front."""
+        if isinstance(file, (str, os.PathLike)):
+            stream = self._blocking(open_source, file)
+            try:
+                return self._post_file(path, file=stream, progress=progress)
+            finally:
+                self._blocking(stream.close)
+        body = file if progress is None else ProgressReader(file, progress)
+        return self._client._send(
+            "POST", self._client._build_url(path), files={"upload": (upload_name(file), body, "text/csv")}
+        )
 
     def _put(
         self, path: str, *, json: dict[str, Any] | None = None, params: dict[str, Any] | None = None
@@ -61,6 +103,12 @@ class SyncAPIResource:
         return self._request("PUT", path, json=json, params=params)
 
     def _request(
-        self, method: str, path: str, *, json: dict[str, Any] | None = None, params: dict[str, Any] | None = None
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        cache: bool = True,
     ) -> httpx.Response:
-        return self._client._send(method, self._client._build_url(path), json=json, params=params)
+        return self._client._send(method, self._client._build_url(path), json=json, params=params, cache=cache)
@@ -2,9 +2,11 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+from collections.abc import Iterator, Iterable
 from discogs_sdk._sync._lazy import LazyResource
 from discogs_sdk._sync._paginator import SyncPage
 from discogs_sdk._sync._resource import SyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.artist import Artist, ArtistRelease
 
 
@@ -41,3 +43,16 @@ class Artists(SyncAPIResource):
             model_cls=Artist,
             sub_resources={"releases": lambda: ArtistReleases(self._client, artist_id)},
         )
+
+    def get_many(
+        self, artist_ids: Iterable[int], *, concurrency: int = 5
+    ) -> Iterator[tuple[int, Artist | DiscogsError]]:
+        """Fetch many artists concurrently.
+
+        Yields ``(artist_id, result)`` pairs in completion order, where *result* is
+        the ``Artist`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(artist_ids, lambda artist_id: f"/artists/{artist_id}", Artist, concurrency=concurrency)
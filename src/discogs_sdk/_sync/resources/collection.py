@@ -5,9 +5,11 @@ from __future__ import annotations
 import builtins
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
+from discogs_sdk._sync._delta import sync_items
 from discogs_sdk._sync._lazy import LazyResource
 from discogs_sdk._sync._paginator import SyncPage
 from discogs_sdk._sync._resource import SyncAPIResource
+from discogs_sdk._index import DeltaEvent, LocalIndex
 from discogs_sdk.models.collection import CollectionField, CollectionFolder, CollectionItem, CollectionValue_
 
 if TYPE_CHECKING:
@@ -119,6 +121,23 @@ class FolderReleases(SyncAPIResource):
         response = self._post(f"{self._base_path()}/{release_id}")
         self._raise_for_error(response)
 
+    def sync(self, index: LocalIndex) -> builtins.list[DeltaEvent]:
+        """Update *index* with this folder's items and return those added, changed or removed since the last sync.
+
+        Items are keyed by ``instance_id``. Only the newest pages are fetched
+        unless the folder's item count shows that something was removed; see
+        ``LocalIndex``.
+        """
+        return sync_items(
+            self._client,
+            index,
+            f"collection:{self._username}:{self._folder_id}",
+            path=self._base_path(),
+            model_cls=CollectionItem,
+            items_key="releases",
+            item_id=lambda item: item.instance_id or item.id,
+        )
+
 
 # --- Collection Folders ---
 
@@ -2,9 +2,11 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+from collections.abc import Iterator, Iterable
 from discogs_sdk._sync._lazy import LazyResource
 from discogs_sdk._sync._paginator import SyncPage
 from discogs_sdk._sync._resource import SyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.label import Label, LabelRelease
 
 
@@ -32,3 +34,14 @@ class Labels(SyncAPIResource):
             path=f"/labels/{label_id}",
             sub_resources={"releases": lambda: LabelReleases(self._client, label_id)},
         )
+
+    def get_many(self, label_ids: Iterable[int], *, concurrency: int = 5) -> Iterator[tuple[int, Label | DiscogsError]]:
+        """Fetch many labels concurrently.
+
+        Yields ``(label_id, result)`` pairs in completion order, where *result* is
+        the ``Label`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(label_ids, lambda label_id: f"/labels/{label_id}", Label, concurrency=concurrency)
@@ -2,9 +2,11 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+from collections.abc import Iterator, Iterable
 from discogs_sdk._sync._lazy import LazyResource
 from discogs_sdk._sync._paginator import SyncPage
 from discogs_sdk._sync._resource import SyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.master import Master, MasterVersion
 
 
@@ -52,3 +54,16 @@ class Masters(SyncAPIResource):
             path=f"/masters/{master_id}",
             sub_resources={"versions": lambda: MasterVersions(self._client, master_id)},
         )
+
+    def get_many(
+        self, master_ids: Iterable[int], *, concurrency: int = 5
+    ) -> Iterator[tuple[int, Master | DiscogsError]]:
+        """Fetch many masters concurrently.
+
+        Yields ``(master_id, result)`` pairs in completion order, where *result* is
+        the ``Master`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(master_ids, lambda master_id: f"/masters/{master_id}", Master, concurrency=concurrency)
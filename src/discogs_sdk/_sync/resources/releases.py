@@ -2,8 +2,10 @@
 # Do not edit directly — edit the corresponding file in _async/ instead.
 
 from __future__ import annotations
+from collections.abc import Iterator, Iterable
 from discogs_sdk._sync._lazy import LazyResource
 from discogs_sdk._sync._resource import SyncAPIResource
+from discogs_sdk._exceptions import DiscogsError
 from discogs_sdk.models.release import (
     CommunityRating,
     MarketplaceReleaseStats,
@@ -79,3 +81,18 @@ class Releases(SyncAPIResource):
                 "stats": lambda: ReleaseStatsResource(self._client, release_id),
             },
         )
+
+    def get_many(
+        self, release_ids: Iterable[int], *, concurrency: int = 5
+    ) -> Iterator[tuple[int, Release | DiscogsError]]:
+        """Fetch many releases concurrently.
+
+        Yields ``(release_id, result)`` pairs in completion order, where *result* is
+        the ``Release`` or the ``DiscogsError`` raised for that ID, so one
+        failure (e.g. ``NotFoundError``) does not abort the batch. At most
+        *concurrency* requests are in flight; each goes through the client's
+        retry policy, cache and rate limiter.
+        """
+        return self._get_many(
+            release_ids, lambda release_id: f"/releases/{release_id}", Release, concurrency=concurrency
+        )
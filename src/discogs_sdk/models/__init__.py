@@ -26,7 +26,7 @@ from discogs_sdk.models.collection import (
     CollectionItem,
     CollectionValue_,
 )
-from discogs_sdk.models.export import Export
+from discogs_sdk.models.export import Export, ExportedListing
 from discogs_sdk.models.label import Label, LabelRelease
 from discogs_sdk.models.list_ import List_, ListItem, ListSummary
 from discogs_sdk.models.marketplace import (
@@ -49,7 +49,7 @@ from discogs_sdk.models.release import (
     UserReleaseRating,
 )
 from discogs_sdk.models.search import SearchResult
-from discogs_sdk.models.upload import Upload
+from discogs_sdk.models.upload import Upload, UploadBatch
 from discogs_sdk.models.user import Identity, User
 from discogs_sdk.models.wantlist import Want
 
@@ -69,6 +69,7 @@ __all__ = [
     "Condition",
     "CurrencyCode",
     "Export",
+    "ExportedListing",
     "Fee",
     "Format",
     "Identifier",
@@ -101,6 +102,7 @@ __all__ = [
     "SubLabel",
     "Track",
     "Upload",
+    "UploadBatch",
     "User",
     "UserReleaseRating",
     "UserSummary",
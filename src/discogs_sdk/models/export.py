@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pydantic import Field
 
-from discogs_sdk.models._common import SDKModel
+from discogs_sdk.models._common import Condition, SDKModel, SleeveCondition
 
 
 class Export(SDKModel):
@@ -13,3 +13,30 @@ class Export(SDKModel):
     finished_at: str | None = Field(default=None, validation_alias="finished_ts")
     status: str | None = None
     url: str | None = None
+
+
+class ExportedListing(SDKModel):
+    """One row of an inventory export CSV, as yielded by ``Exports.iter_listings()``.
+
+    Empty cells are ``None``; columns not listed here are kept as strings.
+    """
+
+    listing_id: int
+    accept_offer: bool | None = None
+    artist: str | None = None
+    catalog_number: str | None = Field(default=None, validation_alias="catno")
+    comments: str | None = None
+    condition: Condition | str | None = Field(default=None, validation_alias="media_condition")
+    external_id: str | None = None
+    flat_shipping: float | None = None
+    format: str | None = None
+    format_quantity: int | None = None
+    label: str | None = None
+    listed: str | None = None
+    location: str | None = None
+    price: float | None = None
+    release_id: int | None = None
+    sleeve_condition: SleeveCondition | str | None = None
+    status: str | None = None
+    title: str | None = None
+    weight: float | None = None
@@ -15,3 +15,23 @@ class Upload(SDKModel):
     results: dict[str, Any] | None = None
     status: str | None = None
     type: str | None = None
+
+
+class UploadBatch(SDKModel):
+    """Outcome of a chunked inventory upload such as ``Uploads.create_in_chunks()``.
+
+    Chunks are numbered from 1 in file order; chunk *n* holds data rows
+    ``(n - 1) * rows_per_chunk + 1`` to ``n * rows_per_chunk``.
+    """
+
+    uploads: dict[int, Upload] = Field(default_factory=dict)
+    """Finished upload job of each chunk that was accepted."""
+    errors: dict[int, str] = Field(default_factory=dict)
+    """Error of each chunk that could not be uploaded or did not finish in time."""
+    rows: int = 0
+    """Data rows in the chunks that were uploaded."""
+
+    @property
+    def failed_chunks(self) -> list[int]:
+        """Numbers of the chunks to send again, e.g. through the *chunks* argument."""
+        return sorted(self.errors)
@@ -6,6 +6,7 @@ from discogs_sdk.models._common import BasicInformation, SDKModel
 class Want(SDKModel):
     id: int
     basic_information: BasicInformation | None = None
+    date_added: str | None = None
     notes: str | None = None
     rating: int | None = None
     resource_url: str | None = None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import httpx
 
+from discogs_sdk._exceptions import NotFoundError
 from discogs_sdk.models.artist import Artist, ArtistRelease
 
 from tests.conftest import (
@@ -79,3 +80,12 @@ class TestArtistModel:
         )
         result = await client.artists.get(1)
         assert result.model_extra["realname"] == "Trent Reznor"
+
+
+class TestArtistsGetMany:
+    async def test_get_many(self, no_retry_client, respx_mock):
+        respx_mock.get("/artists/1").mock(return_value=httpx.Response(200, json=make_artist(id=1)))
+        respx_mock.get("/artists/2").mock(return_value=httpx.Response(404, json={"message": "Not found."}))
+        results = dict([item async for item in no_retry_client.artists.get_many([1, 2])])
+        assert isinstance(results[1], Artist)
+        assert isinstance(results[2], NotFoundError)
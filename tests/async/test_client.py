@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
 import httpx
+import pytest
 import respx
 
 from discogs_sdk import AsyncDiscogs
-from discogs_sdk._cache import MemoryCache, SQLiteCache
-from tests.conftest import BASE_URL
+from discogs_sdk._cache import MemoryCache, ModelCache, SQLiteCache, TTLPolicy, ZlibCodec
+from discogs_sdk.models import Release
+from discogs_sdk._exceptions import DiscogsConnectionError
+from discogs_sdk._rate_limit import RateLimiter
+from tests.conftest import BASE_URL, make_release
+
+_RATELIMIT_HEADERS_EXHAUSTED = {
+    "X-Discogs-Ratelimit": "60",
+    "X-Discogs-Ratelimit-Used": "60",
+    "X-Discogs-Ratelimit-Remaining": "0",
+}
 
 
 class TestCustomHttpClient:
@@ -19,6 +33,37 @@ class TestCustomHttpClient:
         await custom.aclose()
 
 
+class TestConnectionPool:
+    async def test_limits_passed_to_pool(self):
+        with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as factory:
+            client = AsyncDiscogs(token="t", max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
+        limits = factory.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (8, 4, 30.0)
+        await client.close()
+
+    def test_concurrency_bounded_by_max_connections(self):
+        client = AsyncDiscogs(token="t", max_connections=4)
+        assert client._bounded_concurrency(10) == 4
+        assert client._bounded_concurrency(2) == 2
+
+    def test_unlimited_pool_leaves_concurrency_alone(self):
+        assert AsyncDiscogs(token="t", max_connections=None)._bounded_concurrency(500) == 500
+
+    async def test_custom_client_leaves_concurrency_alone(self):
+        custom = httpx.AsyncClient()
+        client = AsyncDiscogs(token="t", http_client=custom, max_connections=4)
+        assert client._bounded_concurrency(10) == 10
+        await custom.aclose()
+
+    async def test_http2_multiplexes_past_max_connections(self):
+        pytest.importorskip("h2")
+        with patch("httpx.AsyncClient", wraps=httpx.AsyncClient) as factory:
+            client = AsyncDiscogs(token="t", http2=True, max_connections=4)
+        assert factory.call_args.kwargs["http2"] is True
+        assert client._bounded_concurrency(10) == 10
+        await client.close()
+
+
 class TestCacheBranch:
     def test_cache_true_creates_memory_cache(self):
         client = AsyncDiscogs(token="t", cache=True)
@@ -58,6 +103,26 @@ class TestCacheBranch:
             assert route.call_count == 1  # no additional HTTP call
             await client.close()
 
+    async def test_sqlite_cache_io_runs_off_the_event_loop(self, tmp_path):
+        """Lookups and writes against SQLiteCache run on its worker threads."""
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = AsyncDiscogs(token="t", cache=True, cache_dir=tmp_path)
+            threads: list[str] = []
+            original = SQLiteCache.set
+
+            def record(cache, *args):
+                threads.append(threading.current_thread().name)
+                original(cache, *args)
+
+            with patch.object(SQLiteCache, "set", autospec=True, side_effect=record):
+                await client._send("GET", f"{BASE_URL}/releases/1")
+            assert len(threads) == 1
+            assert threads[0].startswith("discogs-sdk-cache-io")
+            r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            await client.close()
+
     async def test_cached_response_strips_content_encoding(self):
         """Cache hit with original content-encoding: gzip must not corrupt the body.
 
@@ -84,6 +149,268 @@ class TestCacheBranch:
             assert "content-encoding" not in r2.headers
             await client.close()
 
+    async def test_expired_entry_revalidated_with_304(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                side_effect=[
+                    httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}),
+                    httpx.Response(304),
+                ]
+            )
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            with patch.object(cache, "refresh", wraps=cache.refresh) as refresh:
+                r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            request = route.calls[1].request
+            assert request.headers["If-None-Match"] == '"v1"'
+            assert request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+            assert r2.status_code == 200
+            assert r2.json() == {"id": 1}
+            refresh.assert_called_once_with(f"GET:{BASE_URL}/releases/1")
+            await client.close()
+
+    async def test_unchanged_body_refreshes_instead_of_storing(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            with (
+                patch.object(cache, "refresh", wraps=cache.refresh) as refresh,
+                patch.object(cache, "set", wraps=cache.set) as store,
+            ):
+                r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            refresh.assert_called_once()
+            store.assert_not_called()
+            await client.close()
+
+    async def test_changed_body_replaces_stale_entry(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.Response(200, json={"id": 2})]
+            )
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 2}
+            stale = cache.get_stale(f"GET:{BASE_URL}/releases/1")
+            assert stale is not None
+            assert stale[0][2] == b'{"id":2}'
+            await client.close()
+
+    async def test_no_validators_without_stale_ttl(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'})
+            )
+            client = AsyncDiscogs(token="t", cache=MemoryCache(ttl=0))
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            assert "If-None-Match" not in route.calls[1].request.headers
+            await client.close()
+
+    async def test_stale_while_revalidate_serves_stale_and_refreshes(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.Response(200, json={"id": 2})]
+            )
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            r3 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r3.json() == {"id": 1}  # revalidation already scheduled
+            await asyncio.gather(*client._background)
+            assert route.call_count == 2
+            stale = cache.get_stale(f"GET:{BASE_URL}/releases/1")
+            assert stale is not None
+            assert stale[0][2] == b'{"id":2}'
+            await client.close()
+
+    async def test_stale_while_revalidate_skips_keys_already_revalidating(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            client._revalidating.add(f"GET:{BASE_URL}/releases/1")
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            assert not client._background
+            assert route.call_count == 1
+            await client.close()
+
+    async def test_background_revalidation_failure_keeps_stale_entry(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.ConnectError("down")]
+            )
+            client = AsyncDiscogs(token="t", cache=cache, max_retries=0)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            await asyncio.gather(*client._background)
+            assert not client._revalidating
+            assert cache.get_stale(f"GET:{BASE_URL}/releases/1") is not None
+            await client.close()
+
+    async def test_ttl_policy_never_caches_matching_paths(self):
+        policy = TTLPolicy({"/marketplace/*": None}, default=86400)
+        with respx.mock(base_url=BASE_URL) as router:
+            stats = router.get("/marketplace/stats/1").mock(return_value=httpx.Response(200, json={}))
+            release = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = AsyncDiscogs(token="t", cache=True, cache_ttl=policy)
+            for _ in range(2):
+                await client._send("GET", f"{BASE_URL}/marketplace/stats/1")
+                await client._send("GET", f"{BASE_URL}/releases/1")
+            assert stats.call_count == 2
+            assert release.call_count == 1
+            await client.close()
+
+    def test_model_cache_true_creates_model_cache(self):
+        client = AsyncDiscogs(token="t", cache=True, model_cache=True)
+        assert isinstance(client._model_cache, ModelCache)
+
+    async def test_model_cache_skips_validation_on_cache_hit(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json=make_release(id=1)))
+            client = AsyncDiscogs(token="t", cache=True, model_cache=True)
+            first = await client.releases.get(1)
+            with patch.object(Release, "model_validate", wraps=Release.model_validate) as validate:
+                second = await client.releases.get(1)
+            validate.assert_not_called()
+            assert route.call_count == 1
+            assert second == first
+            assert second is not first
+            await client.close()
+
+    async def test_model_cache_reparses_changed_body(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[
+                    httpx.Response(200, json=make_release(id=1, title="Old")),
+                    httpx.Response(200, json=make_release(id=1, title="New")),
+                ]
+            )
+            client = AsyncDiscogs(token="t", cache=cache, model_cache=True)
+            first = await client.releases.get(1)
+            second = await client.releases.get(1)
+            assert first.title == "Old"
+            assert second.title == "New"
+            await client.close()
+
+    async def test_write_invalidates_resource_and_parent_list(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            listing = router.get("/users/bob/wants").mock(return_value=httpx.Response(200, json={}))
+            want = router.get("/users/bob/wants/1").mock(return_value=httpx.Response(200, json={}))
+            sibling = router.get("/users/bob/wants/2").mock(return_value=httpx.Response(200, json={}))
+            router.put("/users/bob/wants/1").mock(return_value=httpx.Response(201, json={}))
+            client = AsyncDiscogs(token="t", cache=True)
+            for _ in range(2):
+                await client._send("GET", f"{BASE_URL}/users/bob/wants", params={"page": 2})
+                await client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+                await client._send("GET", f"{BASE_URL}/users/bob/wants/2")
+                if listing.call_count == 1:
+                    await client._send("PUT", f"{BASE_URL}/users/bob/wants/1", json={"rating": 5})
+            assert listing.call_count == 2
+            assert want.call_count == 2
+            assert sibling.call_count == 1
+            await client.close()
+
+    async def test_write_invalidates_every_ancestor_collection(self):
+        folders = "/users/bob/collection/folders"
+        with respx.mock(base_url=BASE_URL) as router:
+            routes = [
+                router.get(path).mock(return_value=httpx.Response(200, json={}))
+                for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases")
+            ]
+            router.delete(f"{folders}/1/releases/5/instances/9").mock(return_value=httpx.Response(204))
+            client = AsyncDiscogs(token="t", cache=True)
+            for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases"):
+                await client._send("GET", f"{BASE_URL}{path}", params={"page": 1})
+            await client._send("DELETE", f"{BASE_URL}{folders}/1/releases/5/instances/9")
+            for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases"):
+                await client._send("GET", f"{BASE_URL}{path}", params={"page": 1})
+            assert [route.call_count for route in routes] == [2, 2, 2]
+            await client.close()
+
+    async def test_adding_to_folder_invalidates_all_folder_and_folder_list(self):
+        folders = "/users/bob/collection/folders"
+        with respx.mock(base_url=BASE_URL) as router:
+            all_folder = router.get(f"{folders}/0/releases").mock(return_value=httpx.Response(200, json={}))
+            folder_list = router.get(folders).mock(return_value=httpx.Response(200, json={}))
+            other = router.get(f"{folders}/2/releases").mock(return_value=httpx.Response(200, json={}))
+            router.post(f"{folders}/1/releases/5").mock(return_value=httpx.Response(201, json={}))
+            client = AsyncDiscogs(token="t", cache=True)
+            for _ in range(2):
+                await client._send("GET", f"{BASE_URL}{folders}/0/releases")
+                await client._send("GET", f"{BASE_URL}{folders}")
+                await client._send("GET", f"{BASE_URL}{folders}/2/releases")
+                if all_folder.call_count == 1:
+                    await client._send("POST", f"{BASE_URL}{folders}/1/releases/5")
+            assert all_folder.call_count == 2
+            assert folder_list.call_count == 2
+            assert other.call_count == 1
+            await client.close()
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
+    async def test_listing_write_invalidates_seller_inventory(self, method):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/marketplace/listings/7").mock(
+                return_value=httpx.Response(200, json={"id": 7, "seller": {"username": "bob"}})
+            )
+            inventory = router.get("/users/bob/inventory").mock(return_value=httpx.Response(200, json={}))
+            router.route(method=method, path="/marketplace/listings/7").mock(return_value=httpx.Response(204))
+            client = AsyncDiscogs(token="t", cache=True)
+            await client._send("GET", f"{BASE_URL}/marketplace/listings/7")
+            await client._send("GET", f"{BASE_URL}/users/bob/inventory", params={"page": 1})
+            await client._send(method, f"{BASE_URL}/marketplace/listings/7")
+            await client._send("GET", f"{BASE_URL}/users/bob/inventory", params={"page": 1})
+            assert inventory.call_count == 2
+            await client.close()
+
+    async def test_new_listing_invalidates_identity_inventory(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/oauth/identity").mock(return_value=httpx.Response(200, json={"id": 1, "username": "bob"}))
+            inventory = router.get("/users/bob/inventory").mock(return_value=httpx.Response(200, json={}))
+            router.post("/marketplace/listings").mock(return_value=httpx.Response(201, json={"listing_id": 7}))
+            client = AsyncDiscogs(token="t", cache=True)
+            await client._send("GET", f"{BASE_URL}/oauth/identity")
+            await client._send("GET", f"{BASE_URL}/users/bob/inventory")
+            await client._send("POST", f"{BASE_URL}/marketplace/listings", json={"release_id": 1})
+            await client._send("GET", f"{BASE_URL}/users/bob/inventory")
+            assert inventory.call_count == 2
+            await client.close()
+
+    async def test_failed_write_keeps_cache(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            want = router.get("/users/bob/wants/1").mock(return_value=httpx.Response(200, json={}))
+            router.delete("/users/bob/wants/1").mock(return_value=httpx.Response(404, json={"message": "nope"}))
+            client = AsyncDiscogs(token="t", cache=True)
+            await client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+            await client._send("DELETE", f"{BASE_URL}/users/bob/wants/1")
+            await client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+            assert want.call_count == 1
+            await client.close()
+
+    async def test_compressed_cache_is_transparent(self):
+        cache = MemoryCache(ttl=60, codec=ZlibCodec())
+        payload = {"id": 1, "notes": "x" * 1000}
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json=payload))
+            client = AsyncDiscogs(token="t", cache=cache)
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = await client._send("GET", f"{BASE_URL}/releases/1")
+            assert route.call_count == 1
+            assert r2.json() == payload
+            assert cache.size_bytes < 500
+            await client.close()
+
     async def test_post_not_cached(self):
         with respx.mock(base_url=BASE_URL) as router:
             route = router.post("/some/endpoint").mock(return_value=httpx.Response(200, json={}))
@@ -118,16 +445,59 @@ class TestCacheBranch:
             assert route.call_count == 2  # served from cache
             await client.close()
 
-    def test_clear_cache_with_cache(self):
+    async def test_clear_cache_with_cache(self):
         client = AsyncDiscogs(token="t", cache=True)
         assert client._cache is not None
         client._cache.set("k", 200, {}, b"x")
-        client.clear_cache()
+        await client.clear_cache()
         assert client._cache.get("k") is None
 
-    def test_clear_cache_without_cache(self):
+    async def test_clear_cache_without_cache(self):
+        client = AsyncDiscogs(token="t", cache=False)
+        await client.clear_cache()  # should not raise
+
+    async def test_sqlite_cache_cleared_and_closed_off_the_event_loop(self, tmp_path):
+        client = AsyncDiscogs(token="t", cache=True, cache_dir=str(tmp_path))
+        assert client._cache is not None
+        cache = client._cache
+        clear, close = cache.clear, cache.close
+        threads: list[threading.Thread] = []
+
+        def recording(func):
+            def call():
+                threads.append(threading.current_thread())
+                func()
+
+            return call
+
+        with (
+            patch.object(cache, "clear", side_effect=recording(clear)),
+            patch.object(cache, "close", side_effect=recording(close)),
+        ):
+            await client.clear_cache()
+            await client.close()
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    async def test_warm_cache_fetches_paths(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            router.get("/releases/2").mock(return_value=httpx.Response(200, json={"id": 2}))
+            router.get("/releases/3").mock(return_value=httpx.Response(404, json={"message": "Not found"}))
+            client = AsyncDiscogs(token="t", cache=True)
+            warmed = await client.warm_cache(["/releases/1", "/releases/2", "/releases/3"], concurrency=2)
+            assert warmed == 2
+            assert client._cache is not None
+            assert client._cache.get(f"GET:{BASE_URL}/releases/2") is not None
+            assert router.calls.call_count == 3
+            await client.warm_cache(["/releases/1"])
+            assert router.calls.call_count == 3  # already cached
+            await client.close()
+
+    async def test_warm_cache_requires_cache(self):
         client = AsyncDiscogs(token="t", cache=False)
-        client.clear_cache()  # should not raise
+        with pytest.raises(ValueError, match="caching"):
+            await client.warm_cache(["/releases/1"])
 
     async def test_close_closes_sqlite_cache(self, tmp_path):
         client = AsyncDiscogs(token="t", cache=True, cache_dir=tmp_path)
@@ -136,6 +506,135 @@ class TestCacheBranch:
         assert client._cache._db is None  # SQLite connection closed
 
 
+class TestRateLimiting:
+    def test_rate_limiter_enabled_by_default(self):
+        client = AsyncDiscogs(token="t")
+        assert isinstance(client._rate_limiter, RateLimiter)
+
+    def test_rate_limit_false_disables_limiter(self):
+        client = AsyncDiscogs(token="t", rate_limit=False)
+        assert client._rate_limiter is None
+
+    def test_rate_limiter_instance_shared(self):
+        limiter = RateLimiter()
+        c1 = AsyncDiscogs(token="t", rate_limit=limiter)
+        c2 = AsyncDiscogs(token="t", rate_limit=limiter)
+        assert c1._rate_limiter is c2._rate_limiter is limiter
+
+    async def test_response_headers_update_limiter(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = AsyncDiscogs(token="t")
+            await client._send("GET", f"{BASE_URL}/releases/1")
+            assert client._rate_limiter is not None
+            assert client._rate_limiter.limit == 60
+            await client.close()
+
+    async def test_paces_requests_when_budget_exhausted(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = AsyncDiscogs(token="t")
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                await client._send("GET", f"{BASE_URL}/releases/1")
+                mock_sleep.assert_not_called()
+                await client._send("GET", f"{BASE_URL}/releases/1")
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] > 0
+            await client.close()
+
+    async def test_no_pacing_when_disabled(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = AsyncDiscogs(token="t", rate_limit=False)
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                await client._send("GET", f"{BASE_URL}/releases/1")
+                await client._send("GET", f"{BASE_URL}/releases/1")
+            mock_sleep.assert_not_called()
+            await client.close()
+
+
+class TestRequestCoalescing:
+    @staticmethod
+    def _slow(payload: dict[str, int] | Exception):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            if isinstance(payload, Exception):
+                raise payload
+            return httpx.Response(200, json=payload)
+
+        return respond
+
+    async def test_concurrent_identical_gets_share_one_request(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1").mock(side_effect=self._slow({"id": 1}))
+            client = AsyncDiscogs(token="t")
+            responses = await asyncio.gather(*(client._send("GET", f"{BASE_URL}/masters/1") for _ in range(5)))
+            assert route.call_count == 1
+            assert all(r.json() == {"id": 1} for r in responses)
+            assert not client._in_flight
+            await client.close()
+
+    async def test_different_params_are_not_coalesced(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1").mock(side_effect=self._slow({"id": 1}))
+            client = AsyncDiscogs(token="t")
+            await asyncio.gather(
+                client._send("GET", f"{BASE_URL}/masters/1", params={"page": 1}),
+                client._send("GET", f"{BASE_URL}/masters/1", params={"page": 2}),
+            )
+            assert route.call_count == 2
+            await client.close()
+
+    async def test_post_not_coalesced(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.post("/lists").mock(side_effect=self._slow({}))
+            client = AsyncDiscogs(token="t")
+            await asyncio.gather(*(client._send("POST", f"{BASE_URL}/lists") for _ in range(3)))
+            assert route.call_count == 3
+            await client.close()
+
+    async def test_disabled(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1").mock(side_effect=self._slow({"id": 1}))
+            client = AsyncDiscogs(token="t", coalesce_requests=False)
+            await asyncio.gather(*(client._send("GET", f"{BASE_URL}/masters/1") for _ in range(3)))
+            assert route.call_count == 3
+            await client.close()
+
+    async def test_error_propagates_to_every_caller(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1").mock(side_effect=self._slow(httpx.ConnectError("down")))
+            client = AsyncDiscogs(token="t", max_retries=0)
+            results = await asyncio.gather(
+                *(client._send("GET", f"{BASE_URL}/masters/1") for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert route.call_count == 1
+            assert all(isinstance(r, DiscogsConnectionError) for r in results)
+            await client.close()
+
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1").mock(side_effect=self._slow({"id": 1}))
+            client = AsyncDiscogs(token="t")
+            leader = asyncio.create_task(client._send("GET", f"{BASE_URL}/masters/1"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client._send("GET", f"{BASE_URL}/masters/1"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            response = await follower
+            assert leader.cancelled()
+            assert response.json() == {"id": 1}
+            assert route.called
+            await client.close()
+
+
 class TestOAuthInSend:
     async def test_oauth_headers_injected(self):
         with respx.mock(base_url=BASE_URL) as router:
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+from unittest.mock import AsyncMock, patch
+
 import httpx
 import pytest
 
-from discogs_sdk._exceptions import DiscogsAPIError, DiscogsConnectionError, ForbiddenError
-from discogs_sdk.models.export import Export
+from discogs_sdk import AsyncDiscogs
+from discogs_sdk._cache import MemoryCache
+from discogs_sdk._exceptions import DiscogsAPIError, DiscogsConnectionError, DiscogsError, ForbiddenError
+from discogs_sdk._poll import PollPolicy
+from discogs_sdk.models.export import Export, ExportedListing
 
 from tests.conftest import make_export, make_paginated_response
 
@@ -61,6 +68,200 @@ class TestExportsDownload:
             await no_retry_client.exports.download(1)
 
 
+class TestExportsStreaming:
+    async def test_iter_download_yields_chunks(self, client, respx_mock):
+        body = b"listing_id,price\n" + b"1,9.99\n" * 20_000
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=body))
+        chunks = [chunk async for chunk in client.exports.iter_download(1, chunk_size=65536)]
+        assert b"".join(chunks) == body
+        assert max(len(chunk) for chunk in chunks) <= 65536
+        assert len(chunks) > 1
+
+    async def test_download_to_path(self, client, respx_mock, tmp_path):
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=b"csv,data,here"))
+        written = await client.exports.download_to(1, tmp_path / "export.csv")
+        assert written == 13
+        assert (tmp_path / "export.csv").read_bytes() == b"csv,data,here"
+
+    async def test_download_to_path_writes_off_the_event_loop(self, client, respx_mock, tmp_path):
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=b"csv,data,here"))
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await client.exports.download_to(1, tmp_path / "export.csv", chunk_size=4)
+        offloaded = [call.args[0] for call in to_thread.call_args_list]
+        assert offloaded[0] is open
+        assert len(offloaded) == 6  # open, four writes, close
+        assert (tmp_path / "export.csv").read_bytes() == b"csv,data,here"
+
+    async def test_download_to_file_object(self, client, respx_mock):
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=b"csv,data,here"))
+        buffer = io.BytesIO()
+        assert await client.exports.download_to(1, buffer, chunk_size=4) == 13
+        assert buffer.getvalue() == b"csv,data,here"
+
+    async def test_download_to_error_leaves_no_file(self, client, respx_mock, tmp_path):
+        respx_mock.get("/inventory/export/999/download").mock(return_value=httpx.Response(404, text="Not Found"))
+        with pytest.raises(DiscogsAPIError):
+            await client.exports.download_to(999, tmp_path / "export.csv")
+        assert not (tmp_path / "export.csv").exists()
+
+    async def test_downloads_bypass_cache(self, respx_mock):
+        route = respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=b"csv"))
+        client = AsyncDiscogs(token="test-token", cache=True)
+        await client.exports.download(1)
+        await client.exports.download_to(1, io.BytesIO())
+        assert route.call_count == 2
+        assert isinstance(client._cache, MemoryCache)
+        assert len(client._cache) == 0
+        await client.close()
+
+    async def test_retries_before_streaming(self, client, respx_mock):
+        responses = iter([httpx.Response(503, text="Unavailable"), httpx.Response(200, content=b"csv,data,here")])
+        respx_mock.get("/inventory/export/1/download").mock(side_effect=lambda request: next(responses))
+        buffer = io.BytesIO()
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await client.exports.download_to(1, buffer)
+        assert buffer.getvalue() == b"csv,data,here"
+        assert mock_sleep.call_count == 1
+
+
+class TestExportsRun:
+    async def test_polls_location_then_downloads(self, client, respx_mock, tmp_path):
+        respx_mock.get("/inventory/export").mock(
+            return_value=httpx.Response(
+                200, json=make_paginated_response("items", [make_export(id=3, status="success")])
+            )
+        )
+        respx_mock.post("/inventory/export").mock(
+            return_value=httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/export/4"})
+        )
+        statuses = iter(["pending", "in progress", "success"])
+        poll = respx_mock.get("/inventory/export/4").mock(
+            side_effect=lambda request: httpx.Response(200, json=make_export(id=4, status=next(statuses)))
+        )
+        respx_mock.get("/inventory/export/4/download").mock(return_value=httpx.Response(200, content=b"csv,data"))
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            export = await client.exports.run(tmp_path / "export.csv", poll=PollPolicy(initial=5, jitter=0))
+        assert export.id == 4
+        assert export.status == "success"
+        assert (tmp_path / "export.csv").read_bytes() == b"csv,data"
+        assert poll.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10]
+
+    async def test_finds_new_export_in_list(self, client, respx_mock):
+        old = make_export(id=3, status="success")
+        pages = iter(
+            [
+                [old],
+                [old],
+                [make_export(id=4, status="pending"), old],
+                [make_export(id=4, status="success"), old],
+            ]
+        )
+        respx_mock.get("/inventory/export").mock(
+            side_effect=lambda request: httpx.Response(200, json=make_paginated_response("items", next(pages)))
+        )
+        respx_mock.post("/inventory/export").mock(return_value=httpx.Response(200))
+        respx_mock.get("/inventory/export/4/download").mock(return_value=httpx.Response(200, content=b"csv"))
+        buffer = io.BytesIO()
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            export = await client.exports.run(buffer)
+        assert export.id == 4
+        assert buffer.getvalue() == b"csv"
+
+    async def test_finds_new_export_on_a_later_page(self, client, respx_mock):
+        listed = [make_export(id=1, status="success"), make_export(id=2, status="success")]
+
+        def respond(request):
+            page = int(request.url.params["page"])
+            items = listed[:1] if page == 1 else listed[1:]
+            return httpx.Response(200, json=make_paginated_response("items", items, page=page, pages=2))
+
+        route = respx_mock.get("/inventory/export").mock(side_effect=respond)
+        respx_mock.post("/inventory/export").mock(
+            side_effect=lambda request: listed.append(make_export(id=3, status="success")) or httpx.Response(200)
+        )
+        respx_mock.get("/inventory/export/3/download").mock(return_value=httpx.Response(200, content=b"csv"))
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            export = await client.exports.run(io.BytesIO())
+        assert export.id == 3
+        assert [call.request.url.params["page"] for call in route.calls] == ["1", "2", "1", "2"]
+
+    async def test_newer_created_at_counts_as_new(self, client, respx_mock):
+        old = {**make_export(id=7, status="success"), "created_ts": "2024-01-01T00:00:00"}
+        new = {**make_export(id=2, status="success"), "created_ts": "2024-06-01T00:00:00"}
+        pages = iter([[old], [new, old]])
+        respx_mock.get("/inventory/export").mock(
+            side_effect=lambda request: httpx.Response(200, json=make_paginated_response("items", next(pages)))
+        )
+        respx_mock.post("/inventory/export").mock(return_value=httpx.Response(200))
+        respx_mock.get("/inventory/export/2/download").mock(return_value=httpx.Response(200, content=b"csv"))
+        assert (await client.exports.run(io.BytesIO())).id == 2
+
+    async def test_failed_export_raises(self, client, respx_mock):
+        respx_mock.get("/inventory/export").mock(
+            return_value=httpx.Response(200, json=make_paginated_response("items", []))
+        )
+        respx_mock.post("/inventory/export").mock(
+            return_value=httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/export/4"})
+        )
+        respx_mock.get("/inventory/export/4").mock(
+            return_value=httpx.Response(200, json=make_export(id=4, status="failed"))
+        )
+        buffer = io.BytesIO()
+        with pytest.raises(DiscogsError, match="failed"):
+            await client.exports.run(buffer)
+        assert buffer.getvalue() == b""
+
+    async def test_timeout(self, client, respx_mock):
+        respx_mock.get("/inventory/export").mock(
+            return_value=httpx.Response(200, json=make_paginated_response("items", []))
+        )
+        respx_mock.post("/inventory/export").mock(
+            return_value=httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/export/4"})
+        )
+        respx_mock.get("/inventory/export/4").mock(return_value=httpx.Response(200, json=make_export(id=4)))
+        with pytest.raises(TimeoutError):
+            await client.exports.run(io.BytesIO(), poll=PollPolicy(initial=10, timeout=5))
+
+    async def test_polls_bypass_cache(self, respx_mock):
+        respx_mock.get("/inventory/export").mock(
+            return_value=httpx.Response(200, json=make_paginated_response("items", []))
+        )
+        respx_mock.post("/inventory/export").mock(
+            return_value=httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/export/4"})
+        )
+        statuses = iter(["pending", "success"])
+        respx_mock.get("/inventory/export/4").mock(
+            side_effect=lambda request: httpx.Response(200, json=make_export(id=4, status=next(statuses)))
+        )
+        respx_mock.get("/inventory/export/4/download").mock(return_value=httpx.Response(200, content=b"csv"))
+        async with AsyncDiscogs(token="t", cache=MemoryCache(ttl=60)) as cached_client:
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                assert (await cached_client.exports.run(io.BytesIO())).status == "success"
+
+
+class TestExportsListings:
+    async def test_iter_listings(self, client, respx_mock):
+        body = b"listing_id,release_id,price,media_condition,status\n" + b"".join(
+            b"%d,352665,9.99,Mint (M),For Sale\n" % i for i in range(1, 1001)
+        )
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=body))
+        listings = [listing async for listing in client.exports.iter_listings(1, chunk_size=100)]
+        assert len(listings) == 1000
+        assert all(isinstance(listing, ExportedListing) for listing in listings)
+        assert listings[-1].listing_id == 1000
+        assert listings[0].price == 9.99
+        assert listings[0].condition == "Mint (M)"
+
+    async def test_iter_listing_batches(self, client, respx_mock):
+        body = b"listing_id,price\n" + b"".join(b"%d,1.50\n" % i for i in range(25))
+        respx_mock.get("/inventory/export/1/download").mock(return_value=httpx.Response(200, content=body))
+        batches = [batch async for batch in client.exports.iter_listing_batches(1, batch_size=10, chunk_size=16)]
+        assert [len(batch["listing_id"]) for batch in batches] == [10, 10, 5]
+        assert [value for batch in batches for value in batch["listing_id"]] == list(range(25))
+        assert batches[0]["price"][0] == 1.5
+
+
 class TestExportModel:
     async def test_required_fields(self, client, respx_mock):
         respx_mock.get("/inventory/export/1").mock(return_value=httpx.Response(200, json={"id": 1}))
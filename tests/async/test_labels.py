@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import httpx
 
+from discogs_sdk._exceptions import NotFoundError
 from discogs_sdk.models.label import Label, LabelRelease
 
 from tests.conftest import make_label, make_label_release, make_paginated_response
@@ -45,3 +46,12 @@ class TestLabelModel:
         )
         result = await client.labels.get(1)
         assert result.model_extra["_unknown_extra_field"] == "test"
+
+
+class TestLabelsGetMany:
+    async def test_get_many(self, no_retry_client, respx_mock):
+        respx_mock.get("/labels/1").mock(return_value=httpx.Response(200, json=make_label(id=1)))
+        respx_mock.get("/labels/2").mock(return_value=httpx.Response(404, json={"message": "Not found."}))
+        results = dict([item async for item in no_retry_client.labels.get_many([1, 2])])
+        assert isinstance(results[1], Label)
+        assert isinstance(results[2], NotFoundError)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import httpx
 
+from discogs_sdk._exceptions import NotFoundError
 from discogs_sdk.models.master import Master, MasterVersion
 
 from tests.conftest import make_master, make_master_version, make_paginated_response
@@ -70,3 +71,12 @@ class TestMasterModel:
         )
         result = await client.masters.get(1)
         assert result.model_extra["_unknown_extra_field"] == "test"
+
+
+class TestMastersGetMany:
+    async def test_get_many(self, no_retry_client, respx_mock):
+        respx_mock.get("/masters/1").mock(return_value=httpx.Response(200, json=make_master(id=1)))
+        respx_mock.get("/masters/2").mock(return_value=httpx.Response(404, json={"message": "Not found."}))
+        results = dict([item async for item in no_retry_client.masters.get_many([1, 2])])
+        assert isinstance(results[1], Master)
+        assert isinstance(results[2], NotFoundError)
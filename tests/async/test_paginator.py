@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
+from discogs_sdk import AsyncDiscogs
 from discogs_sdk._async._paginator import AsyncPage
 from discogs_sdk._exceptions import DiscogsAPIError
 from discogs_sdk.models.release import Release
@@ -254,3 +257,115 @@ class TestCustomItemsKey:
         page = AsyncPage(client=client, path="/wants", params={}, model_cls=Want, items_key="wants")
         results = [item async for item in page]
         assert len(results) == 1
+
+
+def _numbered_pages(pages: int, per_page: int = 2):
+    """respx side effect serving page N of a `pages`-page listing from the ``page`` query param."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params.get("page", "1"))
+        items = [make_release(id=number * 100 + i) for i in range(per_page)]
+        next_url = f"{BASE_URL}/releases?page={number + 1}" if number < pages else None
+        body = make_paginated_response(
+            "releases",
+            items,
+            page=number,
+            pages=pages,
+            per_page=per_page,
+            total_items=pages * per_page,
+            next_url=next_url,
+        )
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+class TestPrefetch:
+    async def test_yields_items_in_order(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        results = [item.id async for item in page.prefetch(3)]
+        assert results == [n * 100 + i for n in range(1, 6) for i in range(2)]
+        requested = sorted(int(call.request.url.params["page"]) for call in respx_mock.calls)
+        assert requested == [1, 2, 3, 4, 5]
+
+    async def test_fetches_upcoming_pages_after_first(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = AsyncPage(
+            client=client, path="/releases", params={"per_page": 2}, model_cls=Release, items_key="releases"
+        )
+        page.prefetch(2)
+        await page.__anext__()
+        await asyncio.sleep(0)  # let the prefetch tasks run
+        requested = sorted(int(call.request.url.params["page"]) for call in respx_mock.calls)
+        assert requested == [1, 2, 3]
+        # Prefetched requests keep the original params.
+        assert all(call.request.url.params["per_page"] == "2" for call in respx_mock.calls)
+        await page.aclose()
+
+    async def test_never_requests_past_last_page(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(2))
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        results = [item async for item in page.prefetch(10)]
+        assert len(results) == 4
+        assert respx_mock.calls.call_count == 2
+
+    async def test_starts_from_requested_page(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(4))
+        page = AsyncPage(client=client, path="/releases", params={"page": 3}, model_cls=Release, items_key="releases")
+        results = [item.id async for item in page.prefetch(2)]
+        assert results == [300, 301, 400, 401]
+
+    async def test_error_surfaces_at_its_page(self, no_retry_client, respx_mock):
+        ok = _numbered_pages(3)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("page") == "3":
+                return httpx.Response(500, json={"message": "Server Error"})
+            return ok(request)
+
+        respx_mock.get("/releases").mock(side_effect=handler)
+        page = AsyncPage(client=no_retry_client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        seen = []
+        with pytest.raises(DiscogsAPIError):
+            async for item in page.prefetch(2):
+                seen.append(item.id)
+        assert seen == [100, 101, 200, 201]
+
+    async def test_aclose_cancels_pending_and_stops(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        page.prefetch(3)
+        await page.__anext__()
+        await page.aclose()
+        assert not page._pending
+        assert [item async for item in page] == []
+
+    async def test_break_cancels_pending(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        pending = []
+        async for _ in page.prefetch(3):
+            pending = list(page._pending)
+            break
+        for _ in range(3):  # let the loop finalize the abandoned iterator
+            await asyncio.sleep(0)
+        assert pending
+        assert all(request.done() for request in pending)
+        assert not page._pending
+        assert [item.id async for item in page][:2] == [101, 200]
+
+    async def test_prefetch_bounded_by_max_connections(self, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(10))
+        client = AsyncDiscogs(token="test-token", max_connections=2)
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        page.prefetch(5)
+        await page.__anext__()
+        assert len(page._pending) == 2
+        await page.aclose()
+        await client.close()
+
+    def test_negative_prefetch_rejected(self, client):
+        page = AsyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        with pytest.raises(ValueError):
+            page.prefetch(-1)
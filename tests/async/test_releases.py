@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
+from discogs_sdk._exceptions import NotFoundError
+
 from discogs_sdk.models.release import (
     CommunityRating,
     MarketplaceReleaseStats,
@@ -159,3 +163,53 @@ class TestReleaseModel:
         )
         result = await client.releases.get(1)
         assert result.model_extra["unknown_field"] == "val"
+
+
+class TestReleasesGetMany:
+    async def test_yields_every_id(self, client, respx_mock):
+        for i in (1, 2, 3):
+            respx_mock.get(f"/releases/{i}").mock(return_value=httpx.Response(200, json=make_release(id=i)))
+        results = {release_id: result async for release_id, result in client.releases.get_many([1, 2, 3])}
+        assert sorted(results) == [1, 2, 3]
+        assert all(isinstance(r, Release) and r.id == i for i, r in results.items())
+
+    async def test_failures_reported_per_id(self, no_retry_client, respx_mock):
+        respx_mock.get("/releases/1").mock(return_value=httpx.Response(200, json=make_release(id=1)))
+        respx_mock.get("/releases/2").mock(return_value=httpx.Response(404, json={"message": "Release not found."}))
+        results = dict([item async for item in no_retry_client.releases.get_many([1, 2])])
+        assert isinstance(results[1], Release)
+        assert isinstance(results[2], NotFoundError)
+
+    async def test_concurrency_is_bounded(self, client, respx_mock):
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            release_id = int(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(200, json=make_release(id=release_id))
+
+        respx_mock.get(url__regex=r"/releases/\d+$").mock(side_effect=handler)
+        results = [item async for item in client.releases.get_many(range(10), concurrency=3)]
+        assert len(results) == 10
+        assert peak == 3
+
+    async def test_uses_cache(self, respx_mock):
+        from discogs_sdk import AsyncDiscogs
+
+        route = respx_mock.get("/releases/1").mock(return_value=httpx.Response(200, json=make_release(id=1)))
+        client = AsyncDiscogs(token="t", cache=True)
+        await client.releases.get(1)
+        results = [item async for item in client.releases.get_many([1, 1])]
+        assert len(results) == 2
+        assert route.call_count == 1
+        await client.close()
+
+    async def test_invalid_concurrency(self, client):
+        with pytest.raises(ValueError):
+            async for _ in client.releases.get_many([1], concurrency=0):
+                pass
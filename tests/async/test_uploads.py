@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+from unittest.mock import AsyncMock, patch
+
 import httpx
 import pytest
 
+from discogs_sdk import AsyncDiscogs
+from discogs_sdk._cache import MemoryCache
 from discogs_sdk._exceptions import DiscogsAPIError
-from discogs_sdk.models.upload import Upload
+from discogs_sdk._poll import PollPolicy
+from discogs_sdk.models.upload import Upload, UploadBatch
 
 from tests.conftest import make_paginated_response, make_upload
 
@@ -56,6 +63,195 @@ class TestUploadsDelete:
             await client.uploads.delete(file=str(csv_file))
 
 
+class TestUploadsStreaming:
+    async def test_accepts_path_object(self, client, respx_mock, tmp_path):
+        csv_file = tmp_path / "inventory.csv"
+        csv_file.write_text("release_id,price\n1,9.99\n")
+        route = respx_mock.post("/inventory/upload/add").mock(return_value=httpx.Response(200))
+        await client.uploads.create(file=csv_file)
+        body = route.calls.last.request.content
+        assert b'filename="inventory.csv"' in body
+        assert b"release_id,price\n1,9.99\n" in body
+
+    async def test_path_opened_and_closed_off_the_event_loop(self, client, respx_mock, tmp_path):
+        csv_file = tmp_path / "inventory.csv"
+        csv_file.write_text("release_id,price\n1,9.99\n")
+        respx_mock.post("/inventory/upload/add").mock(return_value=httpx.Response(200))
+        with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await client.uploads.create(file=csv_file)
+        (open_call, close_call) = to_thread.call_args_list
+        assert open_call.args[1] == csv_file
+        assert close_call.args[0].__name__ == "close"
+
+    async def test_accepts_file_object(self, client, respx_mock):
+        route = respx_mock.post("/inventory/upload/change").mock(return_value=httpx.Response(200))
+        await client.uploads.change(file=io.BytesIO(b"listing_id,price\n1,9.99\n"))
+        body = route.calls.last.request.content
+        assert b'filename="upload.csv"' in body
+        assert b"listing_id,price\n1,9.99\n" in body
+
+    async def test_reports_progress(self, client, respx_mock):
+        data = b"listing_id\n" + b"123456\n" * 50_000
+        respx_mock.post("/inventory/upload/delete").mock(return_value=httpx.Response(200))
+        progress: list[tuple[int, int | None]] = []
+        await client.uploads.delete(file=io.BytesIO(data), progress=lambda sent, total: progress.append((sent, total)))
+        assert len(progress) > 1
+        assert progress[-1] == (len(data), len(data))
+        assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+    async def test_retry_resends_whole_file(self, client, respx_mock):
+        responses = iter([httpx.Response(503), httpx.Response(200)])
+        route = respx_mock.post("/inventory/upload/add").mock(side_effect=lambda request: next(responses))
+        progress: list[int] = []
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await client.uploads.create(
+                file=io.BytesIO(b"release_id\n1\n"), progress=lambda sent, _: progress.append(sent)
+            )
+        assert route.call_count == 2
+        assert b"release_id\n1\n" in route.calls.last.request.content
+        assert progress == [13, 13]
+
+
+class TestUploadsInChunks:
+    @staticmethod
+    def mock_jobs(respx_mock, path="/inventory/upload/add", statuses=("pending", "success")):
+        """Accept every chunk as a new job whose status goes through *statuses* as it is polled."""
+        posted: list[bytes] = []
+        polls: dict[int, int] = {}
+
+        def accept(request):
+            posted.append(request.content)
+            return httpx.Response(201, headers={"Location": f"https://api.discogs.com/inventory/upload/{len(posted)}"})
+
+        def status(request, upload_id):
+            count = polls[int(upload_id)] = polls.get(int(upload_id), 0) + 1
+            return httpx.Response(
+                200, json=make_upload(id=int(upload_id), status=statuses[min(count, len(statuses)) - 1])
+            )
+
+        respx_mock.post(path).mock(side_effect=accept)
+        respx_mock.get(path__regex=r"/inventory/upload/(?P<upload_id>\d+)$").mock(side_effect=status)
+        return posted, polls
+
+    async def test_splits_uploads_and_polls(self, client, respx_mock):
+        posted, polls = self.mock_jobs(respx_mock)
+        data = b"release_id,price\n" + b"".join(b"%d,9.99\n" % i for i in range(5))
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            batch = await client.uploads.create_in_chunks(file=io.BytesIO(data), rows_per_chunk=2)
+        assert isinstance(batch, UploadBatch)
+        assert sorted(batch.uploads) == [1, 2, 3]
+        assert all(upload.status == "success" for upload in batch.uploads.values())
+        assert batch.rows == 5
+        assert batch.failed_chunks == []
+        assert len(posted) == 3
+        assert all(b"release_id,price\r\n" in body for body in posted)
+        assert sum(body.count(b",9.99") for body in posted) == 5
+        assert polls == {1: 2, 2: 2, 3: 2}
+
+    async def test_chunk_names_derive_from_file(self, client, respx_mock, tmp_path):
+        posted, _ = self.mock_jobs(respx_mock, "/inventory/upload/change", statuses=("success",))
+        csv_file = tmp_path / "inventory.csv"
+        csv_file.write_text("listing_id,price\n1,1\n2,2\n")
+        await client.uploads.change_in_chunks(file=csv_file, rows_per_chunk=1)
+        names = sorted(body.split(b'filename="')[1].split(b'"')[0] for body in posted)
+        assert names == [b"inventory-0001.csv", b"inventory-0002.csv"]
+
+    async def test_quoted_newlines_stay_in_one_row(self, client, respx_mock):
+        posted, _ = self.mock_jobs(respx_mock, "/inventory/upload/delete", statuses=("success",))
+        data = b'listing_id,comments\n1,"two\nlines"\n2,plain\n'
+        batch = await client.uploads.delete_in_chunks(file=io.BytesIO(data), rows_per_chunk=1)
+        assert batch.rows == 2
+        assert any(b'1,"two\nlines"' in body for body in posted)
+
+    async def test_failed_chunk_does_not_stop_others(self, no_retry_client, respx_mock):
+        responses = iter([httpx.Response(422, json={"message": "Bad row"})])
+
+        def accept(request):
+            if b"bad" in request.content:
+                return next(responses)
+            return httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/upload/7"})
+
+        respx_mock.post("/inventory/upload/add").mock(side_effect=accept)
+        respx_mock.get("/inventory/upload/7").mock(
+            return_value=httpx.Response(200, json=make_upload(id=7, status="success"))
+        )
+        data = b"release_id\n1\nbad\n3\n"
+        batch = await no_retry_client.uploads.create_in_chunks(file=io.BytesIO(data), rows_per_chunk=1, concurrency=1)
+        assert sorted(batch.uploads) == [1, 3]
+        assert batch.failed_chunks == [2]
+        assert "Bad row" in batch.errors[2]
+
+    async def test_resend_selected_chunks(self, client, respx_mock):
+        posted, _ = self.mock_jobs(respx_mock, statuses=("success",))
+        data = b"release_id\n1\n2\n3\n"
+        batch = await client.uploads.create_in_chunks(file=io.BytesIO(data), rows_per_chunk=1, chunks=[2])
+        assert list(batch.uploads) == [2]
+        assert len(posted) == 1
+        assert b"release_id\r\n2\r\n" in posted[0]
+
+    async def test_transient_chunk_error_is_retried(self, no_retry_client, respx_mock):
+        responses = iter(
+            [
+                httpx.Response(503),
+                httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/upload/5"}),
+            ]
+        )
+        route = respx_mock.post("/inventory/upload/add").mock(side_effect=lambda request: next(responses))
+        respx_mock.get("/inventory/upload/5").mock(
+            return_value=httpx.Response(200, json=make_upload(id=5, status="success"))
+        )
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            batch = await no_retry_client.uploads.create_in_chunks(file=io.BytesIO(b"release_id\n1\n"), retries=1)
+        assert route.call_count == 2
+        assert sleep.await_count == 1
+        assert batch.uploads[1].id == 5
+
+    async def test_connection_error_is_retried(self, no_retry_client, respx_mock):
+        responses = iter(
+            [
+                httpx.ConnectError("down"),
+                httpx.Response(201, headers={"Location": "https://api.discogs.com/inventory/upload/5"}),
+            ]
+        )
+
+        def respond(request):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        route = respx_mock.post("/inventory/upload/add").mock(side_effect=respond)
+        respx_mock.get("/inventory/upload/5").mock(
+            return_value=httpx.Response(200, json=make_upload(id=5, status="success"))
+        )
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            batch = await no_retry_client.uploads.create_in_chunks(file=io.BytesIO(b"release_id\n1\n"), retries=1)
+        assert route.call_count == 2
+        assert batch.uploads[1].id == 5
+
+    async def test_missing_job_id_is_not_retried(self, no_retry_client, respx_mock):
+        route = respx_mock.post("/inventory/upload/add").mock(return_value=httpx.Response(201))
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            batch = await no_retry_client.uploads.create_in_chunks(file=io.BytesIO(b"release_id\n1\n"), retries=3)
+        assert route.call_count == 1
+        assert "job ID" in batch.errors[1]
+
+    async def test_poll_timeout_is_recorded(self, client, respx_mock):
+        self.mock_jobs(respx_mock, statuses=("pending",))
+        batch = await client.uploads.create_in_chunks(
+            file=io.BytesIO(b"release_id\n1\n"), poll=PollPolicy(initial=10, timeout=1)
+        )
+        assert batch.failed_chunks == [1]
+        assert "did not finish" in batch.errors[1]
+
+    async def test_polls_bypass_cache(self, respx_mock):
+        _, polls = self.mock_jobs(respx_mock)
+        async with AsyncDiscogs(token="t", cache=MemoryCache(ttl=60)) as cached_client:
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                await cached_client.uploads.create_in_chunks(file=io.BytesIO(b"release_id\n1\n"))
+        assert polls == {1: 2}
+
+
 class TestUploadsList:
     async def test_list(self, client, respx_mock):
         respx_mock.get("/inventory/upload").mock(
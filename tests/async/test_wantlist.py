@@ -6,9 +6,10 @@ import httpx
 import pytest
 
 from discogs_sdk._exceptions import NotFoundError
+from discogs_sdk._index import LocalIndex
 from discogs_sdk.models.wantlist import Want
 
-from tests.conftest import make_paginated_response, make_want
+from tests.conftest import make_paginated_response, make_want, serve_pages
 
 
 class TestWantlistList:
@@ -78,6 +79,41 @@ class TestWantlistDelete:
             await lazy.wantlist.delete(999)
 
 
+class TestWantlistSync:
+    PATH = "/users/trent_reznor/wants"
+
+    async def test_sync_added_changed_removed(self, client, respx_mock):
+        wants = [make_want(id=3), make_want(id=2), make_want(id=1, notes="maybe")]
+        route = respx_mock.get(self.PATH).mock(side_effect=serve_pages(self.PATH, "wants", wants))
+        index = LocalIndex(":memory:")
+        wantlist = client.users.get("trent_reznor").wantlist
+        assert [event.kind for event in await wantlist.sync(index)] == ["added"] * 3
+        wants[:] = [make_want(id=4), make_want(id=3, rating=5), make_want(id=1, notes="maybe")]
+        route.reset()
+        events = await wantlist.sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("added", 4), ("changed", 3), ("removed", 2)]
+        assert isinstance(events[0].item, Want)
+        assert route.call_count == 1 + 2
+        assert await wantlist.sync(index) == []
+        index.close()
+
+    async def test_oldest_first_server_falls_back_to_full_walk(self, client, respx_mock):
+        def want(n):
+            return make_want(id=n, date_added=f"2024-01-{n:02d}T10:00:00-08:00")
+
+        # A server ignoring sort=added&sort_order=desc lists the oldest wants first.
+        wants = [want(1), want(2), want(3)]
+        respx_mock.get(self.PATH).mock(side_effect=serve_pages(self.PATH, "wants", wants))
+        index = LocalIndex(":memory:")
+        wantlist = client.users.get("trent_reznor").wantlist
+        await wantlist.sync(index)
+        wants[:] = [want(1), want(3), want(4)]
+        events = await wantlist.sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("added", 4), ("removed", 2)]
+        assert sorted(index.load("wantlist:trent_reznor")) == [1, 3, 4]
+        index.close()
+
+
 class TestWantModel:
     async def test_required_fields(self, client, respx_mock):
         respx_mock.get("/users/trent_reznor/wants").mock(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import httpx
 import pytest
 
 BASE_URL = "https://api.discogs.com"
@@ -48,8 +49,12 @@ def make_collection_item(
     id: int = 400027,
     instance_id: int = 1,
     folder_id: int = 0,
+    date_added: str | None = None,
 ) -> dict[str, Any]:
-    return {"id": id, "instance_id": instance_id, "folder_id": folder_id}
+    d: dict[str, Any] = {"id": id, "instance_id": instance_id, "folder_id": folder_id}
+    if date_added is not None:
+        d["date_added"] = date_added
+    return d
 
 
 def make_collection_value() -> dict[str, Any]:
@@ -97,6 +102,27 @@ def make_paginated_response(
     }
 
 
+def serve_pages(path: str, items_key: str, items: list[dict[str, Any]], *, per_page: int = 2) -> Any:
+    """respx side effect serving *items* (read on each request, so tests can edit it) in pages of *per_page*."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        pages = max(1, -(-len(items) // per_page))
+        next_url = f"{BASE_URL}{path}?page={page + 1}" if page < pages else None
+        body = make_paginated_response(
+            items_key,
+            items[(page - 1) * per_page : page * per_page],
+            page=page,
+            pages=pages,
+            per_page=per_page,
+            total_items=len(items),
+            next_url=next_url,
+        )
+        return httpx.Response(200, json=body)
+
+    return respond
+
+
 def make_label(id: int = 26011, name: str = "Nothing Records") -> dict[str, Any]:
     return {"id": id, "name": name}
 
@@ -183,10 +209,13 @@ def make_want(
     id: int = 400027,
     notes: str | None = None,
     rating: int | None = None,
+    date_added: str | None = None,
 ) -> dict[str, Any]:
     d: dict[str, Any] = {"id": id, "basic_information": {"id": id, "title": "The Downward Spiral"}}
     if notes is not None:
         d["notes"] = notes
     if rating is not None:
         d["rating"] = rating
+    if date_added is not None:
+        d["date_added"] = date_added
     return d
@@ -0,0 +1,187 @@
+"""Minimal in-process Redis server for RedisCache tests."""
+
+from __future__ import annotations
+
+import re
+import socket
+import threading
+import time
+from collections.abc import Callable
+
+from typing_extensions import Self
+
+from discogs_sdk._redis import RedisError, _read_reply, _Reply
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a Redis glob (``*``, ``?``, ``[...]``, backslash escapes) to a regex."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        elif char == "*":
+            out.append(".*")
+        elif char == "?":
+            out.append(".")
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : end]
+                out.append("[^" + re.escape(body[1:]) + "]" if body.startswith("^") else "[" + re.escape(body) + "]")
+                i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return re.compile("".join(out) + r"\Z", re.DOTALL)
+
+
+def _encode(reply: _Reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, RedisError):
+        return b"-%s\r\n" % str(reply).encode()
+    if isinstance(reply, str):
+        return b"+%s\r\n" % reply.encode()
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(_encode(item) for item in reply)
+
+
+class FakeRedisServer:
+    """Minimal in-process Redis server.
+
+    Implements the commands ``RedisCache`` uses (``GET``, ``SET`` with
+    ``PX``/``EX``, ``MGET``, ``DEL``, ``SCAN``, ``PEXPIRE``, ``PTTL``) plus
+    ``PING``, ``AUTH``, ``SELECT``, ``DBSIZE`` and ``FLUSHDB``, with expiry.
+    All databases share one keyspace::
+
+        with FakeRedisServer() as server:
+            cache = RedisCache(ttl=60, url=server.url)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # key -> (value, expires_at on the monotonic clock, or None)
+        self._data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self._commands: dict[str, Callable[..., _Reply]] = {
+            "PING": lambda: "PONG",
+            "AUTH": lambda *args: "OK",
+            "SELECT": lambda db: "OK",
+            "GET": self._live,
+            "MGET": lambda *keys: [self._live(key) for key in keys],
+            "SET": self._set,
+            "DEL": lambda *keys: sum(self._data.pop(key, None) is not None for key in keys),
+            "PEXPIRE": self._pexpire,
+            "PTTL": self._pttl,
+            "SCAN": self._scan,
+            "DBSIZE": lambda: sum(self._live(key) is not None for key in list(self._data)),
+            "FLUSHDB": self._flushdb,
+        }
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._sock.getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._accept, name="fake-redis", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        # Unblocks accept() in the server thread, which then exits.
+        self._sock.shutdown(socket.SHUT_RDWR)
+        self._sock.close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), name="fake-redis-conn", daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as stream:
+            while True:
+                try:
+                    command = _read_reply(stream)
+                    conn.sendall(self._dispatch(command))
+                except OSError:
+                    return
+
+    def _dispatch(self, command: list[bytes]) -> bytes:
+        name, args = command[0].upper().decode(), command[1:]
+        with self._lock:
+            self.commands.append(command)
+            handler = self._commands.get(name)
+            if handler is None:
+                return _encode(RedisError(f"ERR unknown command '{name}'"))
+            try:
+                return _encode(handler(*args))
+            except (TypeError, ValueError) as exc:
+                return _encode(RedisError(f"ERR {exc}"))
+
+    def _live(self, key: bytes) -> bytes | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    def _set(self, key: bytes, value: bytes, *options: bytes) -> _Reply:
+        expires_at = None
+        opts = [option.upper() for option in options]
+        if b"PX" in opts:
+            expires_at = time.monotonic() + int(options[opts.index(b"PX") + 1]) / 1000
+        elif b"EX" in opts:
+            expires_at = time.monotonic() + int(options[opts.index(b"EX") + 1])
+        self._data[key] = (value, expires_at)
+        return "OK"
+
+    def _pexpire(self, key: bytes, milliseconds: bytes) -> _Reply:
+        value = self._live(key)
+        if value is None:
+            return 0
+        self._data[key] = (value, time.monotonic() + int(milliseconds) / 1000)
+        return 1
+
+    def _pttl(self, key: bytes) -> _Reply:
+        if self._live(key) is None:
+            return -2
+        expires_at = self._data[key][1]
+        return -1 if expires_at is None else int((expires_at - time.monotonic()) * 1000)
+
+    def _scan(self, cursor: bytes, *options: bytes) -> _Reply:
+        opts = [option.upper() for option in options]
+        pattern = _glob_to_regex(options[opts.index(b"MATCH") + 1].decode()) if b"MATCH" in opts else None
+        keys = [key for key in list(self._data) if self._live(key) is not None]
+        if pattern is not None:
+            keys = [key for key in keys if pattern.match(key.decode())]
+        # Everything fits in one batch: always return the final cursor.
+        return [b"0", keys]
+
+    def _flushdb(self) -> _Reply:
+        self._data.clear()
+        return "OK"
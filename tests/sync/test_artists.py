@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import httpx
 
-from discogs_sdk.models.artist import ArtistRelease
+from discogs_sdk._exceptions import NotFoundError
+from discogs_sdk.models.artist import Artist, ArtistRelease
 
 from tests.conftest import make_artist, make_artist_release, make_paginated_response
 
@@ -59,3 +60,12 @@ class TestArtistReleases:
         lazy = client.artists.get(40)
         results = list(lazy.releases.list(sort="year", sort_order="desc"))
         assert len(results) == 1
+
+
+class TestArtistsGetMany:
+    def test_get_many(self, no_retry_client, respx_mock):
+        respx_mock.get("/artists/1").mock(return_value=httpx.Response(200, json=make_artist(id=1)))
+        respx_mock.get("/artists/2").mock(return_value=httpx.Response(404, json={"message": "Not found."}))
+        results = dict(no_retry_client.artists.get_many([1, 2]))
+        assert isinstance(results[1], Artist)
+        assert isinstance(results[2], NotFoundError)
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
 import httpx
+import pytest
 import respx
 
 from discogs_sdk import Discogs
-from discogs_sdk._cache import MemoryCache, SQLiteCache
-from tests.conftest import BASE_URL
+from discogs_sdk._cache import MemoryCache, ModelCache, SQLiteCache, TTLPolicy, ZlibCodec
+from discogs_sdk.models import Release
+from discogs_sdk._exceptions import DiscogsConnectionError
+from discogs_sdk._rate_limit import RateLimiter
+from tests.conftest import BASE_URL, make_release
+
+_RATELIMIT_HEADERS_EXHAUSTED = {
+    "X-Discogs-Ratelimit": "60",
+    "X-Discogs-Ratelimit-Used": "60",
+    "X-Discogs-Ratelimit-Remaining": "0",
+}
 
 
 class TestCustomHttpClient:
@@ -19,6 +34,37 @@ class TestCustomHttpClient:
         custom.close()
 
 
+class TestConnectionPool:
+    def test_limits_passed_to_pool(self):
+        with patch("httpx.Client", wraps=httpx.Client) as factory:
+            client = Discogs(token="t", max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
+        limits = factory.call_args.kwargs["limits"]
+        assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (8, 4, 30.0)
+        client.close()
+
+    def test_concurrency_bounded_by_max_connections(self):
+        client = Discogs(token="t", max_connections=4)
+        assert client._bounded_concurrency(10) == 4
+        assert client._bounded_concurrency(2) == 2
+
+    def test_unlimited_pool_leaves_concurrency_alone(self):
+        assert Discogs(token="t", max_connections=None)._bounded_concurrency(500) == 500
+
+    def test_custom_client_leaves_concurrency_alone(self):
+        custom = httpx.Client()
+        client = Discogs(token="t", http_client=custom, max_connections=4)
+        assert client._bounded_concurrency(10) == 10
+        custom.close()
+
+    def test_http2_multiplexes_past_max_connections(self):
+        pytest.importorskip("h2")
+        with patch("httpx.Client", wraps=httpx.Client) as factory:
+            client = Discogs(token="t", http2=True, max_connections=4)
+        assert factory.call_args.kwargs["http2"] is True
+        assert client._bounded_concurrency(10) == 10
+        client.close()
+
+
 class TestCacheBranch:
     def test_cache_true_creates_memory_cache(self):
         client = Discogs(token="t", cache=True)
@@ -81,6 +127,269 @@ class TestCacheBranch:
             assert "content-encoding" not in r2.headers
             client.close()
 
+    def test_expired_entry_revalidated_with_304(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                side_effect=[
+                    httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}),
+                    httpx.Response(304),
+                ]
+            )
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            with patch.object(cache, "refresh", wraps=cache.refresh) as refresh:
+                r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            request = route.calls[1].request
+            assert request.headers["If-None-Match"] == '"v1"'
+            assert request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+            assert r2.status_code == 200
+            assert r2.json() == {"id": 1}
+            refresh.assert_called_once_with(f"GET:{BASE_URL}/releases/1")
+            client.close()
+
+    def test_unchanged_body_refreshes_instead_of_storing(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            with (
+                patch.object(cache, "refresh", wraps=cache.refresh) as refresh,
+                patch.object(cache, "set", wraps=cache.set) as store,
+            ):
+                r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            refresh.assert_called_once()
+            store.assert_not_called()
+            client.close()
+
+    def test_changed_body_replaces_stale_entry(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.Response(200, json={"id": 2})]
+            )
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 2}
+            stale = cache.get_stale(f"GET:{BASE_URL}/releases/1")
+            assert stale is not None
+            assert stale[0][2] == b'{"id":2}'
+            client.close()
+
+    def test_no_validators_without_stale_ttl(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers={"ETag": '"v1"'})
+            )
+            client = Discogs(token="t", cache=MemoryCache(ttl=0))
+            client._send("GET", f"{BASE_URL}/releases/1")
+            client._send("GET", f"{BASE_URL}/releases/1")
+            assert "If-None-Match" not in route.calls[1].request.headers
+            client.close()
+
+    def test_stale_while_revalidate_serves_stale_and_refreshes(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.Response(200, json={"id": 2})]
+            )
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            for thread in list(client._background):
+                thread.join()
+            assert route.call_count == 2
+            stale = cache.get_stale(f"GET:{BASE_URL}/releases/1")
+            assert stale is not None
+            assert stale[0][2] == b'{"id":2}'
+            client.close()
+
+    def test_stale_while_revalidate_skips_keys_already_revalidating(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            client._revalidating.add(f"GET:{BASE_URL}/releases/1")
+            client._send("GET", f"{BASE_URL}/releases/1")
+            assert not client._background
+            assert route.call_count == 1
+            client.close()
+
+    def test_background_revalidation_failure_keeps_stale_entry(self):
+        cache = MemoryCache(ttl=0, stale_while_revalidate=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[httpx.Response(200, json={"id": 1}), httpx.ConnectError("down")]
+            )
+            client = Discogs(token="t", cache=cache, max_retries=0)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            assert r2.json() == {"id": 1}
+            for thread in list(client._background):
+                thread.join()
+            assert not client._revalidating
+            assert cache.get_stale(f"GET:{BASE_URL}/releases/1") is not None
+            client.close()
+
+    def test_ttl_policy_never_caches_matching_paths(self):
+        policy = TTLPolicy({"/marketplace/*": None}, default=86400)
+        with respx.mock(base_url=BASE_URL) as router:
+            stats = router.get("/marketplace/stats/1").mock(return_value=httpx.Response(200, json={}))
+            release = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            client = Discogs(token="t", cache=True, cache_ttl=policy)
+            for _ in range(2):
+                client._send("GET", f"{BASE_URL}/marketplace/stats/1")
+                client._send("GET", f"{BASE_URL}/releases/1")
+            assert stats.call_count == 2
+            assert release.call_count == 1
+            client.close()
+
+    def test_model_cache_true_creates_model_cache(self):
+        client = Discogs(token="t", cache=True, model_cache=True)
+        assert isinstance(client._model_cache, ModelCache)
+
+    def test_model_cache_skips_validation_on_cache_hit(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json=make_release(id=1)))
+            client = Discogs(token="t", cache=True, model_cache=True)
+            first = client.releases.get(1)._resolve()
+            with patch.object(Release, "model_validate", wraps=Release.model_validate) as validate:
+                second = client.releases.get(1)._resolve()
+            validate.assert_not_called()
+            assert route.call_count == 1
+            assert second == first
+            assert second is not first
+            client.close()
+
+    def test_model_cache_reparses_changed_body(self):
+        cache = MemoryCache(ttl=0, stale_ttl=60)
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                side_effect=[
+                    httpx.Response(200, json=make_release(id=1, title="Old")),
+                    httpx.Response(200, json=make_release(id=1, title="New")),
+                ]
+            )
+            client = Discogs(token="t", cache=cache, model_cache=True)
+            first = client.releases.get(1)._resolve()
+            second = client.releases.get(1)._resolve()
+            assert isinstance(first, Release) and isinstance(second, Release)
+            assert first.title == "Old"
+            assert second.title == "New"
+            client.close()
+
+    def test_write_invalidates_resource_and_parent_list(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            listing = router.get("/users/bob/wants").mock(return_value=httpx.Response(200, json={}))
+            want = router.get("/users/bob/wants/1").mock(return_value=httpx.Response(200, json={}))
+            sibling = router.get("/users/bob/wants/2").mock(return_value=httpx.Response(200, json={}))
+            router.put("/users/bob/wants/1").mock(return_value=httpx.Response(201, json={}))
+            client = Discogs(token="t", cache=True)
+            for _ in range(2):
+                client._send("GET", f"{BASE_URL}/users/bob/wants", params={"page": 2})
+                client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+                client._send("GET", f"{BASE_URL}/users/bob/wants/2")
+                if listing.call_count == 1:
+                    client._send("PUT", f"{BASE_URL}/users/bob/wants/1", json={"rating": 5})
+            assert listing.call_count == 2
+            assert want.call_count == 2
+            assert sibling.call_count == 1
+            client.close()
+
+    def test_write_invalidates_every_ancestor_collection(self):
+        folders = "/users/bob/collection/folders"
+        with respx.mock(base_url=BASE_URL) as router:
+            routes = [
+                router.get(path).mock(return_value=httpx.Response(200, json={}))
+                for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases")
+            ]
+            router.delete(f"{folders}/1/releases/5/instances/9").mock(return_value=httpx.Response(204))
+            client = Discogs(token="t", cache=True)
+            for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases"):
+                client._send("GET", f"{BASE_URL}{path}", params={"page": 1})
+            client._send("DELETE", f"{BASE_URL}{folders}/1/releases/5/instances/9")
+            for path in (folders, f"{folders}/1/releases", f"{folders}/0/releases"):
+                client._send("GET", f"{BASE_URL}{path}", params={"page": 1})
+            assert [route.call_count for route in routes] == [2, 2, 2]
+            client.close()
+
+    def test_adding_to_folder_invalidates_all_folder_and_folder_list(self):
+        folders = "/users/bob/collection/folders"
+        with respx.mock(base_url=BASE_URL) as router:
+            all_folder = router.get(f"{folders}/0/releases").mock(return_value=httpx.Response(200, json={}))
+            folder_list = router.get(folders).mock(return_value=httpx.Response(200, json={}))
+            other = router.get(f"{folders}/2/releases").mock(return_value=httpx.Response(200, json={}))
+            router.post(f"{folders}/1/releases/5").mock(return_value=httpx.Response(201, json={}))
+            client = Discogs(token="t", cache=True)
+            for _ in range(2):
+                client._send("GET", f"{BASE_URL}{folders}/0/releases")
+                client._send("GET", f"{BASE_URL}{folders}")
+                client._send("GET", f"{BASE_URL}{folders}/2/releases")
+                if all_folder.call_count == 1:
+                    client._send("POST", f"{BASE_URL}{folders}/1/releases/5")
+            assert all_folder.call_count == 2
+            assert folder_list.call_count == 2
+            assert other.call_count == 1
+            client.close()
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
+    def test_listing_write_invalidates_seller_inventory(self, method):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/marketplace/listings/7").mock(
+                return_value=httpx.Response(200, json={"id": 7, "seller": {"username": "bob"}})
+            )
+            inventory = router.get("/users/bob/inventory").mock(return_value=httpx.Response(200, json={}))
+            router.route(method=method, path="/marketplace/listings/7").mock(return_value=httpx.Response(204))
+            client = Discogs(token="t", cache=True)
+            client._send("GET", f"{BASE_URL}/marketplace/listings/7")
+            client._send("GET", f"{BASE_URL}/users/bob/inventory", params={"page": 1})
+            client._send(method, f"{BASE_URL}/marketplace/listings/7")
+            client._send("GET", f"{BASE_URL}/users/bob/inventory", params={"page": 1})
+            assert inventory.call_count == 2
+            client.close()
+
+    def test_new_listing_invalidates_identity_inventory(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/oauth/identity").mock(return_value=httpx.Response(200, json={"id": 1, "username": "bob"}))
+            inventory = router.get("/users/bob/inventory").mock(return_value=httpx.Response(200, json={}))
+            router.post("/marketplace/listings").mock(return_value=httpx.Response(201, json={"listing_id": 7}))
+            client = Discogs(token="t", cache=True)
+            client._send("GET", f"{BASE_URL}/oauth/identity")
+            client._send("GET", f"{BASE_URL}/users/bob/inventory")
+            client._send("POST", f"{BASE_URL}/marketplace/listings", json={"release_id": 1})
+            client._send("GET", f"{BASE_URL}/users/bob/inventory")
+            assert inventory.call_count == 2
+            client.close()
+
+    def test_failed_write_keeps_cache(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            want = router.get("/users/bob/wants/1").mock(return_value=httpx.Response(200, json={}))
+            router.delete("/users/bob/wants/1").mock(return_value=httpx.Response(404, json={"message": "nope"}))
+            client = Discogs(token="t", cache=True)
+            client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+            client._send("DELETE", f"{BASE_URL}/users/bob/wants/1")
+            client._send("GET", f"{BASE_URL}/users/bob/wants/1")
+            assert want.call_count == 1
+            client.close()
+
+    def test_compressed_cache_is_transparent(self):
+        cache = MemoryCache(ttl=60, codec=ZlibCodec())
+        payload = {"id": 1, "notes": "x" * 1000}
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json=payload))
+            client = Discogs(token="t", cache=cache)
+            client._send("GET", f"{BASE_URL}/releases/1")
+            r2 = client._send("GET", f"{BASE_URL}/releases/1")
+            assert route.call_count == 1
+            assert r2.json() == payload
+            assert cache.size_bytes < 500
+            client.close()
+
     def test_no_cache_context_manager(self):
         with respx.mock(base_url=BASE_URL) as router:
             route = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
@@ -105,6 +414,152 @@ class TestCacheBranch:
         client = Discogs(token="t", cache=False)
         client.clear_cache()  # should not raise
 
+    def test_warm_cache_fetches_paths(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            router.get("/releases/2").mock(return_value=httpx.Response(200, json={"id": 2}))
+            router.get("/releases/3").mock(return_value=httpx.Response(404, json={"message": "Not found"}))
+            client = Discogs(token="t", cache=True)
+            warmed = client.warm_cache(["/releases/1", "/releases/2", "/releases/3"], concurrency=2)
+            assert warmed == 2
+            assert client._cache is not None
+            assert client._cache.get(f"GET:{BASE_URL}/releases/2") is not None
+            assert router.calls.call_count == 3
+            client.warm_cache(["/releases/1"])
+            assert router.calls.call_count == 3  # already cached
+            client.close()
+
+    def test_warm_cache_requires_cache(self):
+        client = Discogs(token="t", cache=False)
+        with pytest.raises(ValueError, match="caching"):
+            client.warm_cache(["/releases/1"])
+
+
+class TestRateLimiting:
+    def test_rate_limiter_enabled_by_default(self):
+        client = Discogs(token="t")
+        assert isinstance(client._rate_limiter, RateLimiter)
+
+    def test_rate_limit_false_disables_limiter(self):
+        client = Discogs(token="t", rate_limit=False)
+        assert client._rate_limiter is None
+
+    def test_rate_limiter_instance_shared(self):
+        limiter = RateLimiter()
+        c1 = Discogs(token="t", rate_limit=limiter)
+        c2 = Discogs(token="t", rate_limit=limiter)
+        assert c1._rate_limiter is c2._rate_limiter is limiter
+
+    def test_response_headers_update_limiter(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = Discogs(token="t")
+            client._send("GET", f"{BASE_URL}/releases/1")
+            assert client._rate_limiter is not None
+            assert client._rate_limiter.limit == 60
+            client.close()
+
+    def test_paces_requests_when_budget_exhausted(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = Discogs(token="t")
+            with patch("time.sleep") as mock_sleep:
+                client._send("GET", f"{BASE_URL}/releases/1")
+                mock_sleep.assert_not_called()
+                client._send("GET", f"{BASE_URL}/releases/1")
+            mock_sleep.assert_called_once()
+            assert mock_sleep.call_args[0][0] > 0
+            client.close()
+
+    def test_no_pacing_when_disabled(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            router.get("/releases/1").mock(
+                return_value=httpx.Response(200, json={"id": 1}, headers=_RATELIMIT_HEADERS_EXHAUSTED)
+            )
+            client = Discogs(token="t", rate_limit=False)
+            with patch("time.sleep") as mock_sleep:
+                client._send("GET", f"{BASE_URL}/releases/1")
+                client._send("GET", f"{BASE_URL}/releases/1")
+            mock_sleep.assert_not_called()
+            client.close()
+
+
+class TestRequestCoalescing:
+    @staticmethod
+    def _send_concurrently(
+        client: Discogs, route: respx.Route, count: int, payload: dict[str, Any] | Exception
+    ) -> list[object]:
+        """Issue *count* identical GETs from threads while the first one is held in flight."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            started.set()
+            release.wait(5)
+            if isinstance(payload, Exception):
+                raise payload
+            return httpx.Response(200, json=payload)
+
+        route.side_effect = respond
+        results: list[object] = []
+
+        def call() -> None:
+            try:
+                results.append(client._send("GET", f"{BASE_URL}/masters/1"))
+            except Exception as exc:
+                results.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1")
+            client = Discogs(token="t")
+            responses = self._send_concurrently(client, route, 5, {"id": 1})
+            assert route.call_count == 1
+            assert all(isinstance(r, httpx.Response) and r.json() == {"id": 1} for r in responses)
+            assert not client._in_flight
+            client.close()
+
+    def test_post_not_coalesced(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.post("/lists").mock(return_value=httpx.Response(200, json={}))
+            client = Discogs(token="t")
+            for _ in range(3):
+                client._send("POST", f"{BASE_URL}/lists")
+            assert route.call_count == 3
+            client.close()
+
+    def test_disabled(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1")
+            client = Discogs(token="t", coalesce_requests=False)
+            self._send_concurrently(client, route, 3, {"id": 1})
+            assert route.call_count == 3
+            client.close()
+
+    def test_error_propagates_to_every_caller(self):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/masters/1")
+            client = Discogs(token="t", max_retries=0)
+            results = self._send_concurrently(client, route, 3, httpx.ConnectError("down"))
+            assert route.call_count == 1
+            assert all(isinstance(r, DiscogsConnectionError) for r in results)
+            client.close()
+
 
 class TestOAuthInSend:
     def test_oauth_headers_injected(self):
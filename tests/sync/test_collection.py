@@ -5,7 +5,10 @@ from __future__ import annotations
 import httpx
 import pytest
 
+from discogs_sdk import Discogs
+from discogs_sdk._cache import MemoryCache
 from discogs_sdk._exceptions import NotFoundError
+from discogs_sdk._index import LocalIndex
 from discogs_sdk.models.collection import (
     CollectionField,
     CollectionFolder,
@@ -18,6 +21,7 @@ from tests.conftest import (
     make_collection_item,
     make_collection_value,
     make_paginated_response,
+    serve_pages,
 )
 
 
@@ -221,3 +225,80 @@ class TestCollectionValue:
         lazy = client.users.get("trent_reznor")
         result = lazy.collection.value.get()
         assert result.median == "$10.00"
+
+
+def added(day: int) -> str:
+    return f"2024-01-{day:02d}T10:00:00-08:00"
+
+
+class TestFolderReleasesSync:
+    PATH = "/users/trent_reznor/collection/folders/0/releases"
+
+    @pytest.fixture
+    def items(self):
+        return [make_collection_item(id=400000 + n, instance_id=n, date_added=added(n)) for n in range(5, 0, -1)]
+
+    @pytest.fixture
+    def route(self, respx_mock, items):
+        return respx_mock.get(self.PATH).mock(side_effect=serve_pages(self.PATH, "releases", items))
+
+    @pytest.fixture
+    def index(self):
+        index = LocalIndex(":memory:")
+        yield index
+        index.close()
+
+    def releases(self, client):
+        return client.users.get("trent_reznor").collection.folders.get(0).releases
+
+    def test_first_sync_adds_everything(self, client, route, index):
+        events = self.releases(client).sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("added", n) for n in range(5, 0, -1)]
+        assert isinstance(events[0].item, CollectionItem)
+        assert route.call_count == 3
+        assert dict(route.calls[0].request.url.params) == {
+            "page": "1",
+            "sort": "added",
+            "sort_order": "desc",
+            "per_page": "100",
+        }
+        assert sorted(index.load("collection:trent_reznor:0")) == [1, 2, 3, 4, 5]
+
+    def test_unchanged_costs_one_request(self, client, route, index):
+        self.releases(client).sync(index)
+        route.reset()
+        assert self.releases(client).sync(index) == []
+        assert route.call_count == 1
+
+    def test_new_items_stop_at_known(self, client, route, items, index):
+        self.releases(client).sync(index)
+        items.insert(0, make_collection_item(id=400006, instance_id=6, date_added=added(6)))
+        route.reset()
+        events = self.releases(client).sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("added", 6)]
+        assert route.call_count == 1
+
+    def test_changed_rating_of_newest_item(self, client, route, items, index):
+        self.releases(client).sync(index)
+        items[0] = {**items[0], "rating": 4}
+        events = self.releases(client).sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("changed", 5)]
+        assert index.load("collection:trent_reznor:0")[5].rating == 4
+
+    def test_removal_detected_by_count(self, client, route, items, index):
+        self.releases(client).sync(index)
+        del items[3]
+        items.insert(0, make_collection_item(id=400006, instance_id=6, date_added=added(6)))
+        route.reset()
+        events = self.releases(client).sync(index)
+        assert [(event.kind, event.item_id) for event in events] == [("added", 6), ("removed", 2)]
+        assert events[1].item is None
+        assert route.call_count == 1 + 3
+        assert sorted(index.load("collection:trent_reznor:0")) == [1, 3, 4, 5, 6]
+
+    def test_bypasses_response_cache(self, route, index):
+        with Discogs(token="t", cache=MemoryCache(ttl=60)) as cached_client:
+            self.releases(cached_client).sync(index)
+            route.reset()
+            self.releases(cached_client).sync(index)
+        assert route.call_count == 1
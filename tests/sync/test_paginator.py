@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+
 import httpx
 import pytest
 
+from discogs_sdk import Discogs
 from discogs_sdk._sync._paginator import SyncPage
 from discogs_sdk._exceptions import DiscogsAPIError
 from discogs_sdk.models.release import Release
@@ -191,3 +194,112 @@ class TestErrors:
         page = SyncPage(client=no_retry_client, path="/releases", params={}, model_cls=Release, items_key="releases")
         with pytest.raises(DiscogsAPIError):
             list(page)
+
+
+def _numbered_pages(pages: int, per_page: int = 2):
+    """respx side effect serving page N of a `pages`-page listing from the ``page`` query param."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params.get("page", "1"))
+        items = [make_release(id=number * 100 + i) for i in range(per_page)]
+        next_url = f"{BASE_URL}/releases?page={number + 1}" if number < pages else None
+        body = make_paginated_response(
+            "releases",
+            items,
+            page=number,
+            pages=pages,
+            per_page=per_page,
+            total_items=pages * per_page,
+            next_url=next_url,
+        )
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+class TestPrefetch:
+    def test_yields_items_in_order(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        results = [item.id for item in page.prefetch(3)]
+        assert results == [n * 100 + i for n in range(1, 6) for i in range(2)]
+        requested = sorted(int(call.request.url.params["page"]) for call in respx_mock.calls)
+        assert requested == [1, 2, 3, 4, 5]
+
+    def test_reads_ahead_on_worker_threads(self, client, respx_mock):
+        threads: set[str] = set()
+        serve = _numbered_pages(3)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            threads.add(threading.current_thread().name)
+            return serve(request)
+
+        respx_mock.get("/releases").mock(side_effect=handler)
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        page.prefetch(2)
+        next(page)
+        # Pages 2 and 3 are requested in the background while page 1 is consumed.
+        for request in list(page._pending):
+            request.result()
+        assert respx_mock.calls.call_count == 3
+        assert any(name.startswith("discogs-sdk-prefetch") for name in threads)
+        page.close()
+
+    def test_never_requests_past_last_page(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(2))
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        results = list(page.prefetch(10))
+        assert len(results) == 4
+        assert respx_mock.calls.call_count == 2
+
+    def test_error_surfaces_at_its_page(self, no_retry_client, respx_mock):
+        ok = _numbered_pages(3)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("page") == "3":
+                return httpx.Response(500, json={"message": "Server Error"})
+            return ok(request)
+
+        respx_mock.get("/releases").mock(side_effect=handler)
+        page = SyncPage(client=no_retry_client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        seen = []
+        with pytest.raises(DiscogsAPIError):
+            for item in page.prefetch(2):
+                seen.append(item.id)
+        assert seen == [100, 101, 200, 201]
+
+    def test_executor_released_when_exhausted(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(3))
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        list(page.prefetch(2))
+        assert page._executor is None
+
+    def test_break_cancels_pending(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        for _ in page.prefetch(3):
+            assert page._pending
+            break
+        assert not page._pending
+        assert page._executor is None
+        assert [item.id for item in page][:2] == [101, 200]
+
+    def test_close_cancels_pending_and_stops(self, client, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(5))
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        page.prefetch(3)
+        next(page)
+        page.close()
+        assert not page._pending
+        assert page._executor is None
+        assert list(page) == []
+
+    def test_prefetch_bounded_by_max_connections(self, respx_mock):
+        respx_mock.get("/releases").mock(side_effect=_numbered_pages(10))
+        client = Discogs(token="test-token", max_connections=2)
+        page = SyncPage(client=client, path="/releases", params={}, model_cls=Release, items_key="releases")
+        page.prefetch(5)
+        next(page)
+        assert len(page._pending) == 2
+        page.close()
+        client.close()
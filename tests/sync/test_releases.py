@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import httpx
 import pytest
 
@@ -133,3 +136,40 @@ class TestReleaseModel:
         )
         lazy = client.releases.get(1)
         assert lazy.model_extra["unknown_field"] == "val"
+
+
+class TestReleasesGetMany:
+    def test_yields_every_id(self, client, respx_mock):
+        for i in (1, 2, 3):
+            respx_mock.get(f"/releases/{i}").mock(return_value=httpx.Response(200, json=make_release(id=i)))
+        results = dict(client.releases.get_many([1, 2, 3]))
+        assert sorted(results) == [1, 2, 3]
+        assert all(r.id == i for i, r in results.items())
+
+    def test_failures_reported_per_id(self, no_retry_client, respx_mock):
+        respx_mock.get("/releases/1").mock(return_value=httpx.Response(200, json=make_release(id=1)))
+        respx_mock.get("/releases/2").mock(return_value=httpx.Response(404, json={"message": "Release not found."}))
+        results = dict(no_retry_client.releases.get_many([1, 2]))
+        assert results[1].id == 1
+        assert isinstance(results[2], NotFoundError)
+
+    def test_concurrency_is_bounded(self, client, respx_mock):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            release_id = int(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(200, json=make_release(id=release_id))
+
+        respx_mock.get(url__regex=r"/releases/\d+$").mock(side_effect=handler)
+        results = list(client.releases.get_many(range(10), concurrency=3))
+        assert len(results) == 10
+        assert 1 < peak <= 3
@@ -2,10 +2,62 @@
 
 from __future__ import annotations
 
+import gzip
+import sqlite3
+import threading
 import time
+import zlib
 from unittest.mock import patch
 
-from discogs_sdk._cache import MemoryCache, SQLiteCache
+import pytest
+
+from discogs_sdk._cache import (
+    CacheEntry,
+    Codec,
+    MemoryCache,
+    ModelCache,
+    ResponseCache,
+    SQLiteCache,
+    TieredCache,
+    TTLPolicy,
+    ZlibCodec,
+)
+from discogs_sdk.models import Artist, Release
+
+
+class TestTTLPolicy:
+    def test_first_matching_rule_wins(self):
+        policy = TTLPolicy({"/marketplace/stats/*": 60, "/marketplace/*": 300}, default=3600)
+        assert policy.ttl_for("GET:https://api.discogs.com/marketplace/stats/1") == 60
+        assert policy.ttl_for("GET:https://api.discogs.com/marketplace/listings/9") == 300
+
+    def test_unmatched_path_uses_default(self):
+        policy = TTLPolicy({"/marketplace/*": 300}, default=3600)
+        assert policy.ttl_for("GET:https://api.discogs.com/releases/1") == 3600
+
+    def test_query_string_ignored(self):
+        policy = TTLPolicy({"/users/*/inventory": None}, default=3600)
+        assert policy.ttl_for("GET:https://api.discogs.com/users/bob/inventory?page=2") is None
+
+    def test_memory_cache_skips_uncached_paths(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=TTLPolicy({"/releases/*": 86400, "/marketplace/*": None}, default=60))
+            cache.set("GET:http://x/releases/1", 200, {}, b"release")
+            cache.set("GET:http://x/marketplace/stats/1", 200, {}, b"stats")
+            cache.set("GET:http://x/artists/1", 200, {}, b"artist")
+        assert cache.get("GET:http://x/marketplace/stats/1") is None
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0 + 3600):
+            assert cache.get("GET:http://x/releases/1") == (200, {}, b"release")
+            assert cache.get("GET:http://x/artists/1") is None
+
+    def test_sqlite_cache_skips_uncached_paths(self, tmp_path):
+        cache = SQLiteCache(ttl=TTLPolicy({"/marketplace/*": None}, default=60), cache_dir=tmp_path)
+        cache.set("GET:http://x/marketplace/stats/1", 200, {}, b"stats")
+        cache.set("GET:http://x/releases/1", 200, {}, b"release")
+        cache.flush()
+        assert cache.get("GET:http://x/marketplace/stats/1") is None
+        assert cache.get("GET:http://x/releases/1") == (200, {}, b"release")
+        cache.close()
 
 
 class TestMemoryCache:
@@ -38,6 +90,150 @@ class TestMemoryCache:
         cache.set("GET:http://x/1", 200, {}, b"a")
         cache.close()  # should not raise
 
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = MemoryCache(ttl=60, max_entries=2)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.set("GET:http://x/2", 200, {}, b"b")
+        cache.get("GET:http://x/1")  # 1 is now more recent than 2
+        cache.set("GET:http://x/3", 200, {}, b"c")
+        assert cache.get("GET:http://x/2") is None
+        assert cache.get("GET:http://x/1") is not None
+        assert cache.get("GET:http://x/3") is not None
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_max_bytes_evicts_until_under_budget(self):
+        key = "GET:http://x/"
+        cache = MemoryCache(ttl=60, max_bytes=3 * (len(key) + 1 + 100))
+        for i in range(5):
+            cache.set(f"{key}{i}", 200, {}, b"x" * 100)
+        assert len(cache) == 3
+        assert cache.size_bytes <= 3 * (len(key) + 1 + 100)
+        assert cache.get(f"{key}0") is None
+        assert cache.get(f"{key}4") is not None
+        assert cache.evictions == 2
+
+    def test_entry_larger_than_max_bytes_not_stored(self):
+        cache = MemoryCache(ttl=60, max_bytes=50)
+        cache.set("GET:http://x/1", 200, {}, b"ok")
+        cache.set("GET:http://x/big", 200, {}, b"x" * 100)
+        assert cache.get("GET:http://x/big") is None
+        assert cache.get("GET:http://x/1") is not None
+
+    def test_overwrite_keeps_size_accurate(self):
+        cache = MemoryCache(ttl=60)
+        cache.set("k", 200, {"a": "b"}, b"x" * 10)
+        cache.set("k", 200, {"a": "b"}, b"x" * 20)
+        assert len(cache) == 1
+        assert cache.size_bytes == len("k") + 2 + 20
+
+    def test_clear_resets_size(self):
+        cache = MemoryCache(ttl=60)
+        cache.set("k", 200, {}, b"data")
+        cache.clear()
+        assert cache.size_bytes == 0
+        assert len(cache) == 0
+
+    def test_sweep_drops_expired_entries_on_write(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=10, sweep_interval=30)
+            cache.set("GET:http://x/old", 200, {}, b"old")
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1025.0):
+            cache.set("GET:http://x/1", 200, {}, b"new")
+            assert len(cache) == 2  # expired, but sweep not due yet
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1031.0):
+            cache.set("GET:http://x/2", 200, {}, b"new")
+            assert len(cache) == 2
+            assert "GET:http://x/old" not in cache._store
+        assert cache.evictions == 0
+
+    def test_hit_and_miss_counters(self):
+        cache = MemoryCache(ttl=60)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.get("GET:http://x/1")
+        cache.get("GET:http://x/1")
+        cache.get("GET:http://x/missing")
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_delete_and_delete_prefix(self):
+        cache = MemoryCache(ttl=60)
+        for key in ("GET:http://x/wants", "GET:http://x/wants?page=2", "GET:http://x/wants/1", "GET:http://x/other"):
+            cache.set(key, 200, {}, b"body")
+        cache.delete("GET:http://x/wants")
+        cache.delete_prefix("GET:http://x/wants?")
+        assert cache.get("GET:http://x/wants") is None
+        assert cache.get("GET:http://x/wants?page=2") is None
+        assert cache.get("GET:http://x/wants/1") is not None
+        assert cache.get("GET:http://x/other") is not None
+        assert cache.size_bytes == 2 * len(b"body") + len("GET:http://x/wants/1") + len("GET:http://x/other")
+
+    def test_stale_entry_kept_for_revalidation(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=10, stale_ttl=30)
+            cache.set("GET:http://x/1", 200, {"etag": '"v1"'}, b"data")
+            assert cache.get_stale("GET:http://x/1") == ((200, {"etag": '"v1"'}, b"data"), -10.0)
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1015.0):
+            assert cache.get("GET:http://x/1") is None
+            assert cache.get_stale("GET:http://x/1") == ((200, {"etag": '"v1"'}, b"data"), 5.0)
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1040.0):
+            assert cache.get_stale("GET:http://x/1") is None
+        assert len(cache) == 0
+
+    def test_refresh_restarts_ttl(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=10, stale_ttl=30)
+            cache.set("GET:http://x/1", 200, {}, b"data")
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1015.0):
+            cache.refresh("GET:http://x/1")
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1020.0):
+            assert cache.get("GET:http://x/1") == (200, {}, b"data")
+
+    def test_sweep_keeps_stale_entries(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=10, stale_ttl=30, sweep_interval=10)
+            cache.set("GET:http://x/1", 200, {}, b"a")
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1020.0):
+            cache.set("GET:http://x/2", 200, {}, b"b")
+        assert len(cache) == 2
+
+    def test_stale_while_revalidate_extends_retention(self):
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1000.0):
+            cache = MemoryCache(ttl=10, stale_while_revalidate=30)
+            cache.set("GET:http://x/1", 200, {}, b"data")
+        assert cache.stale_while_revalidate == 30
+        with patch("discogs_sdk._cache.time.monotonic", return_value=1035.0):
+            assert cache.get_stale("GET:http://x/1") == ((200, {}, b"data"), 25.0)
+
+    def test_codec_roundtrip(self):
+        cache = MemoryCache(ttl=60, codec=ZlibCodec())
+        body = b'{"tracklist": []}' * 100
+        cache.set("GET:http://x/1", 200, {"k": "v"}, body)
+        assert cache.get("GET:http://x/1") == (200, {"k": "v"}, body)
+
+    def test_codec_shrinks_accounted_size(self):
+        body = b'{"tracklist": []}' * 100
+        plain = MemoryCache(ttl=60)
+        compressed = MemoryCache(ttl=60, codec=ZlibCodec())
+        plain.set("GET:http://x/1", 200, {}, body)
+        compressed.set("GET:http://x/1", 200, {}, body)
+        assert compressed.size_bytes < plain.size_bytes / 5
+
+    def test_custom_codec(self):
+        class ReverseCodec(Codec):
+            name = "reverse"
+
+            def encode(self, data: bytes) -> bytes:
+                return data[::-1]
+
+            def decode(self, data: bytes) -> bytes:
+                return data[::-1]
+
+        cache = MemoryCache(ttl=60, codec=ReverseCodec())
+        cache.set("GET:http://x/1", 200, {}, b"abc")
+        assert cache._store["GET:http://x/1"][3] == b"cba"
+        assert cache.get("GET:http://x/1") == (200, {}, b"abc")
+
 
 class TestSQLiteCache:
     def test_set_get_roundtrip(self, tmp_path):
@@ -104,3 +300,555 @@ class TestSQLiteCache:
         row = cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()
         assert row[0] == 0
         cache.close()
+
+    def test_uses_wal_journal(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        assert cache._db is not None
+        assert cache._db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache.close()
+
+    def test_writes_are_buffered_until_batch_is_full(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=3, flush_interval=3600)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.set("GET:http://x/2", 200, {}, b"b")
+        assert cache._db is not None
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 0
+        # Buffered entries are still served.
+        assert cache.get("GET:http://x/1") == (200, {}, b"a")
+        cache.set("GET:http://x/3", 200, {}, b"c")
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 3
+        cache.close()
+
+    def test_flush_interval_triggers_commit(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=0)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        assert cache._db is not None
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 1
+        cache.close()
+
+    def test_flush_interval_commits_without_further_writes(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=0.05)
+        cache._last_flush = time.monotonic()  # the first write would otherwise flush at once
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.set("GET:http://x/2", 200, {}, b"b")
+        assert cache._db is not None
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 0
+        assert cache._flush_timer is not None
+        cache._flush_timer.join(5)
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 2
+        cache.close()
+
+    def test_explicit_flush(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=3600)
+        cache.set("GET:http://x/1", 200, {"k": "v"}, b"a")
+        cache.flush()
+        assert cache._db is not None
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 1
+        assert cache.get("GET:http://x/1") == (200, {"k": "v"}, b"a")
+        cache.close()
+
+    def test_close_flushes_buffered_writes(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=3600)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.close()
+        cache2 = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        assert cache2.get("GET:http://x/1") == (200, {}, b"a")
+        cache2.close()
+
+    def test_clear_drops_buffered_writes(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=3600)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.clear()
+        cache.flush()
+        assert cache.get("GET:http://x/1") is None
+        cache.close()
+
+    def test_reads_do_not_wait_for_writer(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.flush()
+        results: list[object] = []
+        with cache._write_lock:  # simulate a commit in progress
+            reader = threading.Thread(target=lambda: results.append(cache.get("GET:http://x/1")))
+            reader.start()
+            reader.join(timeout=2)
+            assert not reader.is_alive()
+        assert results == [(200, {}, b"a")]
+        cache.close()
+
+    def test_expires_at_is_indexed(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        assert cache._db is not None
+        plan = cache._db.execute("EXPLAIN QUERY PLAN DELETE FROM cache_entries WHERE expires_at <= 0").fetchall()
+        assert any("cache_entries_expires_at" in row[-1] for row in plan)
+        cache.close()
+
+    def test_outdated_schema_is_rebuilt(self, tmp_path):
+        db = sqlite3.connect(tmp_path / "cache.db")
+        db.execute(
+            "CREATE TABLE cache_entries (key TEXT PRIMARY KEY, expires_at REAL NOT NULL,"
+            " status INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL)"
+        )
+        db.execute("INSERT INTO cache_entries VALUES ('GET:http://x/1', 9e9, 200, '{}', x'00')")
+        db.commit()
+        db.close()
+
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        assert cache.get("GET:http://x/1") is None
+        cache.set("GET:http://x/1", 200, {}, b"new")
+        assert cache.get("GET:http://x/1") == (200, {}, b"new")
+        cache.close()
+
+    def test_purge_expired(self, tmp_path):
+        cache = SQLiteCache(ttl=10, cache_dir=tmp_path)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/old", 200, {}, b"old")
+        with patch("discogs_sdk._cache.time.time", return_value=1005.0):
+            cache.set("GET:http://x/new", 200, {}, b"new")
+        cache.flush()
+        with patch("discogs_sdk._cache.time.time", return_value=1012.0):
+            assert cache.purge_expired() == 1
+            assert cache.get("GET:http://x/new") == (200, {}, b"new")
+        assert cache._db is not None
+        assert cache._db.execute("SELECT key FROM cache_entries").fetchall() == [("GET:http://x/new",)]
+        cache.close()
+
+    def test_purge_expired_drops_buffered_writes(self, tmp_path):
+        cache = SQLiteCache(ttl=10, cache_dir=tmp_path, batch_size=1000, flush_interval=3600)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"a")
+        with patch("discogs_sdk._cache.time.time", return_value=1020.0):
+            cache.purge_expired()
+        cache.flush()
+        assert cache._db is not None
+        assert cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 0
+        cache.close()
+
+    def test_background_sweep(self, tmp_path):
+        cache = SQLiteCache(ttl=0, cache_dir=tmp_path, sweep_interval=0.01)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.flush()
+        assert cache._db is not None
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            with cache._write_lock:
+                if cache._db.execute("SELECT count(*) FROM cache_entries").fetchone()[0] == 0:
+                    break
+            time.sleep(0.01)
+        else:
+            raise AssertionError("sweep did not purge the expired row")
+        cache.close()
+        assert cache._sweeper is None
+
+    def test_max_bytes_evicts_oldest_entries(self, tmp_path):
+        key_size = len("GET:http://x/1") + len("{}")
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0, max_bytes=2 * (key_size + 100))
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"a" * 100)
+        with patch("discogs_sdk._cache.time.time", return_value=1001.0):
+            cache.set("GET:http://x/2", 200, {}, b"b" * 100)
+        with patch("discogs_sdk._cache.time.time", return_value=1002.0):
+            cache.set("GET:http://x/3", 200, {}, b"c" * 100)
+            assert cache.get("GET:http://x/1") is None
+            assert cache.get("GET:http://x/2") is not None
+            assert cache.get("GET:http://x/3") is not None
+        assert cache._bytes == 2 * (key_size + 100)
+        cache.close()
+
+    def test_max_bytes_counts_overwrites_once(self, tmp_path):
+        key_size = len("GET:http://x/1") + len("{}")
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0, max_bytes=2 * (key_size + 100))
+        cache.set("GET:http://x/1", 200, {}, b"a" * 100)
+        cache.set("GET:http://x/2", 200, {}, b"b" * 100)
+        cache.set("GET:http://x/2", 200, {}, b"c" * 100)
+        assert cache.get("GET:http://x/1") is not None
+        assert cache.get("GET:http://x/2") == (200, {}, b"c" * 100)
+        cache.close()
+
+    def test_codec_compresses_stored_body(self, tmp_path):
+        body = b'{"tracklist": []}' * 100
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0, codec=ZlibCodec())
+        cache.set("GET:http://x/1", 200, {}, body)
+        assert cache._db is not None
+        codec, stored = cache._db.execute("SELECT codec, body FROM cache_entries").fetchone()
+        assert codec == "zlib"
+        assert zlib.decompress(stored) == body
+        assert cache.get("GET:http://x/1") == (200, {}, body)
+        cache.close()
+
+    def test_rows_from_another_codec_are_misses(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        cache.set("GET:http://x/1", 200, {}, b"plain")
+        cache.close()
+        cache2 = SQLiteCache(ttl=60, cache_dir=tmp_path, codec=ZlibCodec())
+        assert cache2.get("GET:http://x/1") is None
+        cache2.set("GET:http://x/1", 200, {}, b"packed")
+        assert cache2.get("GET:http://x/1") == (200, {}, b"packed")
+        cache2.close()
+
+    def test_stale_row_kept_for_revalidation(self, tmp_path):
+        cache = SQLiteCache(ttl=10, cache_dir=tmp_path, flush_interval=0, stale_ttl=30)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"data")
+        with patch("discogs_sdk._cache.time.time", return_value=1015.0):
+            assert cache.get("GET:http://x/1") is None
+            assert cache.get_stale("GET:http://x/1") == ((200, {}, b"data"), 5.0)
+            assert cache.purge_expired() == 0
+        with patch("discogs_sdk._cache.time.time", return_value=1040.0):
+            assert cache.get_stale("GET:http://x/1") is None
+        cache.close()
+
+    def test_refresh_restarts_ttl(self, tmp_path):
+        cache = SQLiteCache(ttl=10, cache_dir=tmp_path, stale_ttl=30, batch_size=1000, flush_interval=3600)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"buffered")
+            cache.set("GET:http://x/2", 200, {}, b"stored")
+        cache.flush()
+        with patch("discogs_sdk._cache.time.time", return_value=1015.0):
+            cache.set("GET:http://x/3", 200, {}, b"pending")
+            cache.refresh("GET:http://x/2")
+            cache.refresh("GET:http://x/3")
+        with patch("discogs_sdk._cache.time.time", return_value=1020.0):
+            assert cache.get("GET:http://x/1") is None
+            assert cache.get("GET:http://x/2") == (200, {}, b"stored")
+            assert cache.get("GET:http://x/3") == (200, {}, b"pending")
+        cache.close()
+
+    def test_delete_and_delete_prefix(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, batch_size=1000, flush_interval=3600)
+        cache.set("GET:http://x/wants?page=1", 200, {}, b"stored")
+        cache.set("GET:http://x/wants/1", 200, {}, b"stored")
+        cache.flush()
+        cache.set("GET:http://x/wants?page=2", 200, {}, b"buffered")
+        cache.set("GET:http://x/wantsx", 200, {}, b"buffered")
+        cache.delete_prefix("GET:http://x/wants?")
+        cache.delete("GET:http://x/wants/1")
+        cache.flush()
+        assert cache.get("GET:http://x/wants?page=1") is None
+        assert cache.get("GET:http://x/wants?page=2") is None
+        assert cache.get("GET:http://x/wants/1") is None
+        assert cache.get("GET:http://x/wantsx") == (200, {}, b"buffered")
+        cache.close()
+
+    def test_custom_backend_delete_falls_back_to_clear(self):
+        cleared: list[bool] = []
+
+        class MinimalCache(ResponseCache):
+            def get(self, key: str) -> CacheEntry | None:
+                return None
+
+            def set(self, key: str, status_code: int, headers: dict[str, str], body: bytes) -> None:
+                pass
+
+            def clear(self) -> None:
+                cleared.append(True)
+
+            def close(self) -> None:
+                pass
+
+        cache = MinimalCache(ttl=60)
+        cache.delete("GET:http://x/1")
+        cache.delete_prefix("GET:http://x/")
+        assert cleared == [True, True]
+
+
+class TestTieredCache:
+    def test_write_through_to_both_layers(self, tmp_path):
+        memory = MemoryCache(ttl=60)
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        cache = TieredCache(memory, persistent)
+        cache.set("GET:http://x/1", 200, {}, b"data")
+        assert memory.get("GET:http://x/1") == (200, {}, b"data")
+        assert persistent.get("GET:http://x/1") == (200, {}, b"data")
+        cache.close()
+
+    def test_memory_hit_skips_persistent_layer(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        cache = TieredCache(MemoryCache(ttl=60), persistent)
+        cache.set("GET:http://x/1", 200, {}, b"data")
+        with patch.object(persistent, "get_stale") as lookup:
+            assert cache.get("GET:http://x/1") == (200, {}, b"data")
+        lookup.assert_not_called()
+        cache.close()
+
+    def test_persistent_hit_promoted_with_remaining_ttl(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            persistent.set("GET:http://x/1", 200, {}, b"data")
+        memory = MemoryCache(ttl=3600)
+        cache = TieredCache(memory, persistent)
+        with (
+            patch("discogs_sdk._cache.time.time", return_value=1050.0),
+            patch("discogs_sdk._cache.time.monotonic", return_value=500.0),
+        ):
+            assert cache.get("GET:http://x/1") == (200, {}, b"data")
+        assert memory._store["GET:http://x/1"][0] == pytest.approx(510.0)
+        cache.close()
+
+    def test_survives_restart_through_persistent_layer(self, tmp_path):
+        cache = TieredCache(MemoryCache(ttl=60), SQLiteCache(ttl=60, cache_dir=tmp_path))
+        cache.set("GET:http://x/1", 200, {}, b"data")
+        cache.close()
+        reopened = TieredCache(MemoryCache(ttl=60), SQLiteCache(ttl=60, cache_dir=tmp_path))
+        assert reopened.get("GET:http://x/1") == (200, {}, b"data")
+        reopened.close()
+
+    def test_write_behind_defers_persistent_write(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        cache = TieredCache(MemoryCache(ttl=60), persistent, write_behind=True)
+        with cache._write_lock:  # hold the writer back
+            cache.set("GET:http://x/1", 200, {}, b"data")
+            assert cache.get("GET:http://x/1") == (200, {}, b"data")
+            assert persistent.get("GET:http://x/1") is None
+        cache.flush()
+        assert persistent.get("GET:http://x/1") == (200, {}, b"data")
+        cache.close()
+
+    def test_close_flushes_write_behind(self, tmp_path):
+        cache = TieredCache(MemoryCache(ttl=60), SQLiteCache(ttl=60, cache_dir=tmp_path), write_behind=True)
+        cache.set("GET:http://x/1", 200, {}, b"data")
+        cache.close()
+        reopened = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        assert reopened.get("GET:http://x/1") == (200, {}, b"data")
+        reopened.close()
+
+    def test_delete_prefix_drops_both_layers_and_pending_writes(self, tmp_path):
+        cache = TieredCache(MemoryCache(ttl=60), SQLiteCache(ttl=60, cache_dir=tmp_path), write_behind=True)
+        cache.set("GET:http://x/wants?page=1", 200, {}, b"a")
+        cache.flush()
+        with cache._write_lock:
+            cache.set("GET:http://x/wants?page=2", 200, {}, b"b")
+        cache.delete_prefix("GET:http://x/wants?")
+        cache.flush()
+        assert cache.get("GET:http://x/wants?page=1") is None
+        assert cache.get("GET:http://x/wants?page=2") is None
+        cache.close()
+
+    def test_get_many_mixes_layers(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        persistent.set("GET:http://x/2", 200, {}, b"b")
+        memory = MemoryCache(ttl=60)
+        cache = TieredCache(memory, persistent)
+        memory.set("GET:http://x/1", 200, {}, b"a")
+        assert cache.get_many(["GET:http://x/1", "GET:http://x/2", "GET:http://x/3"]) == [
+            (200, {}, b"a"),
+            (200, {}, b"b"),
+            None,
+        ]
+        assert memory.get("GET:http://x/2") == (200, {}, b"b")
+        cache.close()
+
+    def test_get_many_promotes_with_remaining_ttl(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            persistent.set("GET:http://x/1", 200, {}, b"data")
+        memory = MemoryCache(ttl=3600)
+        cache = TieredCache(memory, persistent)
+        with (
+            patch("discogs_sdk._cache.time.time", return_value=1050.0),
+            patch("discogs_sdk._cache.time.monotonic", return_value=500.0),
+        ):
+            assert cache.get_many(["GET:http://x/1"]) == [(200, {}, b"data")]
+        assert memory._store["GET:http://x/1"][0] == pytest.approx(510.0)
+        with (
+            patch("discogs_sdk._cache.time.time", return_value=1061.0),
+            patch("discogs_sdk._cache.time.monotonic", return_value=511.0),
+        ):
+            assert cache.get_many(["GET:http://x/1"]) == [None]
+        cache.close()
+
+
+class TestAsyncInterface:
+    async def test_memory_cache_runs_inline(self):
+        cache = MemoryCache(ttl=60)
+        await cache.aset("GET:http://x/1", 200, {}, b"data")
+        assert await cache.aget("GET:http://x/1") == (200, {}, b"data")
+        assert cache._io_executor is None
+
+    async def test_sqlite_cache_runs_off_the_event_loop(self, tmp_path):
+        cache = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        threads: list[str] = []
+        original = cache._lookup
+
+        def lookup(key):
+            threads.append(threading.current_thread().name)
+            return original(key)
+
+        with patch.object(cache, "_lookup", side_effect=lookup):
+            await cache.aset("GET:http://x/1", 200, {}, b"data")
+            assert await cache.aget("GET:http://x/1") == (200, {}, b"data")
+        assert threads[0].startswith("discogs-sdk-cache-io")
+        await cache.adelete("GET:http://x/1")
+        assert await cache.aget("GET:http://x/1") is None
+        cache.close()
+        assert cache._io_executor is None
+
+    async def test_tiered_cache_serves_memory_hits_inline(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path)
+        cache = TieredCache(MemoryCache(ttl=60), persistent)
+        await cache.aset("GET:http://x/1", 200, {}, b"data")
+        with patch.object(persistent, "aget_stale") as lookup:
+            assert await cache.aget("GET:http://x/1") == (200, {}, b"data")
+        lookup.assert_not_called()
+        await cache.adelete_prefix("GET:http://x/")
+        assert await cache.aget("GET:http://x/1") is None
+        cache.close()
+
+    async def test_tiered_cache_awaits_persistent_layer_on_miss(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        persistent.set("GET:http://x/1", 200, {}, b"data")
+        memory = MemoryCache(ttl=60)
+        cache = TieredCache(memory, persistent)
+        assert await cache.aget("GET:http://x/1") == (200, {}, b"data")
+        assert memory.get("GET:http://x/1") == (200, {}, b"data")
+        assert persistent._io_executor is not None
+        cache.close()
+
+    async def test_tiered_delete_waits_for_write_behind_flush(self, tmp_path):
+        persistent = SQLiteCache(ttl=60, cache_dir=tmp_path, flush_interval=0)
+        cache = TieredCache(MemoryCache(ttl=60), persistent, write_behind=True)
+        persist = persistent.set
+
+        def slow_set(*args):
+            time.sleep(0.2)
+            persist(*args)
+
+        with patch.object(persistent, "set", side_effect=slow_set):
+            cache.set("GET:http://x/1", 200, {}, b"old")
+            time.sleep(0.05)  # the writer has taken its batch and is inside the slow set
+            await cache.adelete("GET:http://x/1")
+            cache.flush()
+        assert persistent.get("GET:http://x/1") is None
+        assert cache.get("GET:http://x/1") is None
+        cache.close()
+
+
+class TestSnapshots:
+    def test_memory_roundtrip(self, tmp_path):
+        cache = MemoryCache(ttl=60)
+        cache.set("GET:http://x/1", 200, {"etag": '"v1"'}, b"one")
+        cache.set("GET:http://x/2", 404, {}, b"")
+        assert cache.export_snapshot(tmp_path / "cache.snap") == 2
+        restored = MemoryCache(ttl=60)
+        assert restored.import_snapshot(tmp_path / "cache.snap") == 2
+        assert restored.get("GET:http://x/1") == (200, {"etag": '"v1"'}, b"one")
+        assert restored.get("GET:http://x/2") == (404, {}, b"")
+
+    def test_sqlite_to_memory_keeps_expiry(self, tmp_path):
+        source = SQLiteCache(ttl=60, cache_dir=tmp_path / "db", codec=ZlibCodec())
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            source.set("GET:http://x/1", 200, {}, b"data" * 100)
+            source.export_snapshot(tmp_path / "cache.snap")
+        source.close()
+        target = MemoryCache(ttl=3600)
+        with (
+            patch("discogs_sdk._cache.time.time", return_value=1030.0),
+            patch("discogs_sdk._cache.time.monotonic", return_value=500.0),
+        ):
+            target.import_snapshot(tmp_path / "cache.snap")
+            assert target.get("GET:http://x/1") == (200, {}, b"data" * 100)
+        assert target._store["GET:http://x/1"][0] == pytest.approx(530.0)
+
+    def test_sqlite_import_is_one_transaction(self, tmp_path):
+        source = MemoryCache(ttl=60)
+        for i in range(250):
+            source.set(f"GET:http://x/{i}", 200, {}, b"data")
+        source.export_snapshot(tmp_path / "cache.snap")
+        target = SQLiteCache(ttl=60, cache_dir=tmp_path / "db", batch_size=10)
+        with patch.object(target, "_db", wraps=target._db) as db:
+            assert target.import_snapshot(tmp_path / "cache.snap") == 250
+        assert db.executemany.call_count == 1
+        assert db.commit.call_count == 1
+        assert target.get("GET:http://x/249") == (200, {}, b"data")
+        target.close()
+
+    def test_expired_entries_skipped(self, tmp_path):
+        cache = MemoryCache(ttl=60, stale_ttl=30)
+        with patch("discogs_sdk._cache.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"data")
+            cache.export_snapshot(tmp_path / "cache.snap")
+        with patch("discogs_sdk._cache.time.time", return_value=1080.0):
+            assert MemoryCache(ttl=60, stale_ttl=30).import_snapshot(tmp_path / "cache.snap") == 1
+        with patch("discogs_sdk._cache.time.time", return_value=1100.0):
+            assert MemoryCache(ttl=60, stale_ttl=30).import_snapshot(tmp_path / "cache.snap") == 0
+
+    def test_ttl_policy_none_skipped(self, tmp_path):
+        source = MemoryCache(ttl=60)
+        source.set("GET:http://x/marketplace/stats/1", 200, {}, b"a")
+        source.set("GET:http://x/releases/1", 200, {}, b"b")
+        source.export_snapshot(tmp_path / "cache.snap")
+        target = MemoryCache(ttl=TTLPolicy({"/marketplace/*": None}, default=60))
+        assert target.import_snapshot(tmp_path / "cache.snap") == 1
+        assert target.get("GET:http://x/marketplace/stats/1") is None
+
+    def test_tiered_import_replaces_memory_entries(self, tmp_path):
+        source = MemoryCache(ttl=60)
+        source.set("GET:http://x/1", 200, {}, b"new")
+        source.export_snapshot(tmp_path / "cache.snap")
+        memory = MemoryCache(ttl=60)
+        cache = TieredCache(memory, SQLiteCache(ttl=60, cache_dir=tmp_path / "db"))
+        cache.set("GET:http://x/1", 200, {}, b"old")
+        cache.import_snapshot(tmp_path / "cache.snap")
+        assert cache.get("GET:http://x/1") == (200, {}, b"new")
+        cache.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "cache.snap"
+        with gzip.open(path, "wb") as f:
+            f.write(b"not a snapshot")
+        with pytest.raises(ValueError, match="Not a cache snapshot"):
+            MemoryCache(ttl=60).import_snapshot(path)
+
+    def test_backend_without_snapshot_support(self, tmp_path):
+        class NullCache(ResponseCache):
+            def get(self, key):
+                return None
+
+            def set(self, key, status_code, headers, body):
+                pass
+
+            def clear(self):
+                pass
+
+            def close(self):
+                pass
+
+        with pytest.raises(NotImplementedError, match="NullCache"):
+            NullCache(ttl=60).export_snapshot(tmp_path / "cache.snap")
+        assert not (tmp_path / "cache.snap").exists()
+
+
+class TestModelCache:
+    def test_hit_returns_equal_copy(self):
+        cache = ModelCache()
+        release = Release(id=1, title="A")
+        cache.set("GET:http://x/releases/1", Release, b"body", release)
+        hit = cache.get("GET:http://x/releases/1", Release, b"body")
+        assert hit == release
+        assert hit is not release
+        assert cache.hits == 1
+
+    def test_different_body_is_a_miss(self):
+        cache = ModelCache()
+        cache.set("GET:http://x/releases/1", Release, b"old", Release(id=1, title="A"))
+        assert cache.get("GET:http://x/releases/1", Release, b"new") is None
+        assert cache.misses == 1
+
+    def test_keyed_by_model_class(self):
+        cache = ModelCache()
+        cache.set("GET:http://x/1", Release, b"body", Release(id=1, title="A"))
+        assert cache.get("GET:http://x/1", Artist, b"body") is None
+
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = ModelCache(max_entries=2)
+        for i in range(1, 4):
+            cache.set(f"GET:http://x/{i}", Release, b"body", Release(id=i, title="A"))
+        assert len(cache) == 2
+        assert cache.get("GET:http://x/1", Release, b"body") is None
+        assert cache.get("GET:http://x/3", Release, b"body") is not None
+
+    def test_clear(self):
+        cache = ModelCache()
+        cache.set("GET:http://x/1", Release, b"body", Release(id=1, title="A"))
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,80 @@
+"""Unit tests for the incremental export CSV parser."""
+
+from __future__ import annotations
+
+import pytest
+
+from discogs_sdk._export_csv import ExportCSVParser
+
+EXPORT = (
+    "\ufefflisting_id,artist,catno,release_id,price,media_condition,sleeve_condition,accept_offer,comments\r\n"
+    '1,Nine Inch Nails,INT-92346,352665,24.99,Near Mint (NM or M-),Generic,Y,"two\r\nlines, ""quoted"" é"\r\n'
+    "2,Björk,,,,,,N,\r\n"
+).encode()
+
+
+def parse(data: bytes, chunk_size: int) -> tuple[ExportCSVParser, list[list[str]]]:
+    parser = ExportCSVParser()
+    rows = []
+    for start in range(0, len(data), chunk_size):
+        rows += parser.feed(data[start : start + chunk_size])
+    rows += parser.close()
+    return parser, rows
+
+
+class TestExportCSVParser:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, len(EXPORT)])
+    def test_any_chunking_gives_same_rows(self, chunk_size):
+        parser, rows = parse(EXPORT, chunk_size)
+        assert parser.header is not None
+        assert parser.header[:2] == ["listing_id", "artist"]
+        assert rows == [
+            [
+                "1",
+                "Nine Inch Nails",
+                "INT-92346",
+                "352665",
+                "24.99",
+                "Near Mint (NM or M-)",
+                "Generic",
+                "Y",
+                'two\r\nlines, "quoted" é',
+            ],
+            ["2", "Björk", "", "", "", "", "", "N", ""],
+        ]
+
+    def test_last_row_without_line_end(self):
+        _, rows = parse(b"listing_id,price\n1,9.99\n2,1.50", 4)
+        assert rows == [["1", "9.99"], ["2", "1.50"]]
+
+    def test_listing_is_typed(self):
+        parser, rows = parse(EXPORT, 7)
+        listing = parser.listing(rows[0])
+        assert listing.listing_id == 1
+        assert listing.release_id == 352665
+        assert listing.price == 24.99
+        assert listing.condition == "Near Mint (NM or M-)"
+        assert listing.sleeve_condition == "Generic"
+        assert listing.catalog_number == "INT-92346"
+        assert listing.accept_offer is True
+        empty = parser.listing(rows[1])
+        assert (empty.price, empty.condition, empty.accept_offer) == (None, None, False)
+
+    def test_columns(self):
+        parser, rows = parse(EXPORT, 7)
+        columns = parser.columns(rows)
+        assert columns["listing_id"] == [1, 2]
+        assert columns["release_id"] == [352665, None]
+        assert columns["price"] == [24.99, None]
+        assert columns["condition"] == ["Near Mint (NM or M-)", None]
+        assert columns["catalog_number"] == ["INT-92346", None]
+        assert columns["accept_offer"] == [True, False]
+
+    def test_short_rows_are_padded(self):
+        parser, rows = parse(b"listing_id,price,comments\n1,2.00\n", 64)
+        assert parser.columns(rows) == {"listing_id": [1], "price": [2.0], "comments": [None]}
+
+    def test_empty_export(self):
+        parser, rows = parse(b"", 64)
+        assert parser.header is None
+        assert rows == []
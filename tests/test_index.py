@@ -0,0 +1,34 @@
+"""Unit tests for the local delta-sync index."""
+
+from __future__ import annotations
+
+from discogs_sdk._index import IndexEntry, LocalIndex
+
+
+class TestLocalIndex:
+    def test_apply_and_load(self):
+        index = LocalIndex(":memory:")
+        index.apply("wantlist:a", {1: IndexEntry("2024-01-01", 5, '"note"'), 2: IndexEntry(None, None, None)}, [])
+        index.apply("wantlist:a", {1: IndexEntry("2024-01-01", 3, None)}, [2])
+        assert index.load("wantlist:a") == {1: IndexEntry("2024-01-01", 3, None)}
+        assert index.load("wantlist:b") == {}
+        index.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        index = LocalIndex(tmp_path / "index.db")
+        index.apply("collection:a:0", {7: IndexEntry("2024-01-01", None, None)}, [])
+        index.close()
+        reopened = LocalIndex(tmp_path / "index.db")
+        assert list(reopened.load("collection:a:0")) == [7]
+        reopened.close()
+
+    def test_clear_scope(self):
+        index = LocalIndex(":memory:")
+        index.apply("wantlist:a", {1: IndexEntry(None, None, None)}, [])
+        index.apply("wantlist:b", {1: IndexEntry(None, None, None)}, [])
+        index.clear("wantlist:a")
+        assert index.load("wantlist:a") == {}
+        assert list(index.load("wantlist:b")) == [1]
+        index.clear()
+        assert index.load("wantlist:b") == {}
+        index.close()
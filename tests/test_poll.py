@@ -0,0 +1,47 @@
+"""Unit tests for the job polling schedule."""
+
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+
+from discogs_sdk._poll import PollPolicy, is_failed, is_finished
+from discogs_sdk.models import Export, Upload
+
+
+class TestPollPolicy:
+    def test_delays_back_off_to_maximum(self):
+        policy = PollPolicy(initial=1, maximum=5, factor=2, jitter=0)
+        assert list(islice(policy.delays(), 5)) == [1, 2, 4, 5, 5]
+
+    def test_jitter_stays_within_bounds(self):
+        policy = PollPolicy(initial=10, maximum=10, jitter=0.2)
+        assert all(8 <= delay <= 12 for delay in islice(policy.delays(), 100))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"initial": 0}, {"initial": 10, "maximum": 5}, {"factor": 0.5}, {"jitter": 1}],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            PollPolicy(**kwargs)
+
+
+class TestIsFinished:
+    @pytest.mark.parametrize("status", [None, "pending", "Queued", "processing", "in progress"])
+    def test_pending(self, status):
+        assert not is_finished(Upload(id=1, status=status))
+
+    @pytest.mark.parametrize("status", ["success", "failure", "Finished"])
+    def test_final_status(self, status):
+        assert is_finished(Export(id=1, status=status))
+
+    def test_finished_timestamp_wins(self):
+        assert is_finished(Upload.model_validate({"id": 1, "status": "processing", "finished_ts": "2024-01-01"}))
+
+    @pytest.mark.parametrize(
+        ("status", "failed"), [("success", False), ("Failed", True), ("error", True), (None, False)]
+    )
+    def test_is_failed(self, status, failed):
+        assert is_failed(Export(id=1, status=status)) is failed
@@ -0,0 +1,117 @@
+"""Unit tests for the client-side RateLimiter."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from discogs_sdk._rate_limit import RateLimiter
+
+
+def _headers(limit: int = 60, used: int = 0, remaining: int | None = None) -> dict[str, str]:
+    return {
+        "X-Discogs-Ratelimit": str(limit),
+        "X-Discogs-Ratelimit-Used": str(used),
+        "X-Discogs-Ratelimit-Remaining": str(limit - used if remaining is None else remaining),
+    }
+
+
+class TestRateLimiter:
+    def test_no_pacing_before_headers(self):
+        limiter = RateLimiter()
+        assert limiter.limit is None
+        assert limiter.remaining is None
+        assert all(limiter.acquire() == 0.0 for _ in range(100))
+
+    def test_update_sets_limit_and_remaining(self):
+        limiter = RateLimiter()
+        limiter.update(_headers(limit=60, used=10))
+        assert limiter.limit == 60
+        assert limiter.remaining == pytest.approx(50, abs=0.1)
+
+    def test_remaining_derived_from_used(self):
+        limiter = RateLimiter()
+        limiter.update({"X-Discogs-Ratelimit": "60", "X-Discogs-Ratelimit-Used": "45"})
+        assert limiter.remaining == pytest.approx(15, abs=0.1)
+
+    def test_headers_missing_is_noop(self):
+        limiter = RateLimiter()
+        limiter.update({"content-type": "application/json"})
+        assert limiter.limit is None
+
+    def test_malformed_headers_ignored(self):
+        limiter = RateLimiter()
+        limiter.update({"X-Discogs-Ratelimit": "lots", "X-Discogs-Ratelimit-Remaining": "?"})
+        assert limiter.limit is None
+
+    def test_acquire_free_while_tokens_left(self):
+        limiter = RateLimiter()
+        limiter.update(_headers(limit=60, used=58))
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 0.0
+
+    def test_acquire_waits_when_exhausted(self):
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(window=60.0)
+            limiter.update(_headers(limit=60, used=60))
+            # One token refills every second at 60 requests / 60 seconds.
+            assert limiter.acquire() == pytest.approx(1.0)
+            assert limiter.acquire() == pytest.approx(2.0)
+
+    def test_tokens_refill_over_time(self):
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(window=60.0)
+            limiter.update(_headers(limit=60, used=60))
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=110.0):
+            assert limiter.remaining == pytest.approx(10.0)
+            assert limiter.acquire() == 0.0
+
+    def test_refill_capped_at_limit(self):
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(window=60.0)
+            limiter.update(_headers(limit=60, used=0))
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=1000.0):
+            assert limiter.remaining == pytest.approx(60.0)
+
+    def test_server_count_lowers_local_estimate(self):
+        """Requests made elsewhere with the same credentials drain the bucket too."""
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter()
+            limiter.update(_headers(limit=60, used=0))
+            limiter.update(_headers(limit=60, used=55))
+            assert limiter.remaining == pytest.approx(5.0)
+
+    def test_stale_server_count_does_not_raise_local_estimate(self):
+        """In-flight reservations are not yet counted by the server."""
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter()
+            limiter.update(_headers(limit=60, used=50))
+            for _ in range(5):
+                limiter.acquire()
+            limiter.update(_headers(limit=60, used=51))
+            assert limiter.remaining == pytest.approx(5.0)
+
+    def test_thread_safe_reservations(self):
+        with patch("discogs_sdk._rate_limit.time.monotonic", return_value=100.0):
+            limiter = RateLimiter(window=60.0)
+            limiter.update(_headers(limit=60, used=0))
+            waits: list[float] = []
+            lock = threading.Lock()
+
+            def worker() -> None:
+                for _ in range(20):
+                    wait = limiter.acquire()
+                    with lock:
+                        waits.append(wait)
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        # 60 free slots, then 20 queued at one-second intervals with no duplicates.
+        assert sorted(waits)[:60] == [0.0] * 60
+        assert sorted(waits)[60:] == pytest.approx([float(i) for i in range(1, 21)])
@@ -0,0 +1,197 @@
+"""Unit tests for RedisCache against the in-process FakeRedisServer."""
+
+from __future__ import annotations
+
+import socket
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+import respx
+
+from discogs_sdk import Discogs
+from discogs_sdk._cache import TTLPolicy, ZlibCodec
+from discogs_sdk._redis import RedisCache
+from tests.conftest import BASE_URL
+from tests.fake_redis import FakeRedisServer
+
+
+@pytest.fixture
+def server() -> Iterator[FakeRedisServer]:
+    with FakeRedisServer() as fake:
+        yield fake
+
+
+class TestRedisCache:
+    def test_set_get_roundtrip(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        cache.set("GET:http://x/1", 200, {"content-type": "application/json"}, b'{"id": 1}')
+        assert cache.get("GET:http://x/1") == (200, {"content-type": "application/json"}, b'{"id": 1}')
+        cache.close()
+
+    def test_miss_returns_none(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        assert cache.get("GET:http://x/missing") is None
+        cache.close()
+
+    def test_ttl_handled_by_server(self, server):
+        cache = RedisCache(ttl=60, url=server.url, stale_ttl=30)
+        cache.set("GET:http://x/1", 200, {}, b"data")
+        (pttl,) = cache._execute(("PTTL", "discogs-sdk:GET:http://x/1"))
+        assert 89_000 < pttl <= 90_000
+        cache.close()
+
+    def test_expired_entry_served_only_as_stale(self, server):
+        cache = RedisCache(ttl=10, url=server.url, stale_ttl=30)
+        with patch("discogs_sdk._redis.time.time", return_value=1000.0):
+            cache.set("GET:http://x/1", 200, {}, b"data")
+        with patch("discogs_sdk._redis.time.time", return_value=1015.0):
+            assert cache.get("GET:http://x/1") is None
+            assert cache.get_stale("GET:http://x/1") == ((200, {}, b"data"), 5.0)
+            cache.refresh("GET:http://x/1")
+            assert cache.get("GET:http://x/1") == (200, {}, b"data")
+        cache.close()
+
+    def test_get_many_uses_one_mget(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.set("GET:http://x/3", 200, {}, b"c")
+        server.commands.clear()
+        results = cache.get_many(["GET:http://x/1", "GET:http://x/2", "GET:http://x/3"])
+        assert results == [(200, {}, b"a"), None, (200, {}, b"c")]
+        assert [command[0] for command in server.commands] == [b"MGET"]
+        cache.close()
+
+    def test_delete_prefix_escapes_glob_characters(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        cache.set("GET:http://x/wants?page=1", 200, {}, b"a")
+        cache.set("GET:http://x/wants?page=2", 200, {}, b"b")
+        cache.set("GET:http://x/wantsXpage=3", 200, {}, b"c")
+        cache.delete_prefix("GET:http://x/wants?")
+        assert cache.get("GET:http://x/wants?page=1") is None
+        assert cache.get("GET:http://x/wants?page=2") is None
+        assert cache.get("GET:http://x/wantsXpage=3") == (200, {}, b"c")
+        cache.close()
+
+    def test_delete(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        cache.delete("GET:http://x/1")
+        assert cache.get("GET:http://x/1") is None
+        cache.close()
+
+    def test_clear_only_touches_namespace(self, server):
+        cache = RedisCache(ttl=60, url=server.url, namespace="app-a:")
+        other = RedisCache(ttl=60, url=server.url, namespace="app-b:")
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        other.set("GET:http://x/1", 200, {}, b"b")
+        cache.clear()
+        assert cache.get("GET:http://x/1") is None
+        assert other.get("GET:http://x/1") == (200, {}, b"b")
+        cache.close()
+        other.close()
+
+    def test_ttl_policy_none_skips_write(self, server):
+        cache = RedisCache(ttl=TTLPolicy({"/marketplace/*": None}, default=60), url=server.url)
+        cache.set("GET:http://x/marketplace/stats/1", 200, {}, b"a")
+        assert cache._execute(("DBSIZE",)) == [0]
+        cache.close()
+
+    def test_codec_compresses_stored_body(self, server):
+        body = b'{"tracklist": []}' * 100
+        cache = RedisCache(ttl=60, url=server.url, codec=ZlibCodec())
+        cache.set("GET:http://x/1", 200, {}, body)
+        (stored,) = cache._execute(("GET", "discogs-sdk:GET:http://x/1"))
+        assert len(stored) < len(body) / 5
+        assert cache.get("GET:http://x/1") == (200, {}, body)
+        plain = RedisCache(ttl=60, url=server.url)
+        assert plain.get("GET:http://x/1") is None
+        cache.close()
+        plain.close()
+
+    def test_connections_are_reused(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        with patch("discogs_sdk._redis.socket.create_connection", wraps=socket.create_connection) as connect:
+            for i in range(5):
+                cache.set(f"GET:http://x/{i}", 200, {}, b"a")
+                cache.get(f"GET:http://x/{i}")
+        assert connect.call_count == 1
+        cache.close()
+
+    def test_unreachable_server_is_a_miss(self):
+        with FakeRedisServer() as fake:
+            url = fake.url
+        cache = RedisCache(ttl=60, url=url, timeout=0.5)
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        assert cache.get("GET:http://x/1") is None
+        cache.delete_prefix("GET:")
+        cache.close()
+
+    def test_unreachable_server_not_retried_during_cooldown(self):
+        with FakeRedisServer() as fake:
+            url = fake.url
+        cache = RedisCache(ttl=60, url=url, timeout=0.5, retry_after=60)
+        with patch("discogs_sdk._redis.socket.create_connection", wraps=socket.create_connection) as connect:
+            for _ in range(3):
+                assert cache.get("GET:http://x/1") is None
+                cache.set("GET:http://x/1", 200, {}, b"a")
+        assert connect.call_count == 1
+        cache.close()
+
+    def test_reconnects_after_cooldown(self, server):
+        cache = RedisCache(ttl=60, url=server.url, retry_after=0)
+        cache._down_until = float("inf")
+        assert cache.get("GET:http://x/1") is None
+        cache._down_until = 0.0
+        cache.set("GET:http://x/1", 200, {}, b"a")
+        assert cache.get("GET:http://x/1") == (200, {}, b"a")
+        cache.close()
+
+    def test_corrupt_entry_is_a_miss(self, server):
+        cache = RedisCache(ttl=60, url=server.url)
+        cache._execute(("SET", "discogs-sdk:GET:http://x/1", b"not json\nbody"))
+        cache._execute(("SET", "discogs-sdk:GET:http://x/2", b"\xff\xfe\nbody"))
+        cache._execute(("SET", "discogs-sdk:GET:http://x/3", b'{"s": 200}\nbody'))
+        assert cache.get_many(["GET:http://x/1", "GET:http://x/2", "GET:http://x/3"]) == [None, None, None]
+        cache.close()
+
+    def test_url_parsing(self):
+        cache = RedisCache(ttl=60, url="redis://:s%40cret@cache.internal:6380/3")
+        assert (cache._host, cache._port, cache._password, cache._db) == ("cache.internal", 6380, "s@cret", 3)
+        with pytest.raises(ValueError, match="scheme"):
+            RedisCache(ttl=60, url="http://cache.internal")
+
+    def test_auth_and_select_sent_on_connect(self, server):
+        cache = RedisCache(ttl=60, url=server.url.replace("redis://", "redis://:pw@").replace("/0", "/2"))
+        cache.get("GET:http://x/1")
+        assert server.commands[:2] == [[b"AUTH", b"pw"], [b"SELECT", b"2"]]
+        cache.close()
+
+    def test_snapshot_roundtrip(self, server, tmp_path):
+        cache = RedisCache(ttl=60, url=server.url, namespace="app-a:")
+        cache.set("GET:http://x/1", 200, {"etag": '"v1"'}, b"one")
+        cache.set("GET:http://x/2", 200, {}, b"two")
+        RedisCache(ttl=60, url=server.url, namespace="app-b:").set("GET:http://x/3", 200, {}, b"other")
+        assert cache.export_snapshot(tmp_path / "cache.snap") == 2
+        target = RedisCache(ttl=60, url=server.url, namespace="app-c:")
+        server.commands.clear()
+        assert target.import_snapshot(tmp_path / "cache.snap") == 2
+        assert [command[0] for command in server.commands] == [b"SET", b"SET"]
+        assert target.get("GET:http://x/1") == (200, {"etag": '"v1"'}, b"one")
+        (pttl,) = target._execute(("PTTL", "app-c:GET:http://x/1"))
+        assert 59_000 < pttl <= 60_000
+        cache.close()
+        target.close()
+
+    def test_shared_between_clients(self, server):
+        with respx.mock(base_url=BASE_URL) as router:
+            route = router.get("/releases/1").mock(return_value=httpx.Response(200, json={"id": 1}))
+            worker_a = Discogs(token="t", cache=RedisCache(ttl=60, url=server.url))
+            worker_b = Discogs(token="t", cache=RedisCache(ttl=60, url=server.url))
+            worker_a._send("GET", f"{BASE_URL}/releases/1")
+            response = worker_b._send("GET", f"{BASE_URL}/releases/1")
+            assert response.json() == {"id": 1}
+            assert route.call_count == 1
+            worker_a.close()
+            worker_b.close()